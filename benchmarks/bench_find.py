@@ -0,0 +1,93 @@
+#------------------------------------------------------------------------------
+# Copyright (c) 2013, Nucleic Development Team.
+#
+# Distributed under the terms of the Modified BSD License.
+#
+# The full license is in the file COPYING.txt, distributed with this software.
+#------------------------------------------------------------------------------
+""" Benchmark Object.find and find_all with and without a name index.
+
+The lookups are run against balanced trees of plain Objects in which
+one object in ten has a name. The cost of building each tree with and
+without an enabled name index is reported as well.
+
+"""
+import timeit
+
+from enaml.core.object import Object
+
+
+SIZES = (1000, 10000, 50000)
+
+
+FANOUT = 10
+
+
+LOOKUPS = 100
+
+
+REPEAT = 3
+
+
+def build_tree(size, indexed):
+    """ Build a balanced tree with the given number of objects.
+
+    """
+    root = Object()
+    if indexed:
+        root.enable_name_index()
+    parents = [root]
+    count = 1
+    index = 0
+    while count < size:
+        parent = parents[index // FANOUT]
+        obj = Object()
+        if count % 10 == 0:
+            obj.name = u'object_%d' % count
+        obj.set_parent(parent)
+        parents.append(obj)
+        count += 1
+        index += 1
+    return root
+
+
+def bench(func):
+    return min(timeit.repeat(func, number=1, repeat=REPEAT))
+
+
+def main():
+    header = ('objects', 'case', 'traverse', 'indexed', 'speedup')
+    print '%8s %-12s %10s %10s %8s' % header
+    for size in SIZES:
+        plain = build_tree(size, False)
+        indexed = build_tree(size, True)
+        names = [u'object_%d' % (size - 10 * i) for i in xrange(1, LOOKUPS)]
+        names = [n for n in names if n != u'object_%d' % size]
+
+        def find(root):
+            for name in names:
+                root.find(name)
+
+        def find_all_regex(root):
+            for i in xrange(10):
+                root.find_all(u'object_%d\d*5$' % i, regex=True)
+
+        cases = (
+            ('build', lambda: build_tree(size, False),
+             lambda: build_tree(size, True)),
+            ('find x%d' % len(names), lambda: find(plain),
+             lambda: find(indexed)),
+            ('regex x10', lambda: find_all_regex(plain),
+             lambda: find_all_regex(indexed)),
+        )
+        for name, plain_func, indexed_func in cases:
+            base = bench(plain_func)
+            fast = bench(indexed_func)
+            args = (size, name, base * 1e3, fast * 1e3, base / fast)
+            print '%8d %-12s %10.2f %10.2f %7.1fx' % args
+        indexed.disable_name_index()
+    print '(times in ms)'
+
+
+if __name__ == '__main__':
+    main()
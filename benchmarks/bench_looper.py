@@ -0,0 +1,95 @@
+#------------------------------------------------------------------------------
+# Copyright (c) 2013, Nucleic Development Team.
+#
+# Distributed under the terms of the Modified BSD License.
+#
+# The full license is in the file COPYING.txt, distributed with this software.
+#------------------------------------------------------------------------------
+""" Benchmark the refresh of a Looper over lists of varying size.
+
+Each operation is applied to a fresh copy of the looped list and the
+time to refresh the looper items is reported. This benchmark does not
+require a toolkit; the looped items are plain Declarative objects.
+
+"""
+import timeit
+
+from enaml.core.enaml_compiler import EnamlCompiler
+from enaml.core.parser import parse
+
+
+SOURCE = """\
+from enaml.core.api import Declarative, Looper
+
+enamldef Item(Declarative):
+    attr value
+
+enamldef Main(Declarative):
+    attr values
+    Looper:
+        iterable << values
+        Item:
+            value = loop_item
+"""
+
+
+SIZES = (10, 100, 1000, 10000)
+
+
+OPERATIONS = [
+    ('append', lambda items: items + [-1]),
+    ('remove', lambda items: items[1:]),
+    ('insert', lambda items: items[:len(items) // 2] + [-1] +
+                             items[len(items) // 2:]),
+    ('reverse', lambda items: items[::-1]),
+    ('replace', lambda items: [-i - 1 for i in items]),
+]
+
+
+REPEAT = 3
+
+
+def compile_main():
+    """ Compile the benchmark source and return the Main class.
+
+    """
+    code = EnamlCompiler.compile(parse(SOURCE), '<bench>')
+    namespace = {}
+    exec code in namespace
+    return namespace['Main']
+
+
+def bench_operation(Main, size, operation):
+    """ Time the refresh of a looper for a single operation.
+
+    """
+    def setup():
+        main = Main(values=range(size))
+        main.initialize()
+        return main
+
+    best = None
+    for i in xrange(REPEAT):
+        main = setup()
+        values = operation(main.values)
+        start = timeit.default_timer()
+        main.values = values
+        elapsed = timeit.default_timer() - start
+        main.destroy()
+        if best is None or elapsed < best:
+            best = elapsed
+    return best
+
+
+def main():
+    Main = compile_main()
+    names = [name for name, _ in OPERATIONS]
+    print ('%8s' + ' %10s' * len(names)) % (('items',) + tuple(names))
+    for size in SIZES:
+        times = [bench_operation(Main, size, op) * 1e3 for _, op in OPERATIONS]
+        print ('%8d' + ' %10.2f' * len(times)) % ((size,) + tuple(times))
+    print '(times in ms)'
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,85 @@
+#------------------------------------------------------------------------------
+# Copyright (c) 2013, Nucleic Development Team.
+#
+# Distributed under the terms of the Modified BSD License.
+#
+# The full license is in the file COPYING.txt, distributed with this software.
+#------------------------------------------------------------------------------
+""" Benchmark the parsing of the .enaml files in the examples tree.
+
+The files are parsed cold with the plain parser, through a ParseService
+with a cold cache, with a warm in-memory cache, and with a warm disk
+cache, and cold in a pool of worker processes.
+
+"""
+import multiprocessing
+import os
+import shutil
+import tempfile
+import timeit
+
+from enaml.core.parser import parse
+from enaml.core.parse_service import ParseService
+
+
+EXAMPLES = os.path.join(os.path.dirname(__file__), os.pardir, 'examples')
+
+
+def find_files(root):
+    """ Get the paths to the .enaml files under a directory.
+
+    """
+    paths = []
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames.sort()
+        for fn in sorted(filenames):
+            if fn.endswith('.enaml'):
+                paths.append(os.path.join(dirpath, fn))
+    return paths
+
+
+def plain_parse(paths):
+    """ Parse the files with the plain parser.
+
+    """
+    asts = []
+    for path in paths:
+        with open(path, 'rU') as f:
+            asts.append(parse(f.read(), path))
+    return asts
+
+
+def main():
+    paths = find_files(os.path.abspath(EXAMPLES))
+    jobs = multiprocessing.cpu_count()
+    cache_dir = tempfile.mkdtemp(prefix='enaml-bench-')
+    try:
+        cases = []
+        cases.append(('plain parser', lambda: plain_parse(paths)))
+        cases.append((
+            'service, cold',
+            lambda: ParseService().parse_files(paths)
+        ))
+        warm = ParseService()
+        warm.parse_files(paths)
+        cases.append(('service, warm memory', lambda: warm.parse_files(paths)))
+        ParseService(cache_dir).parse_files(paths)
+        cases.append((
+            'service, warm disk',
+            lambda: ParseService(cache_dir).parse_files(paths)
+        ))
+        cases.append((
+            'service, cold, %d jobs' % jobs,
+            lambda: ParseService().parse_files(paths, jobs=jobs)
+        ))
+        print '%d files' % len(paths)
+        print '%-28s %10s' % ('case', 'time (ms)')
+        for name, func in cases:
+            elapsed = min(timeit.repeat(func, number=1, repeat=3))
+            print '%-28s %10.1f' % (name, elapsed * 1000.0)
+    finally:
+        shutil.rmtree(cache_dir)
+
+
+if __name__ == '__main__':
+    main()
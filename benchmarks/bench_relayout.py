@@ -0,0 +1,87 @@
+#------------------------------------------------------------------------------
+# Copyright (c) 2013, Nucleic Development Team.
+#
+# Distributed under the terms of the Modified BSD License.
+#
+# The full license is in the file COPYING.txt, distributed with this software.
+#------------------------------------------------------------------------------
+""" Benchmark the incremental relayout of a QtContainer.
+
+The benchmark compares the cost of a full rebuild of the constraints
+layout against the incremental relayout, for a varying number of
+widgets in the layout and a varying number of changed widgets. The
+cost of the incremental relayout should grow with the size of the
+change, not with the size of the tree.
+
+"""
+import timeit
+
+from enaml.qt.qt_application import QtApplication
+from enaml.widgets.api import Window, Container, Field
+
+
+TREE_SIZES = (50, 100, 200, 400)
+
+CHANGE_SIZES = (1, 10, 50)
+
+REPEAT = 5
+
+
+def build_window(size):
+    """ Build and show a window with 'size' fields in one layout.
+
+    """
+    window = Window()
+    container = Container(parent=window)
+    fields = [Field(parent=container) for i in xrange(size)]
+    window.show()
+    return window, container, fields
+
+
+def bench_full(container):
+    """ Time a full rebuild of the layout of the container.
+
+    """
+    proxy = container.proxy
+
+    def run():
+        proxy.init_cns_layout()
+        proxy._refresh()
+
+    return min(timeit.repeat(run, number=1, repeat=REPEAT))
+
+
+def bench_incremental(container, fields, changes):
+    """ Time an incremental relayout after changing some fields.
+
+    """
+    proxy = container.proxy
+    changed = [field.proxy for field in fields[:changes]]
+
+    def run():
+        for item in changed:
+            item.layout_dirty = True
+        proxy.relayout()
+
+    return min(timeit.repeat(run, number=1, repeat=REPEAT))
+
+
+def main():
+    app = QtApplication()
+    print '%8s %8s %12s %12s' % ('widgets', 'changed', 'full (ms)', 'incr (ms)')
+    for size in TREE_SIZES:
+        window, container, fields = build_window(size)
+        full = bench_full(container)
+        for changes in CHANGE_SIZES:
+            if changes > size:
+                continue
+            incr = bench_incremental(container, fields, changes)
+            args = (size, changes, full * 1e3, incr * 1e3)
+            print '%8d %8d %12.2f %12.2f' % args
+        window.close()
+        window.destroy()
+    app.stop()
+
+
+if __name__ == '__main__':
+    main()
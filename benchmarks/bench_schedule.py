@@ -0,0 +1,95 @@
+#------------------------------------------------------------------------------
+# Copyright (c) 2013, Nucleic Development Team.
+#
+# Distributed under the terms of the Modified BSD License.
+#
+# The full license is in the file COPYING.txt, distributed with this software.
+#------------------------------------------------------------------------------
+""" Benchmark the draining of tasks scheduled on the Application.
+
+A minimal application with a pure Python event queue stands in for the
+toolkit event loop, so this benchmark does not require a toolkit. The
+number of event loop cycles and the time needed to run the tasks are
+reported with and without a schedule time slice.
+
+"""
+from collections import deque
+import timeit
+
+from atom.api import Typed
+
+from enaml.application import Application
+
+
+class QueueApplication(Application):
+    """ An application which runs deferred calls from a simple queue.
+
+    """
+    queue = Typed(deque, ())
+
+    def stop(self):
+        pass
+
+    def deferred_call(self, callback, *args, **kwargs):
+        self.queue.append((callback, args, kwargs))
+
+    def is_main_thread(self):
+        # Behave as if the tasks were scheduled from a worker thread.
+        return False
+
+    def run(self):
+        """ Run the event loop until the queue is empty.
+
+        Returns
+        -------
+        result : int
+            The number of event loop cycles which were run.
+
+        """
+        queue = self.queue
+        cycles = 0
+        while queue:
+            callback, args, kwargs = queue.popleft()
+            callback(*args, **kwargs)
+            cycles += 1
+        return cycles
+
+
+COUNTS = (100, 1000, 10000)
+
+
+SLICES = (0.0, 0.008)
+
+
+def bench(count, time_slice):
+    app = QueueApplication()
+    try:
+        app.schedule_time_slice = time_slice
+        values = []
+        start = timeit.default_timer()
+        for i in xrange(count):
+            app.schedule(values.append, (i,))
+        cycles = app.run()
+        elapsed = timeit.default_timer() - start
+        info = app.task_queue_info()
+    finally:
+        app.destroy()
+    return elapsed, cycles, info
+
+
+def main():
+    header = ('tasks', 'slice', 'time', 'cycles', 'mean lat', 'max lat')
+    print '%8s %8s %10s %8s %10s %10s' % header
+    for count in COUNTS:
+        for time_slice in SLICES:
+            elapsed, cycles, info = bench(count, time_slice)
+            args = (
+                count, time_slice * 1e3, elapsed * 1e3, cycles,
+                info['mean_latency'] * 1e3, info['max_latency'] * 1e3,
+            )
+            print '%8d %8.1f %10.2f %8d %10.2f %10.2f' % args
+    print '(times in ms)'
+
+
+if __name__ == '__main__':
+    main()
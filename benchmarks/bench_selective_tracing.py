@@ -0,0 +1,105 @@
+#------------------------------------------------------------------------------
+# Copyright (c) 2013, Nucleic Development Team.
+#
+# Distributed under the terms of the Modified BSD License.
+#
+# The full license is in the file COPYING.txt, distributed with this software.
+#------------------------------------------------------------------------------
+""" Benchmark '<<' evaluation with full and selective tracing.
+
+Each expression is bound with the standard '<<' operator, which uses
+selective tracing, and with an operator which injects the full tracing
+instrumentation. The expression is evaluated in a loop through the
+expression engine, which runs the tracer for each evaluation. This
+does not require a toolkit.
+
+"""
+import timeit
+
+from atom.api import Atom, Int, List
+
+from enaml.core.enaml_compiler import EnamlCompiler
+from enaml.core.expression_engine import HandlerPair
+from enaml.core.operators import gen_tracer, operator_context
+from enaml.core.parser import parse
+from enaml.core.standard_handlers import StandardTracedReadHandler
+
+
+EXPRESSIONS = [
+    ('attribute', "model.a + model.b"),
+    ('format', "'{}: {:.2f}'.format(model.a, model.a / 3.0)"),
+    ('builtins', "max(len(model.items), model.a) + abs(model.b)"),
+    ('subscript', "model.items[0] + (1, 2, 3)[model.a % 3]"),
+    ('iteration', "sum(x for x in model.items) + model.a"),
+    ('getattr', "getattr(model, 'a') + getattr(model, 'b')"),
+]
+
+
+class Model(Atom):
+    a = Int()
+    b = Int()
+    items = List(default=range(10))
+
+
+EVALUATIONS = 20000
+
+
+def op_full_tracing(code, scope_key, f_globals):
+    """ A '<<' operator which injects the full tracing.
+
+    """
+    func = gen_tracer(code, f_globals)
+    reader = StandardTracedReadHandler(func=func, scope_key=scope_key)
+    return HandlerPair(reader=reader)
+
+
+def compile_main(expression, full):
+    """ Compile an enamldef which subscribes to the expression.
+
+    """
+    source = '\n'.join([
+        'from enaml.core.api import Declarative',
+        'enamldef Main(Declarative):',
+        '    attr model',
+        '    attr value << %s' % expression,
+        '',
+    ])
+    code = EnamlCompiler.compile(parse(source), '<bench>')
+    namespace = {}
+    if full:
+        with operator_context({'<<': op_full_tracing}, union=True):
+            exec code in namespace
+    else:
+        exec code in namespace
+    return namespace['Main']
+
+
+def bench_evaluations(Main):
+    """ Time the evaluation of the expression.
+
+    """
+    model = Model(a=1, b=2)
+    main = Main(model=model)
+    main.value
+    engine = main._d_engine
+
+    def run():
+        read = engine.read
+        for i in xrange(EVALUATIONS):
+            read(main, 'value')
+    return min(timeit.repeat(run, number=1, repeat=7))
+
+
+def main():
+    header = ('expression', 'full', 'selective', 'speedup')
+    print '%-12s %10s %10s %8s' % header
+    for name, expression in EXPRESSIONS:
+        full = bench_evaluations(compile_main(expression, True))
+        selective = bench_evaluations(compile_main(expression, False))
+        args = (name, full * 1e3, selective * 1e3, full / selective)
+        print '%-12s %10.1f %10.1f %7.2fx' % args
+    print '(times in ms for %d evaluations)' % EVALUATIONS
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,119 @@
+#------------------------------------------------------------------------------
+# Copyright (c) 2013, Nucleic Development Team.
+#
+# Distributed under the terms of the Modified BSD License.
+#
+# The full license is in the file COPYING.txt, distributed with this software.
+#------------------------------------------------------------------------------
+""" Benchmark the matching of style sheet styles against widgets.
+
+The indexed matcher of the StyleSheet is compared against a linear scan
+which tests every style of the sheet against every widget. This
+benchmark does not require a toolkit; the widgets are never shown.
+
+"""
+import timeit
+
+from enaml.styling import StyleSheet, Style
+from enaml.widgets.api import Container, Field, Label, PushButton
+
+
+ELEMENTS = (PushButton, Field, Label)
+
+
+RULES = (30, 300, 1000)
+
+
+WIDGETS = (100, 1000, 5000)
+
+
+REPEAT = 3
+
+
+def make_sheet(count):
+    """ Create a style sheet with a mix of selector kinds.
+
+    """
+    sheet = StyleSheet()
+    for i in xrange(count):
+        kind = i % 4
+        if kind == 0:
+            style = Style(object_name=u'widget_%d' % i)
+        elif kind == 1:
+            style = Style(style_class=u'class_%d' % i)
+        elif kind == 2:
+            element = ELEMENTS[i % len(ELEMENTS)].__name__
+            style = Style(element=element, style_class=u'class_%d' % (i - 1))
+        else:
+            element = ELEMENTS[i % len(ELEMENTS)].__name__
+            style = Style(element=element)
+        style.set_parent(sheet)
+    return sheet
+
+
+def make_widgets(count, rules):
+    """ Create a container of widgets with assorted names and classes.
+
+    """
+    container = Container()
+    for i in xrange(count):
+        widget = ELEMENTS[i % len(ELEMENTS)]()
+        widget.name = u'widget_%d' % (i % rules)
+        widget.style_class = u'class_%d class_%d' % (i % rules, i % 7)
+        widget.set_parent(container)
+    return container
+
+
+def linear_match(sheet, item):
+    """ Match the styles of a sheet against an item by linear scan.
+
+    """
+    matches = []
+    for style in sheet.styles():
+        specificity = style.match(item)
+        if specificity >= 0:
+            matches.append((specificity, len(matches), style))
+    matches.sort()
+    return [style for _1, _2, style in matches]
+
+
+def indexed_match(sheet, item):
+    """ Match the styles of a sheet against an item using its index.
+
+    """
+    return sheet.match_styles(item)
+
+
+def bench(matcher, sheet, widgets, reset):
+    best = None
+    for i in xrange(REPEAT):
+        if reset:
+            sheet._index = None
+        start = timeit.default_timer()
+        for widget in widgets:
+            matcher(sheet, widget)
+        elapsed = timeit.default_timer() - start
+        if best is None or elapsed < best:
+            best = elapsed
+    return best
+
+
+def main():
+    header = ('rules', 'widgets', 'linear', 'indexed', 'speedup')
+    print '%8s %8s %10s %10s %8s' % header
+    for rules in RULES:
+        sheet = make_sheet(rules)
+        for count in WIDGETS:
+            widgets = make_widgets(count, rules).children
+            for widget in widgets:
+                assert linear_match(sheet, widget) == \
+                    indexed_match(sheet, widget)
+            linear = bench(linear_match, sheet, widgets, False)
+            indexed = bench(indexed_match, sheet, widgets, True)
+            args = (rules, count, linear * 1e3, indexed * 1e3, linear / indexed)
+            print '%8d %8d %10.2f %10.2f %7.1fx' % args
+    print '(times in ms; the indexed time includes building the index)'
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,83 @@
+#------------------------------------------------------------------------------
+# Copyright (c) 2013, Nucleic Development Team.
+#
+# Distributed under the terms of the Modified BSD License.
+#
+# The full license is in the file COPYING.txt, distributed with this software.
+#------------------------------------------------------------------------------
+""" Benchmark the steady-state update throughput of '<<' bindings.
+
+A model attribute is updated in a loop and every update re-evaluates
+a subscription expression whose dependencies do not change. This does
+not require a toolkit.
+
+"""
+import timeit
+
+from atom.api import Atom, Int
+
+from enaml.core.enaml_compiler import EnamlCompiler
+from enaml.core.parser import parse
+
+
+SOURCE = """\
+from enaml.core.api import Declarative
+
+enamldef Main(Declarative):
+    attr model
+    attr small << model.a
+    attr large << (model.a + model.b + model.c + model.d +
+                   model.e + model.f + model.g + model.h)
+"""
+
+
+class Model(Atom):
+
+    a = Int()
+    b = Int()
+    c = Int()
+    d = Int()
+    e = Int()
+    f = Int()
+    g = Int()
+    h = Int()
+
+
+UPDATES = 20000
+
+
+def compile_main():
+    """ Compile the benchmark source and return the Main class.
+
+    """
+    code = EnamlCompiler.compile(parse(SOURCE), '<bench>')
+    namespace = {}
+    exec code in namespace
+    return namespace['Main']
+
+
+def bench_updates(Main, name):
+    """ Time the model updates for the named binding.
+
+    """
+    model = Model()
+    main = Main(model=model)
+    getattr(main, name)
+
+    def run():
+        for i in xrange(UPDATES):
+            model.a = i
+
+    elapsed = min(timeit.repeat(run, number=1, repeat=3))
+    return UPDATES / elapsed
+
+
+def main():
+    Main = compile_main()
+    for name in ('small', 'large'):
+        rate = bench_updates(Main, name)
+        print '%-8s %10.0f updates/s' % (name, rate)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,562 @@
+#------------------------------------------------------------------------------
+# Copyright (c) 2013, Nucleic Development Team.
+#
+# Distributed under the terms of the Modified BSD License.
+#
+# The full license is in the file COPYING.txt, distributed with this software.
+#------------------------------------------------------------------------------
+""" Run the standard benchmark suite for the declarative runtime.
+
+Each case is run in a fresh child process. The best time over several
+repeats and the growth of the peak resident memory of the process are
+reported. The results can be saved as a baseline, and a later run can be
+compared against a baseline to catch regressions. The suite runs on the
+null toolkit backend and does not require a display. The Qt layout cases
+run only when a Qt binding can be imported, and are reported as skipped
+otherwise. The suite adds the root of the source tree to the module
+path, so it can be run from a checkout without installing enaml.
+
+Example
+-------
+$ python benchmarks/suite.py --save baseline.json
+$ python benchmarks/suite.py --compare baseline.json
+
+"""
+import json
+import multiprocessing
+import optparse
+import os
+import re
+import sys
+import timeit
+
+try:
+    import resource
+except ImportError:
+    resource = None
+
+# Import enaml from the source tree which contains this suite.
+sys.path.insert(
+    0, os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+)
+
+from enaml.application import Application
+from enaml.core.enaml_compiler import EnamlCompiler
+from enaml.core.parser import parse
+from enaml.core.template import Template
+from enaml.version import version_info
+
+import bench_looper
+import bench_parse
+import bench_stylesheet
+import bench_tracer
+
+
+#: The default number of times each case is repeated.
+REPEAT = 5
+
+#: The default relative slowdown which is reported as a regression.
+THRESHOLD = 0.10
+
+
+#------------------------------------------------------------------------------
+# Benchmark Cases
+#------------------------------------------------------------------------------
+# Each case is a function which performs the untimed setup for one repeat
+# and returns the callable to be timed.
+CASES = []
+
+
+class SkipCase(Exception):
+    """ An exception raised by the setup of a case which cannot run.
+
+    """
+    pass
+
+
+def case(name, *args):
+    """ A decorator which registers a benchmark case.
+
+    Parameters
+    ----------
+    name : str
+        The name of the case, used in the report and the baseline.
+
+    *args
+        The arguments to pass to the setup function.
+
+    """
+    def decorator(setup):
+        # Stacked decorators are applied from the bottom up, so the case
+        # is inserted ahead of the cases already registered for setup.
+        index = len(CASES)
+        while index > 0 and CASES[index - 1][1] is setup:
+            index -= 1
+        CASES.insert(index, (name, setup, args))
+        return setup
+    return decorator
+
+
+def compile_source(source, item):
+    """ Compile Enaml source code and return the named item.
+
+    """
+    code = EnamlCompiler.compile(parse(source), '<bench>')
+    namespace = {}
+    exec code in namespace
+    return namespace[item]
+
+
+def null_application():
+    """ Get the application, creating a null application if needed.
+
+    """
+    app = Application.instance()
+    if app is None:
+        from enaml.null.null_application import NullApplication
+        app = NullApplication()
+    return app
+
+
+def read_examples():
+    """ Read the sources of the .enaml files in the examples tree.
+
+    """
+    sources = []
+    for path in bench_parse.find_files(os.path.abspath(bench_parse.EXAMPLES)):
+        with open(path, 'rU') as src_file:
+            sources.append((path, src_file.read()))
+    return sources
+
+
+@case('parse examples')
+def parse_examples():
+    sources = read_examples()
+
+    def run():
+        for path, src in sources:
+            parse(src, path)
+    return run
+
+
+@case('compile examples')
+def compile_examples():
+    asts = [(path, parse(src, path)) for path, src in read_examples()]
+
+    def run():
+        for path, ast in asts:
+            EnamlCompiler.compile(ast, path)
+    return run
+
+
+TREE_SOURCE = """\
+from enaml.core.api import Declarative
+
+enamldef Leaf(Declarative):
+    attr value = 0
+    attr label << str(value)
+
+enamldef Branch(Declarative):
+    attr value = 0
+    Leaf:
+        value := parent.value
+    Leaf:
+        value := parent.value
+    Leaf:
+        value := parent.value
+    Leaf:
+        value := parent.value
+    Leaf:
+        value := parent.value
+    Leaf:
+        value := parent.value
+    Leaf:
+        value := parent.value
+    Leaf:
+        value := parent.value
+    Leaf:
+        value := parent.value
+"""
+
+
+@case('instantiate 1k nodes', 1000)
+@case('instantiate 10k nodes', 10000)
+def instantiate_tree(size):
+    from enaml.core.declarative import Declarative
+    Branch = compile_source(TREE_SOURCE, 'Branch')
+
+    def run():
+        root = Declarative()
+        for i in xrange(size // 10):
+            Branch(root, value=i)
+        root.initialize()
+    return run
+
+
+@case('<< updates')
+def subscription_updates():
+    Main = bench_tracer.compile_main()
+    model = bench_tracer.Model()
+    main = Main(model=model)
+    main.large
+
+    def run():
+        for i in xrange(bench_tracer.UPDATES):
+            model.a = i
+    return run
+
+
+@case('looper refresh 10', 10)
+@case('looper refresh 100', 100)
+@case('looper refresh 1k', 1000)
+@case('looper refresh 10k', 10000)
+def looper_refresh(size):
+    Main = bench_looper.compile_main()
+    main = Main(values=range(size))
+    main.initialize()
+    values = [-i - 1 for i in main.values]
+
+    def run():
+        main.values = values
+    return run
+
+
+@case('template lookup')
+def template_lookup():
+    # A chain of classes with a specialization for each class. Each
+    # lookup scores every specialization against a subclass argument.
+    classes = [object]
+    for i in xrange(50):
+        classes.append(type('T%d' % i, (classes[-1],), {}))
+    template = Template()
+    for cls in classes[:-1]:
+        template.add_specialization((cls, None), lambda a, b: None)
+    args = [(cls, i) for i in xrange(20) for cls in classes[1:]]
+
+    def run():
+        get = template.get_specialization
+        for arg in args:
+            get(arg)
+    return run
+
+
+@case('stylesheet match')
+def stylesheet_match():
+    sheet = bench_stylesheet.make_sheet(300)
+    widgets = bench_stylesheet.make_widgets(1000, 300).children
+
+    def run():
+        sheet._index = None
+        for widget in widgets:
+            sheet.match_styles(widget)
+    return run
+
+
+def make_window(size):
+    """ Create and show a null window with 'size' fields in a layout.
+
+    """
+    from enaml.widgets.api import Window, Container, Field
+    null_application()
+    window = Window()
+    container = Container(parent=window)
+    for i in xrange(size):
+        Field(parent=container)
+    window.show()
+    return window, container
+
+
+@case('layout solve 50', 50)
+@case('layout solve 100', 100)
+def layout_solve(size):
+    window, container = make_window(size)
+    proxy = container.proxy
+
+    def run():
+        proxy.init_cns_layout()
+        proxy.refresh()
+    return run
+
+
+@case('layout resize 50', 50)
+@case('layout resize 100', 100)
+def layout_resize(size):
+    window, container = make_window(size)
+    proxy = container.proxy
+    width, height = proxy.compute_best_size()
+    sizes = [(width + i * 10, height + i * 10) for i in xrange(10)]
+
+    def run():
+        for w, h in sizes:
+            proxy.resize(w, h)
+    return run
+
+
+def qt_window(size):
+    """ Create and show a Qt window with 'size' fields in a layout.
+
+    Raises SkipCase if a Qt binding cannot be imported.
+
+    """
+    try:
+        from enaml.qt.qt_application import QtApplication
+    except ImportError as e:
+        raise SkipCase('Qt is not available: %s' % e)
+    import bench_relayout
+    if Application.instance() is None:
+        QtApplication()
+    window, container, fields = bench_relayout.build_window(size)
+    return window, container, fields
+
+
+@case('qt layout solve 50', 50)
+@case('qt layout solve 100', 100)
+def qt_layout_solve(size):
+    window, container, fields = qt_window(size)
+    proxy = container.proxy
+
+    def run():
+        proxy.init_cns_layout()
+        proxy._refresh()
+    return run
+
+
+@case('qt relayout 100/1', 100, 1)
+@case('qt relayout 100/10', 100, 10)
+def qt_relayout(size, changes):
+    window, container, fields = qt_window(size)
+    proxy = container.proxy
+    changed = [field.proxy for field in fields[:changes]]
+
+    def run():
+        for item in changed:
+            item.layout_dirty = True
+        proxy.relayout()
+    return run
+
+
+@case('qt layout resize 50', 50)
+@case('qt layout resize 100', 100)
+def qt_layout_resize(size):
+    window, container, fields = qt_window(size)
+    proxy = container.proxy
+    best = proxy.compute_best_size()
+    width, height = best.width(), best.height()
+    sizes = [(width + i * 10, height + i * 10) for i in xrange(10)]
+    manager = proxy._layout_manager
+    layout = proxy._layout
+    d = container
+
+    def run():
+        for size in sizes:
+            manager.layout(layout, d.width, d.height, size)
+    return run
+
+
+#------------------------------------------------------------------------------
+# Runner
+#------------------------------------------------------------------------------
+def peak_memory():
+    """ Get the peak resident memory of the process in KB.
+
+    Returns None if the platform does not report the peak memory.
+
+    """
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    if sys.platform == 'darwin':
+        peak //= 1024
+    return peak
+
+
+def run_case(index, repeat):
+    """ Run a benchmark case in the current process.
+
+    Parameters
+    ----------
+    index : int
+        The index of the case in CASES.
+
+    repeat : int
+        The number of times to repeat the case.
+
+    Returns
+    -------
+    result : dict
+        A dict with the best 'time' in seconds and the growth of the
+        peak resident 'memory' in KB, which is None if the platform
+        does not report the peak memory.
+
+    """
+    name, setup, args = CASES[index]
+    start_memory = peak_memory()
+    best = None
+    for i in xrange(repeat):
+        func = setup(*args)
+        start = timeit.default_timer()
+        func()
+        elapsed = timeit.default_timer() - start
+        if best is None or elapsed < best:
+            best = elapsed
+    memory = None
+    if start_memory is not None:
+        memory = peak_memory() - start_memory
+    return {'time': best, 'memory': memory}
+
+
+def _run_case_child(index, repeat, conn):
+    """ The target function for the child process of a case.
+
+    """
+    try:
+        conn.send(run_case(index, repeat))
+    except SkipCase as e:
+        conn.send({'skipped': str(e)})
+    except Exception as e:
+        conn.send({'error': '%s: %s' % (type(e).__name__, e)})
+    finally:
+        conn.close()
+
+
+def run_case_isolated(index, repeat):
+    """ Run a benchmark case in a fresh child process.
+
+    The isolation ensures the peak memory of one case does not mask the
+    memory of the next, and that the cases do not share caches.
+
+    """
+    parent_conn, child_conn = multiprocessing.Pipe(False)
+    process = multiprocessing.Process(
+        target=_run_case_child, args=(index, repeat, child_conn)
+    )
+    process.start()
+    child_conn.close()
+    try:
+        result = parent_conn.recv()
+    except EOFError:
+        result = {'error': 'exited with code %s' % process.exitcode}
+    process.join()
+    return result
+
+
+def compare(result, base, threshold):
+    """ Compare a result against its baseline.
+
+    Returns
+    -------
+    result : (str, bool)
+        The text of the comparison, and whether the time of the result
+        is a regression.
+
+    """
+    if base is None:
+        return 'new', False
+    ratio = result['time'] / base['time']
+    regressed = ratio > 1.0 + threshold
+    text = '%+.1f%%' % ((ratio - 1.0) * 100.0)
+    if regressed:
+        text += ' REGRESSION'
+    return text, regressed
+
+
+def main():
+    usage = 'usage: %prog [options]'
+    parser = optparse.OptionParser(usage=usage, description=__doc__)
+    parser.add_option(
+        '-k', '--filter', default=None,
+        help='only run the cases whose name matches this regex'
+    )
+    parser.add_option(
+        '-r', '--repeat', type='int', default=REPEAT,
+        help='the number of repeats of each case (default %d)' % REPEAT
+    )
+    parser.add_option(
+        '-s', '--save', metavar='FILE', default=None,
+        help='save the results as a baseline to this file'
+    )
+    parser.add_option(
+        '-c', '--compare', metavar='FILE', default=None,
+        help='compare the results against the baseline in this file'
+    )
+    parser.add_option(
+        '-t', '--threshold', type='float', default=THRESHOLD,
+        help='the relative slowdown reported as a regression '
+             '(default %.2f)' % THRESHOLD
+    )
+    parser.add_option(
+        '-l', '--list', action='store_true', default=False,
+        help='list the cases and exit'
+    )
+    options, args = parser.parse_args()
+
+    indices = range(len(CASES))
+    if options.filter:
+        pattern = re.compile(options.filter)
+        indices = [i for i in indices if pattern.search(CASES[i][0])]
+    if options.list:
+        for i in indices:
+            print CASES[i][0]
+        return 0
+
+    baseline = None
+    if options.compare:
+        with open(options.compare, 'rb') as f:
+            baseline = json.load(f)['results']
+
+    header = ('case', 'time (ms)', 'mem (KB)')
+    row = '%-24s %12s %10s'
+    if baseline is not None:
+        header += ('vs baseline',)
+        row += '  %s'
+    print row % header
+
+    results = {}
+    regressions = 0
+    failures = 0
+    for i in indices:
+        name = CASES[i][0]
+        result = run_case_isolated(i, options.repeat)
+        if 'skipped' in result:
+            line = row % ((name, 'SKIPPED', '-') + (('',) if baseline else ()))
+            print line + '  ' + result['skipped']
+            continue
+        if 'error' in result:
+            failures += 1
+            line = row % ((name, 'FAILED', '-') + (('',) if baseline else ()))
+            print line + '  ' + result['error']
+            continue
+        results[name] = result
+        memory = result['memory']
+        cells = (
+            name, '%.2f' % (result['time'] * 1000.0),
+            '-' if memory is None else '%d' % memory,
+        )
+        if baseline is not None:
+            text, regressed = compare(
+                result, baseline.get(name), options.threshold
+            )
+            regressions += regressed
+            cells += (text,)
+        print row % cells
+        sys.stdout.flush()
+
+    if options.save:
+        data = {
+            'enaml': '%s.%s.%s' % version_info,
+            'python': sys.version.split()[0],
+            'repeat': options.repeat,
+            'results': results,
+        }
+        with open(options.save, 'wb') as f:
+            json.dump(data, f, indent=2, sort_keys=True)
+
+    if regressions:
+        print '%d case(s) regressed by more than %.0f%%' % (
+            regressions, options.threshold * 100.0
+        )
+    return 1 if regressions or failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
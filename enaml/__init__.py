@@ -33,7 +33,7 @@ del logging, logger, NullHandler
 #------------------------------------------------------------------------------
 # Import Helper
 #------------------------------------------------------------------------------
-def imports(operators=None, union=True):
+def imports(operators=None, union=True, cache_dir=None):
     """ Lazily imports and returns an enaml imports context.
 
     Parameters
@@ -51,6 +51,13 @@ def imports(operators=None, union=True):
         the correct choice to allow overriding a subset of the default
         Enaml operators.
 
+    cache_dir : str, optional
+        An optional central directory in which to cache the compiled
+        Enaml modules for the duration of the import context. This is
+        useful when the directories which contain the source files are
+        not writable. The default is taken from the ENAML_CACHE_DIR
+        environment variable.
+
     Returns
     -------
     result : context manager
@@ -60,14 +67,14 @@ def imports(operators=None, union=True):
     """
     from enaml.core.import_hooks import imports
     if operators is None:
-        return imports()
+        return imports(cache_dir)
 
     from contextlib import contextmanager
     from enaml.core.operators import operator_context
 
     @contextmanager
     def imports_context():
-        with imports():
+        with imports(cache_dir):
             with operator_context(operators, union):
                 yield
 
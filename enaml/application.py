@@ -8,10 +8,11 @@
 from heapq import heappush, heappop
 from itertools import count
 from threading import Lock
+from timeit import default_timer
 
 from atom.api import (
-    Atom, Bool, Typed, ForwardTyped, Tuple, Dict, Callable, Value, List,
-    observe
+    Atom, Bool, Int, Float, Typed, ForwardTyped, Tuple, Dict, Callable, Value,
+    List, observe
 )
 
 
@@ -40,6 +41,9 @@ class ScheduledTask(Atom):
     #: A callable to invoke with the result of running the task.
     _notify = Callable()
 
+    #: The (callback, key) tuple for a coalesced task, or None.
+    _coalesce_key = Value()
+
     def __init__(self, callback, args, kwargs):
         """ Initialize a ScheduledTask.
 
@@ -146,6 +150,17 @@ class ProxyResolver(Atom):
         if factory is not None:
             return factory()
 
+    def preload(self):
+        """ Invoke all of the factories of the resolver.
+
+        Factories typically import the proxy class on demand. This
+        method can be called to pay the cost of those imports up front
+        so that the latency of later proxy creation is predictable.
+
+        """
+        for factory in self.factories.itervalues():
+            factory()
+
 
 def StyleSheet():
     """ A lazy importer for the Enaml StyleSheet class.
@@ -168,15 +183,59 @@ class Application(Atom):
     #: The style sheet to apply to the entire application.
     style_sheet = ForwardTyped(StyleSheet)
 
-    #: The task heap for application tasks.
+    #: Whether subscription updates should be batched. When enabled,
+    #: the updates triggered by changes are collected and each bound
+    #: expression is updated once, in dependency order, on the next
+    #: cycle of the event loop.
+    batch_updates = Bool(False)
+
+    #: The time slice, in seconds, for running scheduled tasks. When
+    #: this is greater than zero, each cycle of the event loop runs the
+    #: pending tasks at or above the priority of the first task until
+    #: the time slice is exhausted. When zero, each cycle of the event
+    #: loop runs a single task.
+    schedule_time_slice = Float(0.0)
+
+    #: The task heap for application tasks. The heap items are tuples
+    #: of (-priority, counter, task, schedule time).
     _task_heap = List()
 
+    #: The mapping of (callback, key) to pending coalesced task.
+    _coalesced_tasks = Typed(dict, ())
+
+    #: Whether a drain of the task heap has been deferred.
+    _drain_pending = Bool(False)
+
     #: The counter to break heap ties.
     _counter = Value(factory=count)
 
     #: The heap lock for protecting heap access.
     _heap_lock = Value(factory=Lock)
 
+    #: The cache of resolved proxy classes, keyed by declaration class.
+    _proxy_cache = Typed(dict, ())
+
+    #: The number of proxy class lookups satisfied by the cache.
+    _proxy_cache_hits = Int()
+
+    #: The number of proxy class lookups which required resolution.
+    _proxy_cache_misses = Int()
+
+    #: The number of scheduled tasks which have been run.
+    _tasks_run = Int()
+
+    #: The number of submissions merged into a pending coalesced task.
+    _tasks_coalesced = Int()
+
+    #: The maximum depth of the task heap.
+    _task_depth_max = Int()
+
+    #: The total latency, in seconds, of the tasks which have been run.
+    _task_latency_total = Float()
+
+    #: The maximum latency, in seconds, of the tasks which have been run.
+    _task_latency_max = Float()
+
     #: Private class storage for the singleton application instance.
     _instance = None
 
@@ -210,12 +269,79 @@ class Application(Atom):
     #--------------------------------------------------------------------------
     # Private API
     #--------------------------------------------------------------------------
-    def _process_task(self, task):
-        """ Processes the given task, then dispatches the next task.
+    def _run_task(self, item):
+        """ Run the task for a heap item and record its latency.
+
+        """
+        task = item[2]
+        key = task._coalesce_key
+        if key is not None:
+            # Later submissions for the key must create a new task once
+            # the arguments for this task are about to be consumed.
+            with self._heap_lock:
+                tasks = self._coalesced_tasks
+                if tasks.get(key) is task:
+                    del tasks[key]
+        latency = default_timer() - item[3]
+        self._tasks_run += 1
+        self._task_latency_total += latency
+        if latency > self._task_latency_max:
+            self._task_latency_max = latency
+        task._execute()
+
+    def _push_task(self, task, priority):
+        """ Push a task onto the heap and start the task dispatch.
+
+        """
+        heap = self._task_heap
+        with self._heap_lock:
+            needs_start = len(heap) == 0
+            item = (-priority, self._counter.next(), task, default_timer())
+            heappush(heap, item)
+            if len(heap) > self._task_depth_max:
+                self._task_depth_max = len(heap)
+        if needs_start:
+            if self.is_main_thread():
+                self._next_task()
+            else:
+                self.deferred_call(self._next_task)
+
+    def _process_task(self, item):
+        """ Processes the given heap item, then dispatches the next task.
+
+        """
+        try:
+            self._run_task(item)
+        finally:
+            self._next_task()
+
+    def _drain_tasks(self):
+        """ Run the pending tasks for the current time slice, then
+        dispatches the next task.
+
+        Tasks with a priority lower than that of the first task are
+        left for a later cycle of the event loop, as are all tasks once
+        the time slice is exhausted. At least one task is run.
 
         """
+        heap = self._task_heap
+        lock = self._heap_lock
+        with lock:
+            self._drain_pending = False
+        deadline = default_timer() + self.schedule_time_slice
+        priority = None
         try:
-            task._execute()
+            while True:
+                with lock:
+                    if not heap:
+                        break
+                    if priority is not None and heap[0][0] > priority:
+                        break
+                    item = heappop(heap)
+                priority = item[0]
+                self._run_task(item)
+                if default_timer() >= deadline:
+                    break
         finally:
             self._next_task()
 
@@ -223,12 +349,35 @@ class Application(Atom):
         """ Pulls the next task off the heap and processes it on the
         main gui thread.
 
+        If a schedule time slice is set, the next batch of tasks is
+        drained on the main gui thread instead.
+
         """
         heap = self._task_heap
         with self._heap_lock:
             if heap:
-                priority, ignored, task = heappop(heap)
-                self.deferred_call(self._process_task, task)
+                if self.schedule_time_slice > 0:
+                    if not self._drain_pending:
+                        self._drain_pending = True
+                        self.deferred_call(self._drain_tasks)
+                else:
+                    item = heappop(heap)
+                    self.deferred_call(self._process_task, item)
+
+    @observe('resolver', 'resolver.factories')
+    def _invalidate_proxy_cache(self, change):
+        """ An observer which invalidates the proxy class cache.
+
+        """
+        self.clear_proxy_cache()
+
+    @observe('batch_updates')
+    def _update_deferred_updates(self, change):
+        """ An observer which toggles the deferred update batching.
+
+        """
+        from enaml.core.update_batch import set_deferred_updates
+        set_deferred_updates(change['value'])
 
     @observe('style_sheet.destroyed')
     def _clear_destroyed_style_sheet(self, change):
@@ -340,8 +489,10 @@ class Application(Atom):
     def create_proxy(self, declaration):
         """ Create the proxy object for the given declaration.
 
-        This can be reimplemented by Application subclasses if more
-        control is needed.
+        The proxy class for a declaration class is resolved once and
+        then cached until the resolver is changed. This can be
+        reimplemented by Application subclasses if more control is
+        needed.
 
         Parameters
         ----------
@@ -355,7 +506,14 @@ class Application(Atom):
             be create for the given declaration object.
 
         """
-        cls = self.resolve_proxy_class(type(declaration))
+        d_class = type(declaration)
+        cache = self._proxy_cache
+        if d_class in cache:
+            cls = cache[d_class]
+            self._proxy_cache_hits += 1
+        else:
+            cls = cache[d_class] = self.resolve_proxy_class(d_class)
+            self._proxy_cache_misses += 1
         if cls is not None:
             return cls(declaration=declaration)
         msg = "could not resolve a toolkit implementation for the '%s' "
@@ -364,6 +522,45 @@ class Application(Atom):
         a_name = type(self).__name__
         raise TypeError(msg % (d_name, a_name))
 
+    def preload_proxies(self):
+        """ Eagerly load all of the proxy classes of the resolver.
+
+        By default, proxy classes are imported the first time they are
+        needed. This method can be called after the application is
+        created to import them all up front, so that the latency of
+        creating the first instance of each widget is predictable.
+
+        """
+        resolver = self.resolver
+        if resolver is not None:
+            resolver.preload()
+
+    def clear_proxy_cache(self):
+        """ Clear the cache of resolved proxy classes.
+
+        The cache is cleared automatically when the resolver or its
+        factories are changed. This method should be called if the
+        resolution is changed by other means.
+
+        """
+        self._proxy_cache.clear()
+
+    def proxy_cache_info(self):
+        """ Get the statistics for the proxy class cache.
+
+        Returns
+        -------
+        result : dict
+            A dict with the number of cache 'hits' and 'misses', and
+            the current 'size' of the cache.
+
+        """
+        return {
+            'hits': self._proxy_cache_hits,
+            'misses': self._proxy_cache_misses,
+            'size': len(self._proxy_cache),
+        }
+
     def schedule(self, callback, args=None, kwargs=None, priority=0):
         """ Schedule a callable to be executed on the event loop thread.
 
@@ -398,16 +595,63 @@ class Application(Atom):
         if kwargs is None:
             kwargs = {}
         task = ScheduledTask(callback, args, kwargs)
-        heap = self._task_heap
+        self._push_task(task, priority)
+        return task
+
+    def schedule_coalesced(self, key, callback, args=None, kwargs=None,
+                           priority=0):
+        """ Schedule a callable which replaces a pending call for a key.
+
+        If a task for the same callback and key is still pending, its
+        arguments are replaced in place and that task is returned, so
+        only the latest submission is executed. The pending task keeps
+        its position in the queue, its priority, and any notifier. This
+        call is thread-safe.
+
+        Parameters
+        ----------
+        key : object
+            A hashable key which identifies the update, such as the
+            object being updated.
+
+        callback : callable
+            The callable object to be executed. The callback is part
+            of the coalescing key and must be hashable.
+
+        args : tuple, optional
+            The positional arguments to pass to the callable.
+
+        kwargs : dict, optional
+            The keyword arguments to pass to the callable.
+
+        priority : int, optional
+            The queue priority for the callable. This is only used when
+            a new task is created. The default priority is zero.
+
+        Returns
+        -------
+        result : ScheduledTask
+            The task object which will execute the callback with the
+            latest arguments.
+
+        """
+        if args is None:
+            args = ()
+        if kwargs is None:
+            kwargs = {}
+        coalesce_key = (callback, key)
+        tasks = self._coalesced_tasks
         with self._heap_lock:
-            needs_start = len(heap) == 0
-            item = (-priority, self._counter.next(), task)
-            heappush(heap, item)
-        if needs_start:
-            if self.is_main_thread():
-                self._next_task()
-            else:
-                self.deferred_call(self._next_task)
+            task = tasks.get(coalesce_key)
+            if task is not None and task._valid:
+                task._args = args
+                task._kwargs = kwargs
+                self._tasks_coalesced += 1
+                return task
+            task = ScheduledTask(callback, args, kwargs)
+            task._coalesce_key = coalesce_key
+            tasks[coalesce_key] = task
+        self._push_task(task, priority)
         return task
 
     def has_pending_tasks(self):
@@ -424,6 +668,43 @@ class Application(Atom):
             has_pending = len(heap) > 0
         return has_pending
 
+    def task_queue_info(self):
+        """ Get the statistics for the scheduled task queue.
+
+        Returns
+        -------
+        result : dict
+            A dict with the current 'depth' and the 'max_depth' of the
+            task queue, the number of tasks 'run', the number of
+            submissions 'coalesced' into a pending task, and the
+            'mean_latency' and 'max_latency' in seconds between
+            scheduling a task and running it.
+
+        """
+        with self._heap_lock:
+            depth = len(self._task_heap)
+        run = self._tasks_run
+        mean = self._task_latency_total / run if run else 0.0
+        return {
+            'depth': depth,
+            'max_depth': self._task_depth_max,
+            'run': run,
+            'coalesced': self._tasks_coalesced,
+            'mean_latency': mean,
+            'max_latency': self._task_latency_max,
+        }
+
+    def reset_task_queue_info(self):
+        """ Reset the statistics for the scheduled task queue.
+
+        """
+        with self._heap_lock:
+            self._task_depth_max = len(self._task_heap)
+        self._tasks_run = 0
+        self._tasks_coalesced = 0
+        self._task_latency_total = 0.0
+        self._task_latency_max = 0.0
+
     def destroy(self):
         """ Destroy this application instance.
 
@@ -432,6 +713,7 @@ class Application(Atom):
 
         """
         self.stop()
+        self.batch_updates = False
         Application._instance = None
 
 
@@ -546,3 +828,43 @@ def schedule(callback, args=None, kwargs=None, priority=0):
     if app is None:
         raise RuntimeError('Application instance does not exist')
     return app.schedule(callback, args, kwargs, priority)
+
+
+def schedule_coalesced(key, callback, args=None, kwargs=None, priority=0):
+    """ Schedule a callable which replaces a pending call for a key.
+
+    This call is thread-safe.
+
+    This is a convenience function for invoking the same method on the
+    current application instance. If an application instance does not
+    exist, a RuntimeError will be raised.
+
+    Parameters
+    ----------
+    key : object
+        A hashable key which identifies the update.
+
+    callback : callable
+        The callable object to be executed.
+
+    args : tuple, optional
+        The positional arguments to pass to the callable.
+
+    kwargs : dict, optional
+        The keyword arguments to pass to the callable.
+
+    priority : int, optional
+        The queue priority for a newly created task. The default
+        priority is zero.
+
+    Returns
+    -------
+    result : ScheduledTask
+        The task object which will execute the callback with the
+        latest arguments.
+
+    """
+    app = Application.instance()
+    if app is None:
+        raise RuntimeError('Application instance does not exist')
+    return app.schedule_coalesced(key, callback, args, kwargs, priority)
@@ -14,6 +14,7 @@ import re
 from atom.api import Coerced
 
 from .colorext import Color
+from .lrucache import LRUCache
 
 
 #: Regex sub-expressions used for building more complex expression.
@@ -318,9 +319,19 @@ _COLOR_PARSERS = {
 }
 
 
+#: A bounded cache of color string to parsed Color or None.
+_PARSE_CACHE = LRUCache(1024)
+
+#: A sentinel which indicates a parse cache miss.
+_MISSING = object()
+
+
 def parse_color(color):
     """ Parse a CSS3 color string into a tuple of RGBA values.
 
+    The parsed colors are memoized, so equal color strings will share
+    the same Color object while it remains in the parse cache.
+
     Parameters
     ----------
     color : string
@@ -335,6 +346,17 @@ def parse_color(color):
     """
     if color in SVG_COLORS:
         return SVG_COLORS[color]
+    result = _PARSE_CACHE.get(color, _MISSING)
+    if result is _MISSING:
+        result = _parse_color(color)
+        _PARSE_CACHE.set(color, result)
+    return result
+
+
+def _parse_color(color):
+    """ Parse a non-SVG color string without the parse cache.
+
+    """
     color = color.strip()
     if color:
         key = color[0]
@@ -376,8 +398,8 @@ class ColorMember(Coerced):
         When providing a default color value, prefer using a Color
         object or a named color string as these color objects will be
         shared among all instances of the class. Using a color string
-        which must be parsed will result in a new Color object being
-        created for each class instance.
+        which must be parsed will share the parsed Color object only
+        while it remains in the bounded parse cache.
 
         """
         if factory is None:
@@ -0,0 +1,242 @@
+#------------------------------------------------------------------------------
+# Copyright (c) 2013, Nucleic Development Team.
+#
+# Distributed under the terms of the Modified BSD License.
+#
+# The full license is in the file COPYING.txt, distributed with this software.
+#------------------------------------------------------------------------------
+""" Command-line tool to precompile .enaml files.
+
+The files are compiled to the same __enamlcache__ files which are used
+by the Enaml import hook, so that compilation is not needed at import.
+
+"""
+import multiprocessing
+import optparse
+import os
+import sys
+import time
+import traceback
+
+from enaml.core.enaml_compiler import EnamlCompiler
+from enaml.core.import_hooks import (
+    CACHEDIR, MAGIC, make_file_info, read_magic_info, write_cache
+)
+from enaml.core.parser import parse
+
+
+#: The status of a file which was compiled and written to the cache.
+COMPILED = 'compiled'
+
+#: The status of a file which has a current cache file.
+CURRENT = 'current'
+
+#: The status of a file which has a missing or out of date cache file.
+#: This status is only reported in check mode.
+STALE = 'stale'
+
+#: The status of a file which failed to compile.
+FAILED = 'failed'
+
+
+def iter_enaml_files(path):
+    """ Yield the paths to the .enaml files in a directory tree.
+
+    Parameters
+    ----------
+    path : string
+        The path to a directory or an .enaml file.
+
+    Yields
+    ------
+    result : string
+        The path to each .enaml file in the tree, in sorted order.
+
+    """
+    if os.path.isfile(path):
+        yield path
+        return
+    ext = os.path.extsep + 'enaml'
+    for root, dirs, files in os.walk(path):
+        dirs[:] = sorted(d for d in dirs if d != CACHEDIR)
+        for fn in sorted(files):
+            if fn.endswith(ext):
+                yield os.path.join(root, fn)
+
+
+def is_cache_current(file_info):
+    """ Get whether the cache file for a source file is current.
+
+    Parameters
+    ----------
+    file_info : EnamlFileInfo
+        The file info object for the file.
+
+    Returns
+    -------
+    result : bool
+        True if the cache file exists and is current, False otherwise.
+
+    """
+    if not os.path.exists(file_info.cache_path):
+        return False
+    src_mod_time = int(os.path.getmtime(file_info.src_path))
+    magic, ts = read_magic_info(file_info.cache_path)
+    return magic == MAGIC and src_mod_time <= ts
+
+
+def compile_file(path, force=False, check=False):
+    """ Compile a single .enaml file to its __enamlcache__ file.
+
+    Parameters
+    ----------
+    path : string
+        The path to the .enaml file.
+
+    force : bool, optional
+        Whether to compile the file even if its cache is current.
+        This is ignored in check mode. The default is False.
+
+    check : bool, optional
+        Whether to only check that the cache is current without
+        compiling the file. The default is False.
+
+    Returns
+    -------
+    result : (path, status, elapsed, error)
+        The path to the file, the status string, the elapsed time in
+        seconds, and the error message for a failed file or None.
+
+    """
+    start = time.time()
+    file_info = make_file_info(os.path.abspath(path))
+    try:
+        if (check or not force) and is_cache_current(file_info):
+            status = CURRENT
+        elif check:
+            status = STALE
+        else:
+            src_mod_time = int(os.path.getmtime(file_info.src_path))
+            with open(file_info.src_path, 'rU') as src_file:
+                src = src_file.read()
+            ast = parse(src, filename=file_info.src_path)
+            code = EnamlCompiler.compile(ast, file_info.src_path)
+            write_cache(code, src_mod_time, file_info.cache_path)
+            status = COMPILED
+    except Exception:
+        error = traceback.format_exc()
+        return (path, FAILED, time.time() - start, error)
+    return (path, status, time.time() - start, None)
+
+
+def _compile_file_args(args):
+    """ A pickleable worker function for the process pool.
+
+    """
+    return compile_file(*args)
+
+
+def compile_paths(paths, force=False, check=False, jobs=1, quiet=False):
+    """ Compile all of the .enaml files in the given paths.
+
+    Parameters
+    ----------
+    paths : list
+        The list of directories and .enaml files to compile.
+
+    force : bool, optional
+        Whether to compile the files even if their caches are current.
+        The default is False.
+
+    check : bool, optional
+        Whether to only check that the caches are current without
+        compiling the files. The default is False.
+
+    jobs : int, optional
+        The number of worker processes to use. A value of zero uses
+        one process per cpu. The default is 1.
+
+    quiet : bool, optional
+        Whether to suppress the per-file report. Failed and stale
+        files are always reported. The default is False.
+
+    Returns
+    -------
+    result : bool
+        True if all files were compiled, or are current in check mode.
+
+    """
+    files = []
+    for path in paths:
+        files.extend(iter_enaml_files(path))
+    work = [(path, force, check) for path in files]
+
+    if jobs == 0:
+        jobs = multiprocessing.cpu_count()
+    jobs = min(jobs, len(work))
+
+    start = time.time()
+    if jobs > 1:
+        pool = multiprocessing.Pool(jobs)
+        try:
+            results = pool.imap_unordered(_compile_file_args, work)
+            success = _report(results, quiet)
+        finally:
+            pool.close()
+            pool.join()
+    else:
+        results = (compile_file(*args) for args in work)
+        success = _report(results, quiet)
+
+    if not quiet:
+        args = (len(files), time.time() - start, max(jobs, 1))
+        print 'Processed %d files in %.2fs using %d process(es)' % args
+    return success
+
+
+def _report(results, quiet):
+    """ Print the per-file report for an iterable of results.
+
+    """
+    success = True
+    for path, status, elapsed, error in results:
+        failed = status in (FAILED, STALE)
+        if failed:
+            success = False
+        if failed or not quiet:
+            print '%8.1f ms  %-8s  %s' % (elapsed * 1000.0, status, path)
+        if error is not None:
+            print error
+    return success
+
+
+def main():
+    usage = 'usage: %prog [options] [dir_or_file ...]'
+    parser = optparse.OptionParser(usage=usage, description=__doc__)
+    parser.add_option(
+        '-f', '--force', action='store_true', default=False,
+        help='Compile files even if their caches are current'
+    )
+    parser.add_option(
+        '-c', '--check', action='store_true', default=False,
+        help='Only check that the caches are current; do not compile'
+    )
+    parser.add_option(
+        '-j', '--jobs', type='int', default=0,
+        help='The number of processes to use; 0 uses one per cpu'
+    )
+    parser.add_option(
+        '-q', '--quiet', action='store_true', default=False,
+        help='Only report the failed and stale files'
+    )
+
+    options, args = parser.parse_args()
+    paths = args or [os.curdir]
+    success = compile_paths(
+        paths, options.force, options.check, options.jobs, options.quiet
+    )
+    sys.exit(0 if success else 1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,52 @@
+#------------------------------------------------------------------------------
+# Copyright (c) 2013, Nucleic Development Team.
+#
+# Distributed under the terms of the Modified BSD License.
+#
+# The full license is in the file COPYING.txt, distributed with this software.
+#------------------------------------------------------------------------------
+import os
+import tempfile
+
+
+def write_atomic(path, data):
+    """ Atomically write data to a file.
+
+    The directory of the file is created if needed. The data is written
+    to a temporary file in that directory which is then renamed to the
+    final path, so that concurrent readers never observe a partial
+    file.
+
+    Parameters
+    ----------
+    path : string
+        The full path to the file to write.
+
+    data : str
+        The bytes to write to the file.
+
+    """
+    dirname = os.path.dirname(path)
+    if not os.path.isdir(dirname):
+        try:
+            os.makedirs(dirname)
+        except OSError:
+            # Another process may have created the directory.
+            if not os.path.isdir(dirname):
+                raise
+    fd, tmp_path = tempfile.mkstemp(suffix='.tmp', dir=dirname)
+    try:
+        with os.fdopen(fd, 'wb') as tmp_file:
+            tmp_file.write(data)
+        try:
+            os.rename(tmp_path, path)
+        except OSError:
+            # Windows will not rename over an existing file.
+            if not os.path.exists(path):
+                raise
+            os.remove(path)
+            os.rename(tmp_path, path)
+    except:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
@@ -8,10 +8,16 @@
 from .byteplay import (
     LOAD_ATTR, LOAD_CONST, ROT_TWO, DUP_TOP, CALL_FUNCTION, POP_TOP, LOAD_FAST,
     BUILD_TUPLE, ROT_THREE, UNPACK_SEQUENCE, DUP_TOPX, BINARY_SUBSCR, GET_ITER,
-    LOAD_NAME, RETURN_VALUE
+    LOAD_NAME, RETURN_VALUE, BUILD_LIST, BUILD_MAP, BUILD_SET, SetLineno,
+    Label, getse
 )
 
 
+#: The opcodes which push a literal value. A literal is never an Atom.
+LITERAL_OPS = frozenset((LOAD_CONST, BUILD_TUPLE, BUILD_LIST, BUILD_MAP,
+                         BUILD_SET))
+
+
 class CodeTracer(object):
     """ A base class for implementing code tracers.
 
@@ -233,7 +239,93 @@ class CodeInverter(object):
         self.fail()
 
 
-def inject_tracing(codelist):
+def stack_producer(codelist, idx, depth):
+    """ Find the op which pushed a value on the stack.
+
+    The search walks backwards from the given op through the straight
+    line code which precedes it. The search fails if it reaches a jump
+    target or an op with a flow-dependent stack effect.
+
+    Parameters
+    ----------
+    codelist : list
+        The list of byteplay code ops.
+
+    idx : int
+        The index of the op of interest.
+
+    depth : int
+        The depth of the value on the stack before the op of interest
+        is executed. The TOS has a depth of zero.
+
+    Returns
+    -------
+    result : int
+        The index of the op which pushed the value, or -1 if the op
+        cannot be statically determined.
+
+    """
+    for i in xrange(idx - 1, -1, -1):
+        op, op_arg = codelist[i]
+        if op is SetLineno:
+            continue
+        if isinstance(op, Label):
+            return -1
+        try:
+            pop, push = getse(op, op_arg)
+        except ValueError:
+            return -1
+        if depth < push:
+            return i if push == 1 else -1
+        depth += pop - push
+    return -1
+
+
+def is_literal(codelist, idx, depth):
+    """ Get whether a value on the stack is provably a literal.
+
+    Parameters
+    ----------
+    codelist : list
+        The list of byteplay code ops.
+
+    idx : int
+        The index of the op of interest.
+
+    depth : int
+        The depth of the value on the stack before the op of interest
+        is executed. The TOS has a depth of zero.
+
+    """
+    i = stack_producer(codelist, idx, depth)
+    return i >= 0 and codelist[i][0] in LITERAL_OPS
+
+
+def needs_call_trace(codelist, idx):
+    """ Get whether a CALL_FUNCTION op may call the builtin getattr.
+
+    Parameters
+    ----------
+    codelist : list
+        The list of byteplay code ops.
+
+    idx : int
+        The index of the CALL_FUNCTION op.
+
+    """
+    op_arg = codelist[idx][1]
+    nargs = op_arg & 0xFF
+    nkwargs = (op_arg >> 8) & 0xFF
+    if nkwargs != 0 or nargs not in (2, 3):
+        return False
+    # A method of a literal is never getattr.
+    i = stack_producer(codelist, idx, nargs)
+    if i >= 0 and codelist[i][0] == LOAD_ATTR:
+        return not is_literal(codelist, i, 0)
+    return True
+
+
+def inject_tracing(codelist, selective=False):
     """ Inject tracing code into the given code list.
 
     This will inject the bytecode operations required to trace the
@@ -246,6 +338,15 @@ def inject_tracing(codelist):
     codelist : list
         The list of byteplay code ops to modify.
 
+    selective : bool, optional
+        Whether to only inject the tracing needed to discover the Atom
+        dependencies of the code. If True, the 'load_attr' method is
+        not called for an object which is provably a literal, the
+        'call_function' method is only called for calls which may be
+        to the builtin getattr, and the 'binary_subscr' and 'get_iter'
+        methods are never called. This is sufficient for the
+        StandardTracer. The default is False.
+
     Returns
     -------
     result : list
@@ -261,6 +362,13 @@ def inject_tracing(codelist):
     # transparent.
     inserts = {}
     for idx, (op, op_arg) in enumerate(codelist):
+        if selective:
+            if op == LOAD_ATTR and is_literal(codelist, idx, 0):
+                continue
+            if op == CALL_FUNCTION and not needs_call_trace(codelist, idx):
+                continue
+            if op == BINARY_SUBSCR or op == GET_ITER:
+                continue
         if op == LOAD_ATTR:
             code = [                        # obj
                 (DUP_TOP, None),            # obj -> obj
@@ -17,6 +17,7 @@ from .enaml_ast import (
     AliasExpr, ASTVisitor, Binding, ChildDef, EnamlDef, StorageExpr, Template,
     TemplateInst, PythonExpression, PythonModule
 )
+from .operators import precompile_operator
 
 
 #: The name of the compiler helpers in the global scope.
@@ -519,7 +520,8 @@ def gen_template_inst_binding(cg, node):
         cg.load_const(op_node.operator)
         cg.load_const(code)
         cg.load_fast(F_GLOBALS)
-        cg.call_function(5)
+        cg.load_const(precompile_operator(op_node.operator, code))
+        cg.call_function(6)
         cg.pop_top()
 
 
@@ -554,7 +556,8 @@ def gen_operator_binding(cg, node, index, name):
         cg.load_const(node.operator)
         cg.load_const(code)
         cg.load_fast(F_GLOBALS)
-        cg.call_function(5)
+        cg.load_const(precompile_operator(node.operator, code))
+        cg.call_function(6)
         cg.pop_top()
 
 
@@ -16,7 +16,10 @@ from .declarative import Declarative, d_
 from .declarative_meta import patch_d_member
 from .enamldef_meta import EnamlDefMeta
 from .expression_engine import ExpressionEngine
-from .operators import __get_operators
+from .lazy_enamldef import LazyEnamlDef, lazy_enamldefs_enabled, resolve_lazy
+from .operators import (
+    __get_operators, op_precompiled, STANDARD_OPERATORS
+)
 from .template import Template
 
 
@@ -125,6 +128,7 @@ def add_storage(node, name, store_type, kind):
         The kind of storage to add to the class.
 
     """
+    store_type = resolve_lazy(store_type)
     if store_type is None:
         store_type = object
     elif not isinstance(store_type, type):
@@ -188,6 +192,7 @@ def declarative_node(klass, identifier, scope_key, store_locals):
         The compiler node for the given klass.
 
     """
+    klass = resolve_lazy(klass)
     node = DeclarativeNode()
     node.klass = klass
     node.identifier = identifier
@@ -339,9 +344,31 @@ def make_enamldef(name, bases, dct):
         A new class generator from the EnamlDefMeta metaclass.
 
     """
+    bases = tuple(resolve_lazy(base) for base in bases)
     return EnamlDefMeta(name, bases, dct)
 
 
+def define_enamldef(func):
+    """ Define an enamldef from its compiled function.
+
+    Parameters
+    ----------
+    func : FunctionType
+        The compiled enamldef function which builds and returns the
+        enamldef class.
+
+    Returns
+    -------
+    result : EnamlDefMeta or LazyEnamlDef
+        The enamldef class, or a placeholder which builds the class on
+        first use if lazy enamldefs are enabled.
+
+    """
+    if lazy_enamldefs_enabled():
+        return LazyEnamlDef(func)
+    return func()
+
+
 def make_object():
     """ Create a new empty object instance.
 
@@ -535,7 +562,7 @@ def bind_member(node, name, pair):
     node.engine.add_pair(name, pair)
 
 
-def run_operator(node, name, op, code, f_globals):
+def run_operator(node, name, op, code, f_globals, compiled=None):
     """ Run the operator for a given node.
 
     Parameters
@@ -555,11 +582,20 @@ def run_operator(node, name, op, code, f_globals):
     f_globals : dict
         The globals dictionary to pass to the operator.
 
+    compiled : tuple, optional
+        The code objects precompiled for the standard operator. These
+        are used in place of running the operator function if that
+        function is the standard function for the operator.
+
     """
     operators = __get_operators()
     if op not in operators:
         raise TypeError("failed to load operator '%s'" % op)
-    pair = operators[op](code, node.scope_key, f_globals)
+    func = operators[op]
+    if compiled is not None and func is STANDARD_OPERATORS.get(op):
+        pair = op_precompiled(op, compiled, node.scope_key, f_globals)
+    else:
+        pair = func(code, node.scope_key, f_globals)
     if isinstance(name, tuple):
         bind_extended_member(node, name, pair)
     else:
@@ -616,6 +652,7 @@ def validate_declarative(klass):
         The object to validate.
 
     """
+    klass = resolve_lazy(klass)
     if not isinstance(klass, type):
         raise TypeError("%s is not a type" % klass)
     if not issubclass(klass, Declarative):
@@ -693,6 +730,7 @@ __compiler_helpers = {
     'add_template_scope': add_template_scope,
     'add_storage': add_storage,
     'declarative_node': declarative_node,
+    'define_enamldef': define_enamldef,
     'enamldef_node': enamldef_node,
     'make_enamldef': make_enamldef,
     'make_object': make_object,
@@ -119,7 +119,22 @@ from .template_compiler import TemplateCompiler
 # 19 : Fix a bug in variadic template args - 20 September 2013
 #     The code generated for variadic template functions did not set
 #     the varargs flag on the code object. This is now fixed.
-COMPILER_VERSION = 19
+# 20 : Support lazy enamldefs - 18 October 2026
+#     The module code passes the enamldef function to a helper instead
+#     of calling it directly, so that the helper can defer building the
+#     class when lazy enamldefs are enabled.
+# 21 : Precompile the standard operators - 18 October 2026
+#     The code objects with the local variable optimization and the
+#     tracing and inversion instrumentation of the standard operators
+#     are generated by the compiler and passed to 'run_operator'. They
+#     are stored in the module cache, so that a module loaded from the
+#     cache does not rewrite bytecode unless a custom operator context
+#     is active.
+# 22 : Selective tracing for the standard operators - 18 October 2026
+#     The precompiled trace functions of the standard operators only
+#     call the tracer where the StandardTracer may discover an Atom
+#     dependency.
+COMPILER_VERSION = 22
 
 
 # Code that will be executed at the top of every enaml module
@@ -201,12 +216,13 @@ class EnamlCompiler(cmn.CompilerBase):
         cg.insert_python_block(node.ast)
 
     def visit_EnamlDef(self, node):
-        # Invoke the enamldef code and store result in the namespace.
+        # Define the enamldef and store the result in the namespace.
         cg = self.code_generator
         code = EnamlDefCompiler.compile(node, cg.filename)
+        cmn.load_helper(cg, 'define_enamldef', from_globals=True)
         cg.load_const(code)
         cg.make_function()
-        cg.call_function()
+        cg.call_function(1)
         cg.store_global(node.typename)
 
     def visit_Template(self, node):
@@ -179,6 +179,23 @@ class ExpressionEngine(Atom):
                 return pair.reader(owner, name)
         return NotImplemented
 
+    def readers(self):
+        """ Get the read handlers of the engine.
+
+        Returns
+        -------
+        result : list
+            A list of (name, reader) tuples for the attributes which
+            have a readable expression.
+
+        """
+        readers = []
+        for name, handler in self._handlers.items():
+            pair = handler.read_pair
+            if pair is not None:
+                readers.append((name, pair.reader))
+        return readers
+
     def write(self, owner, name, change):
         """ Write a change to an expression.
 
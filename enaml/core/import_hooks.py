@@ -7,6 +7,7 @@
 #------------------------------------------------------------------------------
 from abc import ABCMeta, abstractmethod
 from collections import defaultdict, namedtuple
+import hashlib
 import imp
 import marshal
 import os
@@ -14,7 +15,9 @@ import struct
 import sys
 import types
 
+from .atomic_write import write_atomic
 from .enaml_compiler import EnamlCompiler, COMPILER_VERSION
+from .import_profile import import_module, import_phase
 from .parser import parse
 
 
@@ -32,6 +35,11 @@ except AttributeError:
     )
 CACHEDIR = '__enamlcache__'
 
+# The environment variable which names a central directory in which to
+# cache the compiled Enaml modules. This is useful when the directories
+# which contain the source files are not writable.
+CACHEDIR_ENV = 'ENAML_CACHE_DIR'
+
 
 #------------------------------------------------------------------------------
 # Import Helpers
@@ -61,6 +69,145 @@ def make_file_info(src_path):
     return EnamlFileInfo(src_path, cache_path, cache_dir)
 
 
+def make_cache_path(cache_dir, src_path, src):
+    """ Create the path to the central cache file for a source file.
+
+    The name of the cache file is derived from a hash of the source
+    path and the source code, plus the magic tag. Including the path
+    in the hash ensures that the filename embedded in the compiled
+    code objects is always correct.
+
+    Parameters
+    ----------
+    cache_dir : string
+        The path to the central cache directory.
+
+    src_path : string
+        The full path to the .enaml file.
+
+    src : string
+        The source code read from the .enaml file.
+
+    Returns
+    -------
+    result : string
+        The full path to the cache file for the source.
+
+    """
+    digest = hashlib.sha1()
+    digest.update(src_path)
+    digest.update('\0')
+    digest.update(src)
+    fn = ''.join((digest.hexdigest(), '.', MAGIC_TAG, os.path.extsep, 'enamlc'))
+    return os.path.join(cache_dir, fn)
+
+
+def read_cache(cache_path):
+    """ Read the code object from a cache file.
+
+    Parameters
+    ----------
+    cache_path : string
+        The full path to the .enamlc file.
+
+    Returns
+    -------
+    result : types.CodeType
+        The code object stored in the cache file.
+
+    """
+    with open(cache_path, 'rb') as cache_file:
+        cache_file.read(8)
+        code = marshal.load(cache_file)
+    return code
+
+
+def read_magic_info(cache_path):
+    """ Read the magic info from a cache file.
+
+    Parameters
+    ----------
+    cache_path : string
+        The full path to the .enamlc file.
+
+    Returns
+    -------
+    result : (magic, timestamp)
+        The magic string and integer timestamp for the file.
+
+    """
+    with open(cache_path, 'rb') as cache_file:
+        magic = cache_file.read(4)
+        timestamp = struct.unpack('i', cache_file.read(4))[0]
+    return (magic, timestamp)
+
+
+def write_cache(code, ts, cache_path):
+    """ Atomically write a code object to a cache file.
+
+    The cache directory is created if needed, and the file is replaced
+    atomically so that concurrent readers never observe a partial file.
+
+    Parameters
+    ----------
+    code : types.CodeType
+        The code object to write to the cache.
+
+    ts : int
+        The integer timestamp for the file.
+
+    cache_path : string
+        The full path to the .enamlc file.
+
+    """
+    data = ''.join((MAGIC, struct.pack('i', ts), marshal.dumps(code)))
+    write_atomic(cache_path, data)
+
+def compile_cached(src, src_path, cache_dir):
+    """ Get the code object for Enaml source using a central cache.
+
+    If the central cache holds a current code object for the source,
+    it is loaded without parsing the source. Otherwise, the source is
+    compiled and the result is written to the cache. Errors writing
+    the cache are suppressed.
+
+    Parameters
+    ----------
+    src : string
+        The Enaml source code to compile.
+
+    src_path : string
+        The full path to the .enaml file.
+
+    cache_dir : string
+        The path to the central cache directory.
+
+    Returns
+    -------
+    result : types.CodeType
+        The compiled code object for the source.
+
+    """
+    with import_phase('cache-check'):
+        cache_path = make_cache_path(cache_dir, src_path, src)
+        magic = None
+        if os.path.exists(cache_path):
+            with open(cache_path, 'rb') as cache_file:
+                magic = cache_file.read(4)
+    if magic == MAGIC:
+        with import_phase('unmarshal'):
+            return read_cache(cache_path)
+    with import_phase('parse'):
+        ast = parse(src, filename=src_path)
+    with import_phase('compile'):
+        code = EnamlCompiler.compile(ast, src_path)
+    try:
+        write_cache(code, 0, cache_path)
+    except (OSError, IOError):
+        pass
+    return code
+
+
 class abstractclassmethod(classmethod):
     """ A backport of the Python 3's abc.abstractclassmethod.
 
@@ -127,20 +274,22 @@ class AbstractEnamlImporter(object):
         reused, otherwise a new one is created.
 
         """
-        code, path = self.get_code()
-        if fullname in sys.modules:
-            mod = sys.modules[fullname]
-        else:
-            mod = sys.modules[fullname] = types.ModuleType(fullname)
-        mod.__loader__ = self
-        mod.__file__ = path
-        # Even though the import hook is already installed, this is a
-        # safety net to avoid potentially hard to find bugs if code has
-        # manually installed and removed a hook. The contract here is
-        # that the import hooks are always installed when executing the
-        # module code of an Enaml file.
-        with imports():
-            exec code in mod.__dict__
+        with import_module(fullname):
+            code, path = self.get_code()
+            if fullname in sys.modules:
+                mod = sys.modules[fullname]
+            else:
+                mod = sys.modules[fullname] = types.ModuleType(fullname)
+            mod.__loader__ = self
+            mod.__file__ = path
+            # Even though the import hook is already installed, this is
+            # a safety net to avoid potentially hard to find bugs if
+            # code has manually installed and removed a hook. The
+            # contract here is that the import hooks are always
+            # installed when executing the module code of an Enaml file.
+            with imports():
+                with import_phase('exec'):
+                    exec code in mod.__dict__
         return mod
 
     #--------------------------------------------------------------------------
@@ -199,7 +348,16 @@ class EnamlImporter(AbstractEnamlImporter):
     See this discussion thread for more info:
     http://www.mail-archive.com/python-dev@python.org/msg45203.html
 
+    If a central cache directory is configured, modules which do not
+    have a current cache file next to the source are cached in that
+    directory, keyed by a hash of their source.
+
     """
+    #: The central directory in which to cache compiled modules. The
+    #: default is read from the ENAML_CACHE_DIR environment variable.
+    #: It can be changed with the 'cache_dir' option of 'imports'.
+    cache_dir = os.environ.get(CACHEDIR_ENV) or None
+
     @classmethod
     def locate_module(cls, fullname, path=None):
         """ Searches for the given Enaml module and returns an instance
@@ -272,15 +430,12 @@ class EnamlImporter(AbstractEnamlImporter):
             The code object for the file.
 
         """
-        with open(file_info.cache_path, 'rb') as cache_file:
-            cache_file.read(8)
-            code = marshal.load(cache_file)
-        return code
+        return read_cache(file_info.cache_path)
 
     def _write_cache(self, code, ts, file_info):
         """ Write the cached file for then given info, creating the
-        cache directory if needed. This call will suppress any
-        IOError or OSError exceptions.
+        cache directory if needed. The file is written atomically.
+        This call will suppress any IOError or OSError exceptions.
 
         Parameters
         ----------
@@ -295,12 +450,7 @@ class EnamlImporter(AbstractEnamlImporter):
 
         """
         try:
-            if not os.path.exists(file_info.cache_dir):
-                os.mkdir(file_info.cache_dir)
-            with open(file_info.cache_path, 'w+b') as cache_file:
-                cache_file.write(MAGIC)
-                cache_file.write(struct.pack('i', ts))
-                marshal.dump(code, cache_file)
+            write_cache(code, ts, file_info.cache_path)
         except (OSError, IOError):
             pass
 
@@ -318,10 +468,7 @@ class EnamlImporter(AbstractEnamlImporter):
             The magic string and integer timestamp for the file.
 
         """
-        with open(file_info.cache_path, 'rb') as cache_file:
-            magic = cache_file.read(4)
-            timestamp = struct.unpack('i', cache_file.read(4))[0]
-        return (magic, timestamp)
+        return read_magic_info(file_info.cache_path)
 
     def get_code(self):
         """ Loads and returns the code object for the Enaml module and
@@ -341,23 +488,36 @@ class EnamlImporter(AbstractEnamlImporter):
         # it was deleted between then and now, an IOError is more
         # informative than an ImportError.
         file_info = self.file_info
-        if not os.path.exists(file_info.src_path):
-            code = self._load_cache(file_info)
+        with import_phase('cache-check'):
+            src_exists = os.path.exists(file_info.src_path)
+        if not src_exists:
+            with import_phase('unmarshal'):
+                code = self._load_cache(file_info)
             return (code, file_info.src_path)
 
         # Use the cached file if it exists and is current
-        src_mod_time = int(os.path.getmtime(file_info.src_path))
-        if os.path.exists(file_info.cache_path):
-            magic, ts = self._get_magic_info(file_info)
-            if magic == MAGIC and src_mod_time <= ts:
+        with import_phase('cache-check'):
+            src_mod_time = int(os.path.getmtime(file_info.src_path))
+            current = False
+            if os.path.exists(file_info.cache_path):
+                magic, ts = self._get_magic_info(file_info)
+                current = magic == MAGIC and src_mod_time <= ts
+        if current:
+            with import_phase('unmarshal'):
                 code = self._load_cache(file_info)
-                return (code, file_info.src_path)
+            return (code, file_info.src_path)
 
         # Otherwise, compile from source and attempt to cache
         with open(file_info.src_path, 'rU') as src_file:
             src = src_file.read()
-        ast = parse(src)
-        code = EnamlCompiler.compile(ast, file_info.src_path)
+        cache_dir = self.cache_dir
+        if cache_dir is not None:
+            code = compile_cached(src, file_info.src_path, cache_dir)
+            return (code, file_info.src_path)
+        with import_phase('parse'):
+            ast = parse(src)
+        with import_phase('compile'):
+            code = EnamlCompiler.compile(ast, file_info.src_path)
         self._write_cache(code, src_mod_time, file_info)
         return (code, file_info.src_path)
 
@@ -411,16 +571,28 @@ class imports(object):
         if importer in importers:
             importers.remove(importer)
 
-    def __init__(self):
+    def __init__(self, cache_dir=None):
         """ Initializes an Enaml import context.
 
+        Parameters
+        ----------
+        cache_dir : string, optional
+            The central directory in which to cache compiled modules
+            for the duration of the context. The default is None and
+            leaves the current cache directory unchanged.
+
         """
         self.importers = self.get_importers()
+        self.cache_dir = cache_dir
+        self._old_cache_dir = None
 
     def __enter__(self):
         """ Installs the current importer upon entering the context.
 
         """
+        if self.cache_dir is not None:
+            self._old_cache_dir = EnamlImporter.cache_dir
+            EnamlImporter.cache_dir = self.cache_dir
         # Install the importers reversed so that the newest ones
         # get first crack at the import on sys.meta_path.
         for importer in reversed(self.importers):
@@ -434,4 +606,6 @@ class imports(object):
         # operation on sys.meta_path.
         for importer in self.importers:
             importer.uninstall()
+        if self.cache_dir is not None:
+            EnamlImporter.cache_dir = self._old_cache_dir
 
@@ -0,0 +1,261 @@
+#------------------------------------------------------------------------------
+# Copyright (c) 2013, Nucleic Development Team.
+#
+# Distributed under the terms of the Modified BSD License.
+#
+# The full license is in the file COPYING.txt, distributed with this software.
+#------------------------------------------------------------------------------
+""" An opt-in profiler for the import of Enaml modules.
+
+When enabled, every Enaml module loaded by the import hooks records the
+time spent in each phase of its import: checking the cache, loading the
+marshalled code, parsing, compiling, and executing the module body.
+Enaml modules imported while a module body executes are recorded as
+children of that module, so that each top-level import produces a tree.
+
+Setting the ENAML_IMPORT_PROFILE environment variable to a non-empty
+value enables the profiler at startup and prints each tree to stderr
+when its top-level import completes, in the spirit of the Python
+'-X importtime' option.
+
+Example
+-------
+>>> from enaml.core import import_profile
+>>> import_profile.enable()
+>>> with enaml.imports():
+...     import main_view
+>>> print import_profile.format_report()
+
+"""
+from contextlib import contextmanager
+import os
+import sys
+from timeit import default_timer
+
+
+#: The phases of an import, in the order they are reported.
+PHASES = ('cache-check', 'unmarshal', 'parse', 'compile', 'exec')
+
+
+class ImportRecord(object):
+    """ The timings recorded for the import of a single Enaml module.
+
+    """
+    __slots__ = ('name', 'total', 'phases', 'children')
+
+    def __init__(self, name):
+        self.name = name
+        self.total = 0.0
+        self.phases = dict.fromkeys(PHASES, 0.0)
+        self.children = []
+
+    def self_time(self):
+        """ Get the time for the module excluding its child imports.
+
+        """
+        return self.total - sum(child.total for child in self.children)
+
+
+class ImportProfiler(object):
+    """ A profiler which records the import times of Enaml modules.
+
+    """
+    def __init__(self, stream=None):
+        """ Initialize an ImportProfiler.
+
+        Parameters
+        ----------
+        stream : file-like, optional
+            A stream to which the tree for each top-level import is
+            written when the import completes.
+
+        """
+        self.stream = stream
+        self.records = []
+        self._stack = []
+
+    @contextmanager
+    def module(self, name):
+        """ Record the import of a module for the duration of a context.
+
+        """
+        record = ImportRecord(name)
+        stack = self._stack
+        if stack:
+            stack[-1].children.append(record)
+        else:
+            self.records.append(record)
+        stack.append(record)
+        start = default_timer()
+        try:
+            yield record
+        finally:
+            record.total = default_timer() - start
+            stack.pop()
+            if not stack and self.stream is not None:
+                self.stream.write(format_tree(record))
+
+    @contextmanager
+    def phase(self, name):
+        """ Add the time of a context to a phase of the current import.
+
+        """
+        stack = self._stack
+        if not stack:
+            yield
+            return
+        record = stack[-1]
+        start = default_timer()
+        try:
+            yield
+        finally:
+            record.phases[name] += default_timer() - start
+
+
+#: The active profiler, or None if the profiler is disabled.
+_profiler = None
+
+
+@contextmanager
+def _null_context():
+    yield
+
+
+def import_module(name):
+    """ Get a context which records the import of a module.
+
+    This is a cheap no-op context if the profiler is disabled.
+
+    Parameters
+    ----------
+    name : str
+        The fully qualified name of the module being imported.
+
+    """
+    profiler = _profiler
+    if profiler is None:
+        return _null_context()
+    return profiler.module(name)
+
+
+def import_phase(name):
+    """ Get a context which records a phase of the current import.
+
+    This is a cheap no-op context if the profiler is disabled or no
+    import is being recorded.
+
+    Parameters
+    ----------
+    name : str
+        The name of the phase. This should be one of PHASES.
+
+    """
+    profiler = _profiler
+    if profiler is None:
+        return _null_context()
+    return profiler.phase(name)
+
+
+def enable(stream=None):
+    """ Enable the import profiler.
+
+    If the profiler is already enabled, the recorded imports are
+    retained and the stream is updated.
+
+    Parameters
+    ----------
+    stream : file-like, optional
+        A stream to which the tree for each top-level import is written
+        when the import completes.
+
+    """
+    global _profiler
+    if _profiler is None:
+        _profiler = ImportProfiler(stream)
+    else:
+        _profiler.stream = stream
+
+
+def disable():
+    """ Disable the import profiler.
+
+    The recorded imports are discarded.
+
+    """
+    global _profiler
+    _profiler = None
+
+
+def is_enabled():
+    """ Get whether the import profiler is enabled.
+
+    """
+    return _profiler is not None
+
+
+def reset():
+    """ Discard the imports recorded by an enabled profiler.
+
+    """
+    if _profiler is not None:
+        del _profiler.records[:]
+
+
+def records():
+    """ Get the records of the top-level imports.
+
+    Returns
+    -------
+    result : list
+        The list of ImportRecord objects for the top-level imports, or
+        an empty list if the profiler is not enabled.
+
+    """
+    if _profiler is None:
+        return []
+    return list(_profiler.records)
+
+
+def format_tree(record):
+    """ Format the tree of timings for a top-level import.
+
+    The times are reported in milliseconds. The 'self' column excludes
+    the time of the child imports, as does the 'exec' column.
+
+    Parameters
+    ----------
+    record : ImportRecord
+        The record of the top-level import.
+
+    Returns
+    -------
+    result : str
+        The formatted tree, one line per module.
+
+    """
+    header = ['cumulative', 'self'] + list(PHASES)
+    lines = [' | '.join('%11s' % h for h in header) + ' | module']
+    todo = [(record, 0)]
+    while todo:
+        record, depth = todo.pop()
+        phases = record.phases
+        child_total = sum(child.total for child in record.children)
+        values = [record.total, record.self_time()]
+        values.extend(phases[phase] for phase in PHASES[:-1])
+        values.append(phases['exec'] - child_total)
+        cells = ['%11.2f' % (value * 1000.0) for value in values]
+        lines.append(' | '.join(cells) + ' | ' + '  ' * depth + record.name)
+        for child in reversed(record.children):
+            todo.append((child, depth + 1))
+    return '\n'.join(lines) + '\n'
+
+
+def format_report():
+    """ Format the trees of all of the recorded top-level imports.
+
+    """
+    return ''.join(format_tree(record) for record in records())
+
+
+if os.environ.get('ENAML_IMPORT_PROFILE'):
+    enable(sys.stderr)
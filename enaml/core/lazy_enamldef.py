@@ -0,0 +1,153 @@
+#------------------------------------------------------------------------------
+# Copyright (c) 2013, Nucleic Development Team.
+#
+# Distributed under the terms of the Modified BSD License.
+#
+# The full license is in the file COPYING.txt, distributed with this software.
+#------------------------------------------------------------------------------
+""" Opt-in lazy construction of enamldef classes.
+
+When lazy mode is enabled, executing an Enaml module binds each
+enamldef name to a LazyEnamlDef placeholder instead of building the
+class. The class and its compiler node tree are built the first time
+the placeholder is called or an attribute is read from it, and the
+placeholder then replaces itself in the module namespace.
+
+Lazy mode is enabled by setting the ENAML_LAZY_ENAMLDEFS environment
+variable to a non-empty value, or by calling `set_lazy_enamldefs`. It
+applies to the modules which are executed while it is enabled.
+
+A placeholder supports instantiation, attribute access, and the
+`isinstance` and `issubclass` checks. It can be used as the base of
+another enamldef and as the type of a child declaration or of an
+'attr' or 'event'. It is not a type, so it cannot be used as the base
+of a Python class statement.
+
+"""
+import os
+
+from .operators import __get_operators as _get_operators, operator_context
+
+
+#: Whether the enamldefs of newly executed modules are built lazily.
+__lazy = bool(os.environ.get('ENAML_LAZY_ENAMLDEFS'))
+
+
+def set_lazy_enamldefs(enabled):
+    """ Set whether enamldef classes are built lazily.
+
+    Parameters
+    ----------
+    enabled : bool
+        Whether or not to build the enamldefs of subsequently executed
+        Enaml modules lazily.
+
+    """
+    global __lazy
+    __lazy = enabled
+
+
+def lazy_enamldefs_enabled():
+    """ Get whether enamldef classes are built lazily.
+
+    """
+    return __lazy
+
+
+class LazyEnamlDef(object):
+    """ A placeholder for an enamldef class which is not yet built.
+
+    """
+    __slots__ = ('_func', '_operators', '_klass')
+
+    def __init__(self, func):
+        """ Initialize a LazyEnamlDef.
+
+        Parameters
+        ----------
+        func : FunctionType
+            The compiled enamldef function which builds and returns the
+            class. The operators which are active when the placeholder
+            is created are used to build the class.
+
+        """
+        self._func = func
+        self._operators = _get_operators()
+        self._klass = None
+
+    def resolve(self):
+        """ Get the enamldef class, building it if necessary.
+
+        Returns
+        -------
+        result : EnamlDefMeta
+            The enamldef class for the placeholder.
+
+        """
+        klass = self._klass
+        if klass is None:
+            func = self._func
+            with operator_context(self._operators):
+                klass = func()
+            self._klass = klass
+            self._func = self._operators = None
+            f_globals = func.func_globals
+            name = func.func_name
+            if f_globals.get(name) is self:
+                f_globals[name] = klass
+        return klass
+
+    def __call__(self, *args, **kwargs):
+        """ Build the class if necessary and create an instance.
+
+        """
+        return self.resolve()(*args, **kwargs)
+
+    def __getattr__(self, name):
+        """ Build the class if necessary and get an attribute from it.
+
+        """
+        return getattr(self.resolve(), name)
+
+    def __instancecheck__(self, instance):
+        """ Build the class if necessary and check an instance.
+
+        """
+        return isinstance(instance, self.resolve())
+
+    def __subclasscheck__(self, subclass):
+        """ Build the class if necessary and check a subclass.
+
+        """
+        return issubclass(subclass, self.resolve())
+
+    def __repr__(self):
+        """ A repr which does not build the class.
+
+        """
+        klass = self._klass
+        if klass is not None:
+            return repr(klass)
+        func = self._func
+        module = func.func_globals.get('__name__')
+        return "<lazy enamldef '%s.%s'>" % (module, func.func_name)
+
+
+def resolve_lazy(obj):
+    """ Get the class for an object which may be a lazy placeholder.
+
+    Parameters
+    ----------
+    obj : object
+        The object to resolve.
+
+    Returns
+    -------
+    result : object
+        The built class if the object is a LazyEnamlDef, or the object
+        itself otherwise.
+
+    """
+    if type(obj) is LazyEnamlDef:
+        return obj.resolve()
+    return obj
@@ -6,15 +6,19 @@
 # The full license is in the file COPYING.txt, distributed with this software.
 #------------------------------------------------------------------------------
 from collections import Iterable
+from types import CodeType
 
-from atom.api import Instance, List, Typed
-from atom.datastructures.api import sortedmap
+from atom.api import Callable, Instance, List
 
 from .compiler_nodes import new_scope
 from .declarative import d_
 from .pattern import Pattern
 
 
+#: A sentinel used to build the keys for unhashable iterable items.
+_unhashable = object()
+
+
 class Looper(Pattern):
     """ A pattern object that repeats its children over an iterable.
 
@@ -29,22 +33,35 @@ class Looper(Pattern):
     parent of the `Looper`. The `Looper` keeps ownership of all items
     it creates. When the iterable for the looper is changed, the looper
     will only create and destroy children for the items in the iterable
-    which have changed.
+    which have changed. The children for the items which remain in the
+    iterable are reused and moved to their new position.
 
     """
     #: The iterable to use when creating the items for the looper.
     iterable = d_(Instance(Iterable))
 
+    #: An optional callable which returns the key for an item in the
+    #: iterable. The children created for an item are reused when the
+    #: iterable is refreshed and contains an item with the same key.
+    #: If this is not provided, hashable items are their own key, and
+    #: unhashable items are keyed by their identity.
+    key = d_(Callable())
+
     #: The list of items created by the conditional. Each item in the
     #: list represents one iteration of the loop and is a list of the
     #: items generated during that iteration. This list should not be
     #: manipulated directly by user code.
     items = List()
 
-    #: Private data storage which maps the user iterable data to the
-    #: list of items created for that iteration. This allows the looper
-    #: to only create and destroy the items which have changed.
-    _iter_data = Typed(sortedmap, ())
+    #: Private data storage which holds the key of each iteration in
+    #: the 'items' list. This allows the looper to only create and
+    #: destroy the items which have changed.
+    _iter_keys = List()
+
+    #: Private data storage which holds the local scopes of each
+    #: iteration in the 'items' list. The scopes of a reused iteration
+    #: are updated with its new 'loop_index' and 'loop_item'.
+    _iter_scopes = List()
 
     #--------------------------------------------------------------------------
     # Lifetime API
@@ -58,7 +75,8 @@ class Looper(Pattern):
         super(Looper, self).destroy()
         del self.iterable
         del self.items
-        del self._iter_data
+        del self._iter_keys
+        del self._iter_scopes
 
     #--------------------------------------------------------------------------
     # Observers
@@ -73,6 +91,22 @@ class Looper(Pattern):
         if change['type'] == 'update' and self.is_initialized:
             self.refresh_items()
 
+    #--------------------------------------------------------------------------
+    # Private API
+    #--------------------------------------------------------------------------
+    def _item_key(self, item):
+        """ Get the key to use for an item in the iterable.
+
+        """
+        key = self.key
+        if key is not None:
+            return key(item)
+        try:
+            hash(item)
+        except TypeError:
+            return (_unhashable, id(item))
+        return item
+
     #--------------------------------------------------------------------------
     # Pattern API
     #--------------------------------------------------------------------------
@@ -80,37 +114,63 @@ class Looper(Pattern):
         """ Get a list of items created by the pattern.
 
         """
-        return sum(self.items, [])
+        return [item for iteration in self.items for item in iteration]
 
     def refresh_items(self):
         """ Refresh the items of the pattern.
 
-        This method destroys the old items and creates and initializes
-        the new items.
+        This method reuses the old items whose key is still present in
+        the iterable, destroys the rest, and creates the new items. The
+        refresh is performed in time linear in the size of the iterable.
 
         """
-        old_items = self.items[:]
-        old_iter_data = self._iter_data
+        # Map the key for each old iteration to the list of iterations
+        # for that key. The lists are reversed so that duplicate keys
+        # are reused in their original order by popping from the end.
+        old_iter_data = {}
+        old_iters = zip(self._iter_keys, self.items, self._iter_scopes)
+        for iter_key, iteration, scopes in old_iters:
+            old_iter_data.setdefault(iter_key, []).append((iteration, scopes))
+        for iterations in old_iter_data.itervalues():
+            iterations.reverse()
+
         iterable = self.iterable
         pattern_nodes = self.pattern_nodes
-        new_iter_data = sortedmap()
+        item_key = self._item_key
+        new_iter_keys = []
         new_items = []
+        new_iter_scopes = []
+        stale = []
 
         if iterable and len(pattern_nodes) > 0:
             for loop_index, loop_item in enumerate(iterable):
-                iteration = old_iter_data.get(loop_item)
-                if iteration is not None:
-                    new_iter_data[loop_item] = iteration
+                iter_key = item_key(loop_item)
+                new_iter_keys.append(iter_key)
+                iterations = old_iter_data.get(iter_key)
+                if iterations:
+                    iteration, scopes = iterations.pop()
                     new_items.append(iteration)
-                    old_items.remove(iteration)
+                    new_iter_scopes.append(scopes)
+                    values = {}
+                    for f_locals in scopes:
+                        if f_locals['loop_index'] != loop_index:
+                            f_locals['loop_index'] = loop_index
+                            values['loop_index'] = loop_index
+                        if f_locals['loop_item'] is not loop_item:
+                            f_locals['loop_item'] = loop_item
+                            values['loop_item'] = loop_item
+                    if values:
+                        stale.append((iteration, scopes, values))
                     continue
                 iteration = []
-                new_iter_data[loop_item] = iteration
+                scopes = []
                 new_items.append(iteration)
+                new_iter_scopes.append(scopes)
                 for nodes, key, f_locals in pattern_nodes:
                     with new_scope(key, f_locals) as f_locals:
                         f_locals['loop_index'] = loop_index
                         f_locals['loop_item'] = loop_item
+                        scopes.append(f_locals)
                         for node in nodes:
                             child = node(None)
                             if isinstance(child, list):
@@ -118,19 +178,119 @@ class Looper(Pattern):
                             else:
                                 iteration.append(child)
 
-        for iteration in old_items:
-            for old in iteration:
-                if not old.is_destroyed:
-                    old.destroy()
+        for iterations in old_iter_data.itervalues():
+            for iteration, scopes in iterations:
+                for old in iteration:
+                    if not old.is_destroyed:
+                        old.destroy()
 
         if len(new_items) > 0:
             expanded = []
-            recursive_expand(sum(new_items, []), expanded)
+            flat = [item for iteration in new_items for item in iteration]
+            recursive_expand(flat, expanded)
             self.parent.insert_children(self, expanded)
 
         self.items = new_items
-        self._iter_data = new_iter_data
+        self._iter_keys = new_iter_keys
+        self._iter_scopes = new_iter_scopes
+
+        # The expressions of a reused iteration are re-read once the
+        # children are in their new positions.
+        for iteration, scopes, values in stale:
+            update_iteration(iteration, scopes, values)
+
+
+def code_uses_names(code, names):
+    """ Get whether a code object loads any of the given names.
+
+    The nested code objects of the code, such as those of lambdas and
+    generator expressions, are searched as well.
+
+    """
+    if not names.isdisjoint(code.co_names):
+        return True
+    for const in code.co_consts:
+        if isinstance(const, CodeType) and code_uses_names(const, names):
+            return True
+    return False
+
+
+def update_iteration(iteration, scopes, values):
+    """ Re-read the expressions which depend on updated loop variables.
+
+    The nested patterns of the iteration, other than loopers which bind
+    their own loop variables, create their items in copies of the
+    iteration scopes. Those copies are updated with the new values as
+    well.
+
+    Parameters
+    ----------
+    iteration : list
+        The list of items created for an iteration of the looper.
+
+    scopes : list
+        The local scopes of the iteration which were updated.
+
+    values : dict
+        The new values of the loop variables which were updated.
+
+    """
+    # Collect the objects of the iteration, including the items of the
+    # nested patterns, which are not children of the pattern.
+    objects = []
+    seen = set()
+    stack = list(iteration)
+    while stack:
+        for obj in stack.pop().traverse():
+            if id(obj) not in seen:
+                seen.add(id(obj))
+                objects.append(obj)
+                if isinstance(obj, Pattern):
+                    stack.extend(obj.pattern_items())
+
+    # Update the scopes copied by the nested patterns. This repeats
+    # until no new copy is found, since a pattern may be nested in the
+    # items of another pattern.
+    scopes = list(scopes)
+    patterns = [
+        obj for obj in objects
+        if isinstance(obj, Pattern) and not isinstance(obj, Looper)
+    ]
+    found = True
+    while found:
+        found = False
+        for pattern in patterns:
+            for nodes, key, f_locals in pattern.pattern_nodes:
+                if not any(f_locals is scope for scope in scopes):
+                    continue
+                for item in pattern.pattern_items():
+                    copy = item._d_storage.get(key)
+                    if copy is None:
+                        continue
+                    if any(copy is scope for scope in scopes):
+                        continue
+                    for name, value in values.iteritems():
+                        copy[name] = value
+                    scopes.append(copy)
+                    found = True
 
+    names = set(values)
+    for obj in objects:
+        engine = getattr(obj, '_d_engine', None)
+        if not engine or obj.is_destroyed:
+            continue
+        storage = obj._d_storage
+        for name, reader in engine.readers():
+            func = getattr(reader, 'func', None)
+            if func is None:
+                continue
+            f_locals = storage.get(getattr(reader, 'scope_key', None))
+            if f_locals is None:
+                continue
+            if not any(f_locals is scope for scope in scopes):
+                continue
+            if code_uses_names(func.func_code, names):
+                engine.update(obj, name)
 
 def recursive_expand(items, expanded):
     """ Recursively expand the list of items created by the looper.
@@ -43,6 +43,85 @@ def flag_property(flag):
     return property(getter, setter)
 
 
+#: The number of objects with an enabled name index. The maintenance
+#: of the indexes is skipped entirely while this is zero.
+_index_count = 0
+
+
+def _ancestor_indexes(obj):
+    """ Get the name indexes of an object and its ancestors.
+
+    """
+    indexes = []
+    while obj is not None:
+        index = obj._name_index
+        if index is not None:
+            indexes.append(index)
+        obj = obj._parent
+    return indexes
+
+
+def _index_subtree(indexes, root):
+    """ Add the named objects of a subtree to name indexes.
+
+    """
+    for obj in root.traverse():
+        name = obj.name
+        if name:
+            for index in indexes:
+                objs = index.get(name)
+                if objs is None:
+                    index[name] = set([obj])
+                else:
+                    objs.add(obj)
+
+
+def _unindex_subtree(indexes, root):
+    """ Remove the named objects of a subtree from name indexes.
+
+    The names are read from the member slots, so that a name which has
+    not been computed is not computed only to be removed.
+
+    """
+    for obj in root.traverse():
+        name = type(obj).name.get_slot(obj)
+        if name:
+            for index in indexes:
+                objs = index.get(name)
+                if objs is not None:
+                    objs.discard(obj)
+                    if not objs:
+                        del index[name]
+
+
+def _bfs_sorted(root, objs):
+    """ Sort objects in the subtree of a root into breadth first order.
+
+    Objects which are not in the subtree of the root are dropped.
+
+    """
+    positions = {}
+    keyed = []
+    for obj in objs:
+        path = []
+        node = obj
+        while node is not root:
+            parent = node._parent
+            if parent is None:
+                break
+            pos = positions.get(parent)
+            if pos is None:
+                pos = dict((id(c), i) for i, c in enumerate(parent._children))
+                positions[parent] = pos
+            path.append(pos[id(node)])
+            node = parent
+        else:
+            path.reverse()
+            keyed.append((len(path), path, obj))
+    keyed.sort(key=lambda item: item[:2])
+    return [item[2] for item in keyed]
+
+
 class Object(Atom):
     """ The most base class of the Enaml object hierarchy.
 
@@ -80,6 +159,7 @@ class Object(Atom):
     _parent = Value()   # Object or None
     _children = List()  # list of Object
     _flags = Value(0)   # object flags
+    _name_index = Value()  # dict of name -> set of Object, or None
 
     def __init__(self, parent=None, **kwargs):
         """ Initialize an Object.
@@ -110,6 +190,12 @@ class Object(Atom):
         self.is_destroyed = True
         self.destroyed()
         self.unobserve()
+        if _index_count:
+            parent = self._parent
+            if parent is not None and not parent.is_destroyed:
+                _unindex_subtree(_ancestor_indexes(parent), self)
+            if self._name_index is not None:
+                self.disable_name_index()
         for child in self._children:
             child.destroy()
         del self._children
@@ -150,6 +236,11 @@ class Object(Atom):
             raise ValueError('cannot use `self` as Object parent')
         if parent is not None and not isinstance(parent, Object):
             raise TypeError('parent must be an Object or None')
+        if _index_count:
+            if old_parent is not None:
+                _unindex_subtree(_ancestor_indexes(old_parent), self)
+            if parent is not None:
+                _index_subtree(_ancestor_indexes(parent), self)
         self._parent = parent
         self.parent_changed(old_parent, parent)
         if old_parent is not None:
@@ -212,9 +303,15 @@ class Object(Atom):
         if not added:
             new.extend(insert_list)
 
+        indexes = _ancestor_indexes(self) if _index_count else None
         for child in insert_list:
             old_parent = child._parent
             if old_parent is not self:
+                if indexes is not None:
+                    if old_parent is not None:
+                        old_indexes = _ancestor_indexes(old_parent)
+                        _unindex_subtree(old_indexes, child)
+                    _index_subtree(indexes, child)
                 child._parent = self
                 child.parent_changed(old_parent, self)
                 if old_parent is not None:
@@ -270,9 +367,94 @@ class Object(Atom):
         """
         pass
 
+    def _observe_name(self, change):
+        """ Update the name indexes when the name of the object changes.
+
+        """
+        if _index_count:
+            indexes = _ancestor_indexes(self)
+            if indexes:
+                if change['type'] == 'delete':
+                    old = change['value']
+                    new = None
+                else:
+                    old = change.get('oldvalue')
+                    new = change['value']
+                for index in indexes:
+                    if old:
+                        objs = index.get(old)
+                        if objs is not None:
+                            objs.discard(self)
+                            if not objs:
+                                del index[old]
+                    if new:
+                        objs = index.get(new)
+                        if objs is None:
+                            index[new] = set([self])
+                        else:
+                            objs.add(self)
+
     #--------------------------------------------------------------------------
     # Object Tree API
     #--------------------------------------------------------------------------
+    def enable_name_index(self):
+        """ Maintain an index of the names of the objects in the subtree.
+
+        While the index is enabled, `find` and `find_all` on this
+        object or its descendants look up exact names in the index,
+        and match a regex against the indexed names, instead of
+        traversing the tree. The index is updated as objects are
+        reparented, destroyed, and renamed. Adding a subtree to an
+        indexed tree reads the names of all of its objects.
+
+        If the index is already enabled, this is a no-op.
+
+        """
+        global _index_count
+        if self._name_index is None:
+            _index_count += 1
+            index = self._name_index = {}
+            _index_subtree([index], self)
+
+    def disable_name_index(self):
+        """ Discard the name index of the object, if any.
+
+        """
+        global _index_count
+        if self._name_index is not None:
+            _index_count -= 1
+            self._name_index = None
+
+    def _find_indexed(self, name, regex):
+        """ Find the objects with a name using the nearest name index.
+
+        Returns
+        -------
+        result : list or None
+            The matching objects in the subtree in breadth first order,
+            or None if the lookup cannot be answered from an index.
+
+        """
+        if not name and not regex:
+            return None
+        obj = self
+        while obj is not None and obj._name_index is None:
+            obj = obj._parent
+        if obj is None:
+            return None
+        index = obj._name_index
+        if regex:
+            rgx = re.compile(name)
+            if rgx.match(u''):
+                return None
+            objs = []
+            for key, items in index.iteritems():
+                if rgx.match(key):
+                    objs.extend(items)
+        else:
+            objs = index.get(name, ())
+        return _bfs_sorted(self, objs)
+
     def root_object(self):
         """ Get the root object for this hierarchy.
 
@@ -350,6 +532,10 @@ class Object(Atom):
             object is found with the given name.
 
         """
+        if _index_count:
+            found = self._find_indexed(name, regex)
+            if found is not None:
+                return found[0] if found else None
         if regex:
             rgx = re.compile(name)
             match = lambda n: bool(rgx.match(n))
@@ -384,6 +570,10 @@ class Object(Atom):
             list if no objects are found with the given name.
 
         """
+        if _index_count:
+            found = self._find_indexed(name, regex)
+            if found is not None:
+                return found
         if regex:
             rgx = re.compile(name)
             match = lambda n: bool(rgx.match(n))
@@ -46,6 +46,94 @@ def optimize_locals(codelist):
             codelist[idx] = (DELETE_FAST, op_arg)  # py2.6 list comps
 
 
+def simple_code(code):
+    """ Generate the code for a simple function from a code object.
+
+    Parameters
+    ----------
+    code : CodeType
+        The code object created by the Enaml compiler.
+
+    Returns
+    -------
+    result : CodeType
+        A new code object with optimized local variable access.
+
+    """
+    bp_code = Code.from_code(code)
+    optimize_locals(bp_code.code)
+    bp_code.newlocals = False
+    return bp_code.to_code()
+
+
+def tracer_code(code, selective=False):
+    """ Generate the code for a trace function from a code object.
+
+    Parameters
+    ----------
+    code : CodeType
+        The code object created by the Enaml compiler.
+
+    selective : bool, optional
+        Whether to only inject the tracing needed by the StandardTracer.
+        See `inject_tracing` for details. The default is False.
+
+    Returns
+    -------
+    result : CodeType
+        A new code object with optimized local variable access and
+        instrumentation for invoking a code tracer.
+
+    """
+    bp_code = Code.from_code(code)
+    optimize_locals(bp_code.code)
+    bp_code.code = inject_tracing(bp_code.code, selective)
+    bp_code.newlocals = False
+    bp_code.args = ('_[tracer]',) + bp_code.args
+    return bp_code.to_code()
+
+
+def inverter_code(code):
+    """ Generate the code for an inverter function from a code object.
+
+    Parameters
+    ----------
+    code : CodeType
+        The code object created by the Enaml compiler.
+
+    Returns
+    -------
+    result : CodeType
+        A new code object with optimized local variable access and
+        instrumentation for inverting the operation.
+
+    """
+    bp_code = Code.from_code(code)
+    optimize_locals(bp_code.code)
+    bp_code.code = inject_inversion(bp_code.code)
+    bp_code.newlocals = False
+    bp_code.args = ('_[inverter]', '_[value]') + bp_code.args
+    return bp_code.to_code()
+
+
+def standard_tracer_code(code):
+    """ Generate the code for a StandardTracer trace function.
+
+    Parameters
+    ----------
+    code : CodeType
+        The code object created by the Enaml compiler.
+
+    Returns
+    -------
+    result : CodeType
+        A new code object with optimized local variable access and
+        selective instrumentation for invoking a StandardTracer.
+
+    """
+    return tracer_code(code, selective=True)
+
+
 def gen_simple(code, f_globals):
     """ Generate a simple function from a code object.
 
@@ -63,14 +151,10 @@ def gen_simple(code, f_globals):
         A new function with optimized local variable access.
 
     """
-    bp_code = Code.from_code(code)
-    optimize_locals(bp_code.code)
-    bp_code.newlocals = False
-    new_code = bp_code.to_code()
-    return FunctionType(new_code, f_globals)
+    return FunctionType(simple_code(code), f_globals)
 
 
-def gen_tracer(code, f_globals):
+def gen_tracer(code, f_globals, selective=False):
     """ Generate a trace function from a code object.
 
     Parameters
@@ -81,6 +165,10 @@ def gen_tracer(code, f_globals):
     f_globals : dict
         The global scope for the returned function.
 
+    selective : bool, optional
+        Whether to only inject the tracing needed by the StandardTracer.
+        See `inject_tracing` for details. The default is False.
+
     Returns
     -------
     result : FunctionType
@@ -88,13 +176,7 @@ def gen_tracer(code, f_globals):
         and instrumentation for invoking a code tracer.
 
     """
-    bp_code = Code.from_code(code)
-    optimize_locals(bp_code.code)
-    bp_code.code = inject_tracing(bp_code.code)
-    bp_code.newlocals = False
-    bp_code.args = ('_[tracer]',) + bp_code.args
-    new_code = bp_code.to_code()
-    return FunctionType(new_code, f_globals)
+    return FunctionType(tracer_code(code, selective), f_globals)
 
 
 def gen_inverter(code, f_globals):
@@ -115,13 +197,7 @@ def gen_inverter(code, f_globals):
         and instrumentation for inverting the operation.
 
     """
-    bp_code = Code.from_code(code)
-    optimize_locals(bp_code.code)
-    bp_code.code = inject_inversion(bp_code.code)
-    bp_code.newlocals = False
-    bp_code.args = ('_[inverter]', '_[value]') + bp_code.args
-    new_code = bp_code.to_code()
-    return FunctionType(new_code, f_globals)
+    return FunctionType(inverter_code(code), f_globals)
 
 
 def op_simple(code, scope_key, f_globals):
@@ -206,7 +282,7 @@ def op_subscribe(code, scope_key, f_globals):
         A pair with the reader set to a StandardTracedReadHandler.
 
     """
-    func = gen_tracer(code, f_globals)
+    func = gen_tracer(code, f_globals, selective=True)
     reader = StandardTracedReadHandler(func=func, scope_key=scope_key)
     return HandlerPair(reader=reader)
 
@@ -278,6 +354,96 @@ DEFAULT_OPERATORS = {
 }
 
 
+#: The generators of the code objects for each standard operator. The
+#: compiler uses these to precompile the code for a binding, so that
+#: the module cache holds the instrumented code.
+PRECOMPILERS = {
+    '=': (simple_code,),
+    '::': (simple_code,),
+    '>>': (inverter_code,),
+    '<<': (standard_tracer_code,),
+    ':=': (standard_tracer_code, inverter_code),
+}
+
+
+def precompile_operator(op, code):
+    """ Generate the code objects for a standard operator.
+
+    Parameters
+    ----------
+    op : str
+        The operator for the binding.
+
+    code : CodeType
+        The code object created by the Enaml compiler.
+
+    Returns
+    -------
+    result : tuple or None
+        The tuple of generated code objects for the standard operator
+        function, or None if the code cannot be precompiled. In that
+        case, any error is raised when the operator is run.
+
+    """
+    generators = PRECOMPILERS.get(op)
+    if generators is None:
+        return None
+    try:
+        return tuple(gen(code) for gen in generators)
+    except Exception:
+        return None
+
+
+def op_precompiled(op, compiled, scope_key, f_globals):
+    """ Create the handlers for a standard operator from its code.
+
+    This produces the same handlers as the standard operator function,
+    without rewriting any bytecode.
+
+    Parameters
+    ----------
+    op : str
+        The operator for the binding.
+
+    compiled : tuple
+        The code objects generated by `precompile_operator`.
+
+    scope_key : object
+        The block scope key created by the Enaml compiler.
+
+    f_globals : dict
+        The global scope for the for code execution.
+
+    Returns
+    -------
+    result : HandlerPair
+        The handler pair for the operator.
+
+    """
+    func = FunctionType(compiled[0], f_globals)
+    if op == '=':
+        reader = StandardReadHandler(func=func, scope_key=scope_key)
+        return HandlerPair(reader=reader)
+    if op == '::':
+        writer = StandardWriteHandler(func=func, scope_key=scope_key)
+        return HandlerPair(writer=writer)
+    if op == '<<':
+        reader = StandardTracedReadHandler(func=func, scope_key=scope_key)
+        return HandlerPair(reader=reader)
+    if op == '>>':
+        writer = StandardInvertedWriteHandler(func=func, scope_key=scope_key)
+        return HandlerPair(writer=writer)
+    reader = StandardTracedReadHandler(func=func, scope_key=scope_key)
+    func = FunctionType(compiled[1], f_globals)
+    writer = StandardInvertedWriteHandler(func=func, scope_key=scope_key)
+    return HandlerPair(reader=reader, writer=writer)
+
+
+#: The standard operator functions. A precompiled binding is only used
+#: when the operator function in effect is the standard function.
+STANDARD_OPERATORS = DEFAULT_OPERATORS.copy()
+
+
 #: The internal stack of operators pushed by the operator context.
 __operator_stack = []
 
@@ -0,0 +1,276 @@
+#------------------------------------------------------------------------------
+# Copyright (c) 2013, Nucleic Development Team.
+#
+# Distributed under the terms of the Modified BSD License.
+#
+# The full license is in the file COPYING.txt, distributed with this software.
+#------------------------------------------------------------------------------
+""" A service which parses Enaml source with a persistent AST cache.
+
+The parsed Enaml ast for a source is cached in pickled form, keyed by a
+hash of the source, in memory and optionally in a cache directory. A
+cache hit costs a hash and an unpickle instead of a run of the lexer
+and parser. Each hit returns a fresh ast, so the compiler is free to
+modify the nodes it is given. Files can also be parsed in a pool of
+worker processes.
+
+Example
+-------
+>>> from enaml.core.parse_service import ParseService
+>>> service = ParseService(cache_dir='/tmp/enaml-ast')
+>>> asts = service.parse_files(paths, jobs=4)
+
+"""
+import cPickle
+import hashlib
+import multiprocessing
+import os
+import sys
+
+from enaml.lrucache import LRUCache
+from enaml.version import version_info
+
+from .atomic_write import write_atomic
+from .parser import parse
+
+
+#: The tag which identifies the format of the pickled asts. It changes
+#: with the Python and Enaml versions, either of which may change the
+#: structure of the ast.
+AST_TAG = 'enaml-ast-py%s%s-v%s%s%s' % (sys.version_info[:2] + version_info)
+
+#: The default maximum number of bytes of pickled asts held in memory.
+DEFAULT_MEMORY_BYTES = 32 * 1024 * 1024
+
+
+def source_digest(src):
+    """ Get the cache key for Enaml source code.
+
+    Parameters
+    ----------
+    src : string
+        The Enaml source code.
+
+    Returns
+    -------
+    result : string
+        The hex digest of the source code and the ast tag.
+
+    """
+    digest = hashlib.sha1(AST_TAG)
+    digest.update('\0')
+    digest.update(src)
+    return digest.hexdigest()
+
+
+class ParseService(object):
+    """ An object which parses Enaml source with an ast cache.
+
+    """
+    def __init__(self, cache_dir=None, max_bytes=DEFAULT_MEMORY_BYTES):
+        """ Initialize a ParseService.
+
+        Parameters
+        ----------
+        cache_dir : string, optional
+            The directory in which to persist the pickled asts. If not
+            given, the asts are only cached in memory.
+
+        max_bytes : int, optional
+            The maximum number of bytes of pickled asts to hold in
+            memory. The default is 32MB.
+
+        """
+        self.cache_dir = cache_dir
+        self._memory = LRUCache(max_bytes)
+        self._parsed = 0
+        self._disk_hits = 0
+
+    def parse(self, src, filename='Enaml'):
+        """ Parse Enaml source code into an Enaml ast.
+
+        Syntax warnings are only emitted when the source is actually
+        parsed, and not when the ast is loaded from the cache.
+
+        Parameters
+        ----------
+        src : string
+            The Enaml source code to parse.
+
+        filename : string, optional
+            The filename to use in syntax errors and warnings.
+
+        Returns
+        -------
+        result : Module
+            The Enaml ast for the source.
+
+        """
+        digest = source_digest(src)
+        data = self._load(digest)
+        if data is None:
+            data = self._parse(digest, src, filename)
+        return cPickle.loads(data)
+
+    def parse_file(self, path):
+        """ Parse an Enaml file into an Enaml ast.
+
+        Parameters
+        ----------
+        path : string
+            The path to the .enaml file.
+
+        Returns
+        -------
+        result : Module
+            The Enaml ast for the file.
+
+        """
+        with open(path, 'rU') as src_file:
+            src = src_file.read()
+        return self.parse(src, path)
+
+    def parse_files(self, paths, jobs=1):
+        """ Parse a sequence of Enaml files into Enaml asts.
+
+        Files which are not in the cache are parsed in a pool of worker
+        processes when more than one job is requested. The first error
+        raised for a file is propagated.
+
+        Parameters
+        ----------
+        paths : iterable
+            The paths to the .enaml files.
+
+        jobs : int, optional
+            The number of worker processes to use. A value of zero uses
+            one process per cpu. The default is 1.
+
+        Returns
+        -------
+        result : list
+            The Enaml asts for the files, in the order of the paths.
+
+        """
+        paths = list(paths)
+        datas = [None] * len(paths)
+        work = []
+        for index, path in enumerate(paths):
+            with open(path, 'rU') as src_file:
+                src = src_file.read()
+            digest = source_digest(src)
+            data = self._load(digest)
+            if data is None:
+                work.append((index, digest, src, path))
+            else:
+                datas[index] = data
+
+        if jobs == 0:
+            jobs = multiprocessing.cpu_count()
+        jobs = min(jobs, len(work))
+        if jobs > 1:
+            pool = multiprocessing.Pool(jobs)
+            try:
+                args = [(src, path) for _, _, src, path in work]
+                results = pool.map(_parse_pickled, args)
+            finally:
+                pool.close()
+                pool.join()
+            for (index, digest, _, _), data in zip(work, results):
+                self._parsed += 1
+                self._store(digest, data)
+                datas[index] = data
+        else:
+            for index, digest, src, path in work:
+                datas[index] = self._parse(digest, src, path)
+
+        return [cPickle.loads(data) for data in datas]
+
+    def info(self):
+        """ Get the statistics for the service.
+
+        Returns
+        -------
+        result : dict
+            A dict with the number of sources 'parsed', the number of
+            'disk_hits', and the 'memory' statistics of the in-memory
+            cache as returned by `LRUCache.info`.
+
+        """
+        return {
+            'parsed': self._parsed,
+            'disk_hits': self._disk_hits,
+            'memory': self._memory.info(),
+        }
+
+    def clear(self):
+        """ Clear the in-memory cache and reset the statistics.
+
+        The cache directory is not modified.
+
+        """
+        self._memory.clear()
+        self._parsed = 0
+        self._disk_hits = 0
+
+    #--------------------------------------------------------------------------
+    # Private API
+    #--------------------------------------------------------------------------
+    def _cache_path(self, digest):
+        """ Get the path to the cache file for a digest.
+
+        """
+        fn = ''.join((digest, '.', AST_TAG, os.path.extsep, 'enamlast'))
+        return os.path.join(self.cache_dir, fn)
+
+    def _load(self, digest):
+        """ Load the pickled ast for a digest from the caches.
+
+        Returns None if the ast is not cached.
+
+        """
+        data = self._memory.get(digest)
+        if data is None and self.cache_dir is not None:
+            try:
+                with open(self._cache_path(digest), 'rb') as cache_file:
+                    data = cache_file.read()
+            except (OSError, IOError):
+                return None
+            self._disk_hits += 1
+            self._memory.set(digest, data, len(data))
+        return data
+
+    def _store(self, digest, data):
+        """ Store the pickled ast for a digest in the caches.
+
+        Errors writing the cache directory are suppressed.
+
+        """
+        self._memory.set(digest, data, len(data))
+        if self.cache_dir is None:
+            return
+        try:
+            write_atomic(self._cache_path(digest), data)
+        except (OSError, IOError):
+            pass
+
+    def _parse(self, digest, src, filename):
+        """ Parse the source and store the pickled ast in the caches.
+
+        """
+        data = _parse_pickled((src, filename))
+        self._parsed += 1
+        self._store(digest, data)
+        return data
+
+
+def _parse_pickled(args):
+    """ Parse Enaml source and return the pickled ast.
+
+    This is the worker function for the process pool.
+
+    """
+    src, filename = args
+    ast = parse(src, filename=filename)
+    return cPickle.dumps(ast, cPickle.HIGHEST_PROTOCOL)
+
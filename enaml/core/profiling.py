@@ -0,0 +1,215 @@
+#------------------------------------------------------------------------------
+# Copyright (c) 2013, Nucleic Development Team.
+#
+# Distributed under the terms of the Modified BSD License.
+#
+# The full license is in the file COPYING.txt, distributed with this software.
+#------------------------------------------------------------------------------
+""" An opt-in profiler for the bound expressions of the standard operators.
+
+When enabled, every execution of a standard expression handler records
+the call count, the cumulative and maximum time, and the size of the
+traced dependencies for '<<' expressions. The statistics are keyed by
+the declarative class, the attribute name, the handler kind, and the
+source location of the expression. The times are inclusive of any
+nested expression evaluation.
+
+Example
+-------
+>>> from enaml.core import profiling
+>>> profiling.enable()
+>>> # ... exercise the application ...
+>>> profiling.dump_json('bindings.json')
+
+"""
+import json
+from timeit import default_timer
+
+from . import standard_handlers
+from .funchelper import call_func
+
+
+class BindingStats(object):
+    """ The statistics recorded for a single bound expression.
+
+    """
+    __slots__ = ('count', 'total', 'max', 'trace_total', 'trace_max')
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.trace_total = 0
+        self.trace_max = 0
+
+
+class ExpressionProfiler(object):
+    """ A profiler which records the statistics of bound expressions.
+
+    """
+    def __init__(self):
+        """ Initialize an ExpressionProfiler.
+
+        """
+        self.stats = {}
+
+    def profile_call(self, kind, owner, name, func, args, scope, tracer=None):
+        """ Invoke an expression function and record its statistics.
+
+        Parameters
+        ----------
+        kind : str
+            The kind of handler invoking the function.
+
+        owner : Declarative
+            The declarative object on which the expression executes.
+
+        name : str
+            The name of the attribute bound by the expression.
+
+        func : FunctionType
+            The expression function to invoke.
+
+        args : tuple
+            The positional arguments for the function.
+
+        scope : DynamicScope
+            The scope in which to invoke the function.
+
+        tracer : StandardTracer, optional
+            The tracer for a traced expression, if any.
+
+        Returns
+        -------
+        result : object
+            The result of invoking the function.
+
+        """
+        start = default_timer()
+        try:
+            return call_func(func, args, {}, scope)
+        finally:
+            elapsed = default_timer() - start
+            code = func.func_code
+            cls = type(owner)
+            key = (
+                '%s.%s' % (cls.__module__, cls.__name__), name, kind,
+                code.co_filename, code.co_firstlineno,
+            )
+            stats = self.stats.get(key)
+            if stats is None:
+                stats = self.stats[key] = BindingStats()
+            stats.count += 1
+            stats.total += elapsed
+            if elapsed > stats.max:
+                stats.max = elapsed
+            if tracer is not None:
+                size = len(tracer.items)
+                stats.trace_total += size
+                if size > stats.trace_max:
+                    stats.trace_max = size
+
+    def report(self):
+        """ Get a report of the recorded statistics.
+
+        Returns
+        -------
+        result : list
+            A list of dicts, one per bound expression, sorted by the
+            cumulative time in descending order. Times are in seconds.
+
+        """
+        result = []
+        for key, stats in self.stats.iteritems():
+            cls, name, kind, filename, lineno = key
+            count = stats.count
+            result.append({
+                'class': cls,
+                'attribute': name,
+                'kind': kind,
+                'filename': filename,
+                'lineno': lineno,
+                'count': count,
+                'total': stats.total,
+                'max': stats.max,
+                'mean': stats.total / count,
+                'trace_size_mean': float(stats.trace_total) / count,
+                'trace_size_max': stats.trace_max,
+            })
+        result.sort(key=lambda item: item['total'], reverse=True)
+        return result
+
+
+def enable():
+    """ Enable the expression profiler.
+
+    If the profiler is already enabled, the recorded statistics are
+    retained.
+
+    """
+    if standard_handlers._profiler is None:
+        standard_handlers._profiler = ExpressionProfiler()
+
+
+def disable():
+    """ Disable the expression profiler.
+
+    The recorded statistics are discarded.
+
+    """
+    standard_handlers._profiler = None
+
+
+def is_enabled():
+    """ Get whether the expression profiler is enabled.
+
+    """
+    return standard_handlers._profiler is not None
+
+
+def reset():
+    """ Discard the statistics recorded by an enabled profiler.
+
+    """
+    profiler = standard_handlers._profiler
+    if profiler is not None:
+        profiler.stats.clear()
+
+
+def report():
+    """ Get a report of the statistics recorded by the profiler.
+
+    Returns
+    -------
+    result : list
+        The list of dicts returned by `ExpressionProfiler.report`, or
+        an empty list if the profiler is not enabled.
+
+    """
+    profiler = standard_handlers._profiler
+    if profiler is None:
+        return []
+    return profiler.report()
+
+
+def dump_json(target, limit=None):
+    """ Dump the profiler report as JSON.
+
+    Parameters
+    ----------
+    target : str or file-like
+        The path of the file to write, or a file-like object.
+
+    limit : int, optional
+        The maximum number of the most expensive expressions to dump.
+        The default dumps all expressions.
+
+    """
+    items = report()
+    if limit is not None:
+        items = items[:limit]
+    if isinstance(target, basestring):
+        with open(target, 'w') as f:
+            json.dump(items, f, indent=2)
+    else:
+        json.dump(items, target, indent=2)
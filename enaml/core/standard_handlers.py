@@ -16,6 +16,11 @@ from .standard_inverter import StandardInverter
 from .standard_tracer import StandardTracer
 
 
+#: The active expression profiler, or None if profiling is disabled.
+#: This is managed by the functions in the `profiling` module.
+_profiler = None
+
+
 class HandlerMixin(Atom):
     """ A mixin class which provides common handler functionality.
 
@@ -61,6 +66,8 @@ class StandardReadHandler(ReadHandler, HandlerMixin):
         f_builtins = f_globals['__builtins__']
         f_locals = self.get_locals(owner)
         scope = DynamicScope(owner, f_locals, f_globals, f_builtins)
+        if _profiler is not None:
+            return _profiler.profile_call('read', owner, name, func, (), scope)
         return call_func(func, (), {}, scope)
 
 
@@ -79,6 +86,9 @@ class StandardWriteHandler(WriteHandler, HandlerMixin):
         f_builtins = f_globals['__builtins__']
         f_locals = self.get_locals(owner)
         scope = DynamicScope(owner, f_locals, f_globals, f_builtins, change)
+        if _profiler is not None:
+            _profiler.profile_call('write', owner, name, func, (), scope)
+            return
         call_func(func, (), {}, scope)
 
 
@@ -98,6 +108,10 @@ class StandardTracedReadHandler(ReadHandler, HandlerMixin):
         f_locals = self.get_locals(owner)
         tr = StandardTracer(owner, name)
         scope = DynamicScope(owner, f_locals, f_globals, f_builtins, None, tr)
+        if _profiler is not None:
+            return _profiler.profile_call(
+                'traced read', owner, name, func, (tr,), scope, tr
+            )
         return call_func(func, (tr,), {}, scope)
 
 
@@ -117,4 +131,9 @@ class StandardInvertedWriteHandler(WriteHandler, HandlerMixin):
         f_locals = self.get_locals(owner)
         scope = DynamicScope(owner, f_locals, f_globals, f_builtins)
         inverter = StandardInverter(scope)
-        call_func(func, (inverter, change['value']), {}, scope)
+        args = (inverter, change['value'])
+        if _profiler is not None:
+            kind = 'inverted write'
+            _profiler.profile_call(kind, owner, name, func, args, scope)
+            return
+        call_func(func, args, {}, scope)
@@ -9,15 +9,16 @@ from atom.api import Atom, atomref
 
 from .alias import Alias
 from .code_tracing import CodeTracer
+from .update_batch import active_batch
 
 
 class SubscriptionObserver(object):
     """ An observer object which manages a tracer subscription.
 
     """
-    __slots__ = ('ref', 'name')
+    __slots__ = ('ref', 'name', 'items')
 
-    def __init__(self, owner, name):
+    def __init__(self, owner, name, items=None):
         """ Initialize a SubscriptionObserver.
 
         Parameters
@@ -28,9 +29,14 @@ class SubscriptionObserver(object):
         name : string
             The name to which the operator is bound.
 
+        items : set, optional
+            The set of (obj, name) pairs to which the observer is
+            subscribed.
+
         """
         self.ref = atomref(owner)
         self.name = name
+        self.items = items
 
     def __nonzero__(self):
         """ The notifier is valid when it has an internal owner.
@@ -45,10 +51,16 @@ class SubscriptionObserver(object):
         """ The handler for the change notification.
 
         This will be invoked by the Atom observer mechanism when the
-        item which is being observed changes.
+        item which is being observed changes. If an update batch is
+        active, the update is added to the batch instead of being run
+        immediately.
 
         """
         if self.ref:
+            batch = active_batch()
+            if batch is not None:
+                batch.add(self)
+                return
             owner = self.ref()
             engine = owner._d_engine
             if engine is not None:
@@ -99,25 +111,42 @@ class StandardTracer(CodeTracer):
     def finalize(self):
         """ Finalize the tracing process.
 
-        This method will discard the old observer and attach a new
-        observer to the traced dependencies.
+        If the traced dependencies are unchanged from the previous
+        evaluation, the existing observer and subscriptions are reused.
+        Otherwise, the existing observer is unsubscribed from the stale
+        dependencies and subscribed to the new dependencies.
 
         """
         owner = self.owner
         name = self.name
         key = '_[%s|trace]' % name
         storage = owner._d_storage
+        items = self.items
+        observer = storage.get(key)
+
+        # reuse the existing observer if it is still valid
+        if observer is not None and observer:
+            old_items = observer.items
+            if old_items == items:
+                return
+            if items:
+                for obj, d_name in old_items - items:
+                    obj.unobserve(d_name, observer)
+                for obj, d_name in items - old_items:
+                    obj.observe(d_name, observer)
+                observer.items = items
+                return
 
         # invalidate the old observer so that it can be collected
-        old_observer = storage.get(key)
-        if old_observer is not None:
-            old_observer.ref = None
+        if observer is not None:
+            observer.ref = None
+            del storage[key]
 
         # create a new observer and subscribe it to the dependencies
-        if self.items:
-            observer = SubscriptionObserver(owner, name)
+        if items:
+            observer = SubscriptionObserver(owner, name, items)
             storage[key] = observer
-            for obj, d_name in self.items:
+            for obj, d_name in items:
                 obj.observe(d_name, observer)
 
     #--------------------------------------------------------------------------
@@ -0,0 +1,225 @@
+#------------------------------------------------------------------------------
+# Copyright (c) 2013, Nucleic Development Team.
+#
+# Distributed under the terms of the Modified BSD License.
+#
+# The full license is in the file COPYING.txt, distributed with this software.
+#------------------------------------------------------------------------------
+from collections import defaultdict, deque
+from contextlib import contextmanager
+from threading import local
+
+from enaml.application import schedule
+
+
+class UpdateBatch(object):
+    """ An object which collects and coalesces expression updates.
+
+    A batch collects the subscription observers which have been
+    notified of a change. When the batch is flushed, each observer
+    updates its expression once, in an order which ensures that an
+    expression runs after the expressions on which it depends.
+
+    """
+    __slots__ = ('_queue', '_queued')
+
+    def __init__(self):
+        """ Initialize an UpdateBatch.
+
+        """
+        self._queue = []
+        self._queued = set()
+
+    def __len__(self):
+        """ Get the number of observers pending in the batch.
+
+        """
+        return len(self._queue)
+
+    def add(self, observer):
+        """ Add a notified subscription observer to the batch.
+
+        If the observer is already pending in the batch, this is a
+        no-op.
+
+        Parameters
+        ----------
+        observer : SubscriptionObserver
+            The observer which has been notified of a change.
+
+        """
+        queued = self._queued
+        if observer not in queued:
+            queued.add(observer)
+            self._queue.append(observer)
+
+    def flush(self):
+        """ Run the pending updates in the batch.
+
+        The updates are run in dependency order. Any notifications
+        generated while flushing are collected by the batch if it is
+        the active batch, and are run by this flush in a later round.
+
+        """
+        queued = self._queued
+        while self._queue:
+            queue = self._sort(self._queue)
+            self._queue = []
+            for observer in queue:
+                queued.discard(observer)
+                if observer:
+                    owner = observer.ref()
+                    engine = owner._d_engine
+                    if engine is not None:
+                        engine.update(owner, observer.name)
+
+    def _sort(self, queue):
+        """ Sort a queue of observers into dependency order.
+
+        An observer which updates an attribute traced by another
+        observer is ordered before that observer. Observers which form
+        a dependency cycle are run in the order they were notified.
+
+        Parameters
+        ----------
+        queue : list
+            The list of observers in notification order.
+
+        Returns
+        -------
+        result : list
+            The valid observers from the queue in dependency order.
+
+        """
+        valid = [observer for observer in queue if observer]
+        if len(valid) < 2:
+            return valid
+
+        producers = {}
+        for observer in valid:
+            producers[(observer.ref(), observer.name)] = observer
+
+        indegree = dict.fromkeys(valid, 0)
+        dependents = defaultdict(list)
+        for observer in valid:
+            for item in observer.items or ():
+                producer = producers.get(item)
+                if producer is not None and producer is not observer:
+                    dependents[producer].append(observer)
+                    indegree[observer] += 1
+
+        ordered = []
+        ready = deque(o for o in valid if indegree[o] == 0)
+        while ready:
+            observer = ready.popleft()
+            ordered.append(observer)
+            for dependent in dependents[observer]:
+                indegree[dependent] -= 1
+                if indegree[dependent] == 0:
+                    ready.append(dependent)
+
+        if len(ordered) < len(valid):
+            ordered.extend(o for o in valid if indegree[o] > 0)
+
+        return ordered
+
+
+class _BatchState(local):
+    """ The thread local state of the batch contexts.
+
+    """
+    def __init__(self):
+        #: The stack of batches pushed by the batch context.
+        self.stack = []
+
+
+#: The internal per-thread state of the batch contexts.
+__batch_state = _BatchState()
+
+#: The batch which collects updates for the next event loop cycle when
+#: deferred updates are enabled. This is None otherwise.
+__deferred_batch = None
+
+#: Whether updates outside of a batch context are deferred.
+__deferred = False
+
+
+@contextmanager
+def batch_updates():
+    """ Collect the expression updates for the duration of the context.
+
+    Subscription updates which are triggered in the context are
+    collected and run once each, in dependency order, when the context
+    exits. Batch contexts may be nested, in which case the outermost
+    context runs the updates. The batch contexts of each thread are
+    independent.
+
+    """
+    stack = __batch_state.stack
+    if stack:
+        yield stack[-1]
+        return
+    batch = UpdateBatch()
+    stack.append(batch)
+    try:
+        yield batch
+    finally:
+        try:
+            batch.flush()
+        finally:
+            stack.pop()
+
+
+def set_deferred_updates(enabled):
+    """ Set whether updates outside of a batch context are deferred.
+
+    When enabled, subscription updates which are triggered outside of
+    a batch context are collected and run on the next cycle of the
+    event loop via the application scheduler. This is normally set
+    through the `batch_updates` flag of the Application.
+
+    Parameters
+    ----------
+    enabled : bool
+        Whether or not to defer the updates.
+
+    """
+    global __deferred
+    __deferred = enabled
+
+
+def _flush_deferred():
+    """ Flush the deferred batch on the event loop thread.
+
+    """
+    global __deferred_batch
+    batch = __deferred_batch
+    stack = __batch_state.stack
+    stack.append(batch)
+    try:
+        batch.flush()
+    finally:
+        stack.pop()
+        __deferred_batch = None
+
+
+def active_batch():
+    """ Get the batch which should collect the current updates.
+
+    Returns
+    -------
+    result : UpdateBatch or None
+        The batch of the innermost batch context, the deferred batch
+        if updates are deferred, or None if the updates should be run
+        immediately.
+
+    """
+    global __deferred_batch
+    stack = __batch_state.stack
+    if stack:
+        return stack[-1]
+    if __deferred:
+        if __deferred_batch is None:
+            __deferred_batch = UpdateBatch()
+            schedule(_flush_deferred)
+        return __deferred_batch
@@ -11,6 +11,7 @@
 from atom.api import Coerced
 
 from .fontext import Font, FontStyle, FontCaps
+from .lrucache import LRUCache
 
 
 #: A mapping from CSS font style keyword to style enum
@@ -70,15 +71,36 @@ _UNITS = {
 }
 
 
+#: A bounded cache of font string to parsed Font or None.
+_PARSE_CACHE = LRUCache(1024)
+
+#: A sentinel which indicates a parse cache miss.
+_MISSING = object()
+
+
 def parse_font(font):
     """ Parse a CSS3 shorthand font string into an Enaml Font object.
 
+    The parsed fonts are memoized, so equal font strings will share
+    the same Font object while it remains in the parse cache.
+
     Returns
     -------
     result : Font or None
         A font object representing the parsed font. If the string is
         invalid, None will be returned.
 
+    """
+    result = _PARSE_CACHE.get(font, _MISSING)
+    if result is _MISSING:
+        result = _parse_font(font)
+        _PARSE_CACHE.set(font, result)
+    return result
+
+
+def _parse_font(font):
+    """ Parse a font string without the parse cache.
+
     """
     token = []
     tokens = []
@@ -203,8 +225,8 @@ class FontMember(Coerced):
         -----
         When providing a default font value, prefer using a Font object
         directly as this object will be shared among all instances of
-        the class. Using a font string will result in a new Font object
-        being created for each class instance.
+        the class. Using a font string will share the parsed Font object
+        only while it remains in the bounded parse cache.
 
         """
         if factory is None:
@@ -0,0 +1,289 @@
+#------------------------------------------------------------------------------
+# Copyright (c) 2013, Nucleic Development Team.
+#
+# Distributed under the terms of the Modified BSD License.
+#
+# The full license is in the file COPYING.txt, distributed with this software.
+#------------------------------------------------------------------------------
+""" Toolkit independent support for the layout of constraints containers.
+
+The functions in this module implement the parts of a container layout
+which do not depend on a toolkit: the constraints which are generated
+for the items in a layout, the flat tables which are used to lay out
+the items on a resize, and the incremental update of the constraints
+of a layout. A toolkit container supplies its constraints widget and
+container classes, and a function which computes the size hint key of
+a widget.
+
+"""
+from collections import deque
+
+from .layout_helpers import expand_constraints
+
+
+def hard_constraints(d):
+    """ Generate hard constraints for an item.
+
+    These constraints will always be included for an item in a layout.
+
+    """
+    return [d.left >= 0, d.top >= 0, d.width >= 0, d.height >= 0]
+
+
+def can_shrink_in_width(d):
+    """ Get whether a declarative container can shrink in width.
+
+    """
+    shrink = ('ignore', 'weak')
+    return d.resist_width in shrink and d.hug_width in shrink
+
+
+def can_shrink_in_height(d):
+    """ Get whether a declarative container can shrink in height.
+
+    """
+    shrink = ('ignore', 'weak')
+    return d.resist_height in shrink and d.hug_height in shrink
+
+
+def can_expand_in_width(d):
+    """ Get whether a declarative container can expand in width.
+
+    """
+    expand = ('ignore', 'weak')
+    return d.hug_width in expand and d.limit_width in expand
+
+
+def can_expand_in_height(d):
+    """ Get whether a declarative container can expand in height.
+
+    """
+    expand = ('ignore', 'weak')
+    return d.hug_height in expand and d.limit_height in expand
+
+
+def build_layout_table(container, widget_class, container_class):
+    """ Build the layout table for a container.
+
+    A layout table is a pair of flat lists which hold the required
+    objects for laying out the child widgets of a container. The flat
+    table is built in advance (and rebuilt if and when the tree
+    structure changes) so that it's not necessary to perform an
+    expensive tree traversal to layout the children on every resize
+    event.
+
+    Parameters
+    ----------
+    container : object
+        The container proxy which owns the layout.
+
+    widget_class : type
+        The constraints widget proxy class of the toolkit.
+
+    container_class : type
+        The container proxy class of the toolkit.
+
+    Returns
+    -------
+    result : (list, list)
+        The offset table and layout table to use during a resize
+        event.
+
+    """
+    # The offset table is a list of (dx, dy) tuples which are the
+    # x, y offsets of children expressed in the coordinates of the
+    # layout owner container. This owner container may be different
+    # from the parent of the widget, and so the delta offset must
+    # be subtracted from the computed geometry values during layout.
+    # The offset table is updated during a layout pass in breadth
+    # first order.
+    #
+    # The layout table is a flat list of (idx, updater) tuples. The
+    # idx is an index into the offset table where the given child
+    # can find the offset to use for its layout. The updater is a
+    # callable provided by the widget which accepts the dx, dy
+    # offset and will update the layout geometry of the widget.
+    zero_offset = (0, 0)
+    offset_table = [zero_offset]
+    layout_table = []
+    queue = deque((0, child) for child in container.children())
+
+    # Micro-optimization: pre-fetch bound methods and store globals
+    # as locals. This function is not on the code path of a resize
+    # event, but it is on the code path of a relayout. If there
+    # are many children, the queue could potentially grow large.
+    push_offset = offset_table.append
+    push_item = layout_table.append
+    push = queue.append
+    pop = queue.popleft
+    isinst = isinstance
+
+    # The queue yields the items in the tree in breadth-first order
+    # starting with the immediate children of the container. If a
+    # given child is a container that will share its layout, then
+    # the children of that container are added to the queue to be
+    # added to the layout table.
+    running_index = 0
+    while queue:
+        offset_index, item = pop()
+        if isinst(item, widget_class):
+            push_item((offset_index, item.geometry_updater()))
+            push_offset(zero_offset)
+            running_index += 1
+            if isinst(item, container_class):
+                if item.transfer_layout_ownership(container):
+                    for child in item.children():
+                        push((running_index, child))
+
+    return offset_table, layout_table
+
+
+def run_layout_table(offset_table, layout_table):
+    """ Run a layout pass over a layout table.
+
+    This is the layout callback invoked by the layout manager. It
+    calls the geometry updater functions of the layout table.
+
+    Parameters
+    ----------
+    offset_table : list
+        The offset table created by a call to build_layout_table. It
+        is updated in-place during the layout pass.
+
+    layout_table : list
+        The layout table created by a call to build_layout_table.
+
+    """
+    # We explicitly don't use enumerate() to generate the running
+    # index because this function is on the code path of the resize
+    # event and hence called *often*. The entire code path for a
+    # resize event is micro optimized and justified with profiling.
+    running_index = 1
+    for offset_index, updater in layout_table:
+        dx, dy = offset_table[offset_index]
+        new_offset = updater(dx, dy)
+        offset_table[running_index] = new_offset
+        running_index += 1
+
+
+def item_constraints(container, item, container_class):
+    """ Generate the layout constraints for an item in a layout.
+
+    Parameters
+    ----------
+    container : object
+        The container proxy which owns the layout.
+
+    item : object
+        The container, or a proxy from its layout table.
+
+    container_class : type
+        The container proxy class of the toolkit.
+
+    Returns
+    -------
+    result : (list, str)
+        The list of generated casuarius constraints for the item,
+        and the name of the cached constraints member which should
+        be added to the layout along with them.
+
+    """
+    d = item.declaration
+    cns = hard_constraints(d)
+    if item is container:
+        cns.extend(expand_constraints(d, d.layout_constraints()))
+        return cns, 'contents_cns'
+    if isinstance(item, container_class):
+        if item.transfer_layout_ownership(container):
+            cns.extend(expand_constraints(d, d.layout_constraints()))
+            return cns, 'contents_cns'
+        return cns, 'size_hint_cns'
+    cns.extend(expand_constraints(d, d.layout_constraints()))
+    return cns, 'size_hint_cns'
+
+
+def diff_constraints(container, layout_table, cns_table, container_class,
+                     hint_key):
+    """ Compute the constraints changes for a new layout table.
+
+    This function walks over the items in the given layout table and
+    updates the given constraints table in-place. The constraints of
+    an item are regenerated only if the item is new to the layout, if
+    its layout has been invalidated, or if its size hint has changed.
+    The constraints for items which are no longer in the layout are
+    removed.
+
+    Parameters
+    ----------
+    container : object
+        The container proxy which owns the layout.
+
+    layout_table : list
+        The layout table created by a call to build_layout_table.
+
+    cns_table : dict
+        The constraints table for the current layout system. This
+        should be an empty dict when initializing a new layout. The
+        table maps the container and each of the proxies in the layout
+        table to a tuple of (cns, member, hint), where 'cns' is the
+        list of generated constraints, 'member' is the name of the
+        cached constraints member added with them, and 'hint' is the
+        hint key from which that member was generated.
+
+    container_class : type
+        The container proxy class of the toolkit.
+
+    hint_key : callable
+        A callable which takes a proxy and returns a key which
+        identifies its size hint constraints. The size hint constraints
+        are regenerated whenever the value of the key changes.
+
+    Returns
+    -------
+    result : (list, list)
+        The lists of casuarius constraints which should be removed
+        from and added to the layout manager.
+
+    """
+    old_cns = []
+    new_cns = []
+    old_table = cns_table.copy()
+    cns_table.clear()
+
+    items = [container]
+    items.extend(updater.item for _, updater in layout_table)
+    for item in items:
+        entry = old_table.pop(item, None)
+        if entry is None or item.layout_dirty:
+            if entry is not None:
+                cns, member, hint = entry
+                old_cns.extend(cns)
+                old_cns.extend(getattr(item, member))
+            cns, member = item_constraints(container, item, container_class)
+            new_cns.extend(cns)
+            hint = None
+            if member == 'size_hint_cns':
+                # The size hint constraints are refreshed whenever
+                # they are added to the layout. This accounts for
+                # changes in the size hint between relayouts.
+                del item.size_hint_cns
+                hint = hint_key(item)
+            new_cns.extend(getattr(item, member))
+            item.layout_dirty = False
+        else:
+            cns, member, hint = entry
+            if member == 'size_hint_cns':
+                new_hint = hint_key(item)
+                if new_hint != hint:
+                    old_cns.extend(item.size_hint_cns)
+                    del item.size_hint_cns
+                    new_cns.extend(item.size_hint_cns)
+                    hint = new_hint
+        cns_table[item] = (cns, member, hint)
+
+    # Any remaining items have been removed from the layout.
+    for item, (cns, member, hint) in old_table.iteritems():
+        old_cns.extend(cns)
+        old_cns.extend(getattr(item, member))
+
+    return old_cns, new_cns
@@ -0,0 +1,226 @@
+#------------------------------------------------------------------------------
+# Copyright (c) 2013, Nucleic Development Team.
+#
+# Distributed under the terms of the Modified BSD License.
+#
+# The full license is in the file COPYING.txt, distributed with this software.
+#------------------------------------------------------------------------------
+from threading import Lock
+
+
+#: The indices of the fields of a link in the cache list.
+_PREV, _NEXT, _KEY, _VALUE, _COST = 0, 1, 2, 3, 4
+
+
+class LRUCache(object):
+    """ A least recently used cache with a bounded total cost.
+
+    Each entry in the cache has a cost, which defaults to 1. When the
+    total cost of the entries exceeds the maximum cost, the least
+    recently used entries are evicted. With the default entry cost,
+    the maximum cost is the maximum number of entries.
+
+    The entries are kept in a circular doubly linked list in order of
+    use, so that a lookup does not need to reorder a container. The
+    cache may be shared between threads; the updates of the list are
+    guarded by a lock.
+
+    """
+    __slots__ = (
+        '_map', '_root', '_cost', '_max_cost', '_hits', '_misses', '_lock',
+    )
+
+    def __init__(self, max_cost):
+        """ Initialize an LRUCache.
+
+        Parameters
+        ----------
+        max_cost : int
+            The maximum total cost of the entries in the cache.
+
+        """
+        root = []
+        root[:] = [root, root, None, None, 0]
+        self._map = {}
+        self._root = root
+        self._cost = 0
+        self._max_cost = max_cost
+        self._hits = 0
+        self._misses = 0
+        self._lock = Lock()
+
+    def __len__(self):
+        """ Get the number of entries in the cache.
+
+        """
+        return len(self._map)
+
+    def __contains__(self, key):
+        """ Get whether the cache contains an entry for a key.
+
+        This does not affect the recent use of the entry.
+
+        """
+        return key in self._map
+
+    @property
+    def max_cost(self):
+        """ The maximum total cost of the entries in the cache.
+
+        Setting a lower value evicts entries as needed.
+
+        """
+        return self._max_cost
+
+    @max_cost.setter
+    def max_cost(self, max_cost):
+        with self._lock:
+            self._max_cost = max_cost
+            self._evict()
+
+    def get(self, key, default=None):
+        """ Get the value of an entry in the cache.
+
+        A successful lookup marks the entry as the most recently used.
+
+        Parameters
+        ----------
+        key : object
+            The key for the entry.
+
+        default : object, optional
+            The value to return if the key is not in the cache.
+
+        Returns
+        -------
+        result : object
+            The cached value or the default.
+
+        """
+        with self._lock:
+            link = self._map.get(key)
+            if link is None:
+                self._misses += 1
+                return default
+            self._hits += 1
+            root = self._root
+            last = root[_PREV]
+            if link is not last:
+                prev, next = link[_PREV], link[_NEXT]
+                prev[_NEXT] = next
+                next[_PREV] = prev
+                link[_PREV] = last
+                link[_NEXT] = root
+                last[_NEXT] = root[_PREV] = link
+            return link[_VALUE]
+
+    def set(self, key, value, cost=1):
+        """ Set the value of an entry in the cache.
+
+        The entry becomes the most recently used. An entry whose cost
+        exceeds the maximum cost of the cache is not stored.
+
+        Parameters
+        ----------
+        key : object
+            The key for the entry.
+
+        value : object
+            The value to store in the cache.
+
+        cost : int, optional
+            The cost of the entry. The default is 1.
+
+        """
+        with self._lock:
+            self._remove(key)
+            if cost <= self._max_cost:
+                root = self._root
+                last = root[_PREV]
+                link = [last, root, key, value, cost]
+                last[_NEXT] = root[_PREV] = self._map[key] = link
+                self._cost += cost
+                self._evict()
+
+    def pop(self, key, default=None):
+        """ Remove an entry from the cache.
+
+        Parameters
+        ----------
+        key : object
+            The key for the entry.
+
+        default : object, optional
+            The value to return if the key is not in the cache.
+
+        Returns
+        -------
+        result : object
+            The value of the removed entry or the default.
+
+        """
+        with self._lock:
+            link = self._remove(key)
+        if link is None:
+            return default
+        return link[_VALUE]
+
+    def clear(self):
+        """ Remove all entries from the cache and reset the statistics.
+
+        """
+        with self._lock:
+            root = self._root
+            root[:] = [root, root, None, None, 0]
+            self._map.clear()
+            self._cost = 0
+            self._hits = 0
+            self._misses = 0
+
+    def info(self):
+        """ Get the statistics for the cache.
+
+        Returns
+        -------
+        result : dict
+            A dict with the 'hits' and 'misses' of the lookups, and
+            the 'size', 'cost' and 'max_cost' of the cache.
+
+        """
+        with self._lock:
+            return {
+                'hits': self._hits,
+                'misses': self._misses,
+                'size': len(self._map),
+                'cost': self._cost,
+                'max_cost': self._max_cost,
+            }
+
+    def _remove(self, key):
+        """ Unlink the entry for a key from the cache.
+
+        This method must be called with the lock held.
+
+        Returns
+        -------
+        result : list or None
+            The removed link, or None if the key is not in the cache.
+
+        """
+        link = self._map.pop(key, None)
+        if link is not None:
+            prev, next = link[_PREV], link[_NEXT]
+            prev[_NEXT] = next
+            next[_PREV] = prev
+            self._cost -= link[_COST]
+        return link
+
+    def _evict(self):
+        """ Evict the least recently used entries over the maximum cost.
+
+        This method must be called with the lock held.
+
+        """
+        root = self._root
+        while self._cost > self._max_cost and self._map:
+            self._remove(root[_NEXT][_KEY])
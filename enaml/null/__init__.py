@@ -0,0 +1,16 @@
+#------------------------------------------------------------------------------
+# Copyright (c) 2013, Nucleic Development Team.
+#
+# Distributed under the terms of the Modified BSD License.
+#
+# The full license is in the file COPYING.txt, distributed with this software.
+#------------------------------------------------------------------------------
+""" A headless toolkit backend for Enaml.
+
+The null backend implements the toolkit proxies without any windowing
+system. The proxies record the state pushed to them by their
+declarations, and containers run the constraints layout against fixed
+size hints. It is intended for benchmarking and for the instantiation
+of views in environments which have no display.
+
+"""
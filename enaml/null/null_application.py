@@ -0,0 +1,181 @@
+#------------------------------------------------------------------------------
+# Copyright (c) 2013, Nucleic Development Team.
+#
+# Distributed under the terms of the Modified BSD License.
+#
+# The full license is in the file COPYING.txt, distributed with this software.
+#------------------------------------------------------------------------------
+import heapq
+import threading
+from timeit import default_timer
+
+from atom.api import Bool, Int, List, Value
+
+from enaml.application import Application, ProxyResolver
+
+from .null_factories import NULL_FACTORIES
+
+
+class NullApplication(Application):
+    """ A headless implementation of an Enaml application.
+
+    A NullApplication runs an in-process event loop which services the
+    deferred and timed calls of the application. The loop runs until
+    `stop` is called or until no calls remain pending, so that a script
+    which starts the application always returns.
+
+    """
+    #: The heap of pending events. Each event is a tuple of (deadline,
+    #: counter, callback, args, kwargs).
+    _events = List()
+
+    #: A counter which keeps events with the same deadline in order.
+    _event_counter = Int(0)
+
+    #: The condition which guards the events and wakes the loop.
+    _condition = Value(factory=threading.Condition)
+
+    #: Whether the event loop is running.
+    _running = Bool(False)
+
+    #: The identity of the thread which created the application.
+    _thread_id = Value(factory=lambda: threading.current_thread().ident)
+
+    def __init__(self):
+        """ Initialize a NullApplication.
+
+        """
+        super(NullApplication, self).__init__()
+        self.resolver = ProxyResolver(factories=NULL_FACTORIES)
+
+    #--------------------------------------------------------------------------
+    # Abstract API Implementation
+    #--------------------------------------------------------------------------
+    def start(self):
+        """ Start the application's main event loop.
+
+        The loop runs until `stop` is called or until there are no more
+        pending events.
+
+        """
+        if self._running:
+            return
+        self._running = True
+        condition = self._condition
+        try:
+            while self._running:
+                self.process_events()
+                with condition:
+                    events = self._events
+                    if not events or not self._running:
+                        break
+                    delay = events[0][0] - default_timer()
+                    if delay > 0:
+                        condition.wait(delay)
+        finally:
+            self._running = False
+
+    def stop(self):
+        """ Stop the application's main event loop.
+
+        """
+        with self._condition:
+            self._running = False
+            self._condition.notify()
+
+    def deferred_call(self, callback, *args, **kwargs):
+        """ Invoke a callable on the next cycle of the main event loop
+        thread.
+
+        Parameters
+        ----------
+        callback : callable
+            The callable object to execute at some point in the future.
+
+        *args, **kwargs
+            Any additional positional and keyword arguments to pass to
+            the callback.
+
+        """
+        self._post(0, callback, args, kwargs)
+
+    def timed_call(self, ms, callback, *args, **kwargs):
+        """ Invoke a callable on the main event loop thread at a
+        specified time in the future.
+
+        Parameters
+        ----------
+        ms : int
+            The time to delay, in milliseconds, before executing the
+            callable.
+
+        callback : callable
+            The callable object to execute at some point in the future.
+
+        *args, **kwargs
+            Any additional positional and keyword arguments to pass to
+            the callback.
+
+        """
+        self._post(ms, callback, args, kwargs)
+
+    def is_main_thread(self):
+        """ Indicates whether the caller is on the main gui thread.
+
+        Returns
+        -------
+        result : bool
+            True if called from the thread which created the
+            application. False otherwise.
+
+        """
+        return threading.current_thread().ident == self._thread_id
+
+    #--------------------------------------------------------------------------
+    # Public API
+    #--------------------------------------------------------------------------
+    def process_events(self):
+        """ Run the pending events which are due.
+
+        Events which are posted while processing are run as well, if
+        they are due. This can be called by benchmarks and tests to
+        flush the event queue without starting the event loop.
+
+        Returns
+        -------
+        result : int
+            The number of events which were run.
+
+        """
+        count = 0
+        condition = self._condition
+        events = self._events
+        while True:
+            with condition:
+                if not events or events[0][0] > default_timer():
+                    return count
+                event = heapq.heappop(events)
+            _, _, callback, args, kwargs = event
+            callback(*args, **kwargs)
+            count += 1
+
+    def has_pending_events(self):
+        """ Get whether the event loop has pending events.
+
+        """
+        with self._condition:
+            return len(self._events) > 0
+
+    #--------------------------------------------------------------------------
+    # Private API
+    #--------------------------------------------------------------------------
+    def _post(self, ms, callback, args, kwargs):
+        """ Post an event to the event loop.
+
+        """
+        deadline = default_timer() + ms / 1000.0
+        with self._condition:
+            self._event_counter += 1
+            event = (deadline, self._event_counter, callback, args, kwargs)
+            heapq.heappush(self._events, event)
+            self._condition.notify()
@@ -0,0 +1,204 @@
+#------------------------------------------------------------------------------
+# Copyright (c) 2013, Nucleic Development Team.
+#
+# Distributed under the terms of the Modified BSD License.
+#
+# The full license is in the file COPYING.txt, distributed with this software.
+#------------------------------------------------------------------------------
+from atom.api import Bool, List, Tuple
+
+from enaml.application import deferred_call
+from enaml.widgets.constraints_widget import ProxyConstraintsWidget
+
+from .null_widget import NullWidget
+
+
+#: The size hint used for widgets which do not compute one.
+DEFAULT_SIZE_HINT = (80, 24)
+
+
+class NullConstraintsWidget(NullWidget, ProxyConstraintsWidget):
+    """ A null implementation of an Enaml ProxyConstraintsWidget.
+
+    """
+    #: The fixed size hint of the widget, as a (width, height) tuple.
+    #: A negative value means there is no hint for that dimension. The
+    #: size hint constraints are generated from this value.
+    size_hint = Tuple(default=DEFAULT_SIZE_HINT)
+
+    #: The geometry of the widget as computed by the layout, as an
+    #: (x, y, width, height) tuple in the coordinates of its parent.
+    geometry = Tuple(default=(0, 0, -1, -1))
+
+    #: The list of size hint constraints to apply to the widget. These
+    #: constraints are computed once and then cached. If the size hint
+    #: of the widget changes, `size_hint_updated` should be called.
+    size_hint_cns = List()
+
+    #: Whether the layout constraints of the widget have changed since
+    #: they were last added to a layout system. This is used by the
+    #: layout owner to perform an incremental relayout.
+    layout_dirty = Bool(True)
+
+    #: Whether a relayout request is waiting on the event loop.
+    _relayout_pending = Bool(False)
+
+    def _default_size_hint_cns(self):
+        """ Creates the list of size hint constraints for this widget.
+
+        Returns
+        -------
+        result : list
+            A list of casuarius LinearConstraint instances.
+
+        """
+        cns = []
+        width_hint, height_hint = self.layout_size_hint()
+        d = self.declaration
+        if width_hint >= 0:
+            if d.hug_width != 'ignore':
+                cns.append((d.width == width_hint) | d.hug_width)
+            if d.resist_width != 'ignore':
+                cns.append((d.width >= width_hint) | d.resist_width)
+            if d.limit_width != 'ignore':
+                cns.append((d.width <= width_hint) | d.limit_width)
+        if height_hint >= 0:
+            if d.hug_height != 'ignore':
+                cns.append((d.height == height_hint) | d.hug_height)
+            if d.resist_height != 'ignore':
+                cns.append((d.height >= height_hint) | d.resist_height)
+            if d.limit_height != 'ignore':
+                cns.append((d.height <= height_hint) | d.limit_height)
+        return cns
+
+    #--------------------------------------------------------------------------
+    # ProxyConstraintsWidget API
+    #--------------------------------------------------------------------------
+    def request_relayout(self):
+        """ Request a relayout of the proxy widget.
+
+        The requests are collapsed and the relayout is performed on the
+        next cycle of the event loop.
+
+        """
+        self.layout_dirty = True
+        if not self._relayout_pending:
+            self._relayout_pending = True
+            deferred_call(self._on_relayout_requested)
+
+    #--------------------------------------------------------------------------
+    # Public API
+    #--------------------------------------------------------------------------
+    def layout_size_hint(self):
+        """ Get the size hint to use for the layout of the widget.
+
+        Returns
+        -------
+        result : tuple
+            The (width, height) size hint of the widget.
+
+        """
+        return self.size_hint
+
+    def relayout(self):
+        """ Peform a relayout for this constraints widget.
+
+        The call is proxied up the tree of ancestors until it is handled
+        by a container which owns a layout.
+
+        """
+        parent = self.parent()
+        if isinstance(parent, NullConstraintsWidget):
+            parent.relayout()
+
+    def replace_constraints(self, old_cns, new_cns):
+        """ Replace constraints in the current layout system.
+
+        The call is proxied up the tree of ancestors until it is handled
+        by a container which owns a layout.
+
+        Parameters
+        ----------
+        old_cns : list
+            The list of casuarius constraints to remove from the
+            current layout system.
+
+        new_cns : list
+            The list of casuarius constraints to add to the
+            current layout system.
+
+        """
+        parent = self.parent()
+        if isinstance(parent, NullConstraintsWidget):
+            parent.replace_constraints(old_cns, new_cns)
+
+    def size_hint_updated(self):
+        """ Notify the layout system that the size hint has changed.
+
+        """
+        parent = self.parent()
+        if isinstance(parent, NullConstraintsWidget):
+            old_cns = self.size_hint_cns
+            del self.size_hint_cns
+            new_cns = self.size_hint_cns
+            parent.replace_constraints(old_cns, new_cns)
+
+    def set_size_hint(self, size_hint):
+        """ Set the fixed size hint of the widget.
+
+        Parameters
+        ----------
+        size_hint : tuple
+            The new (width, height) size hint.
+
+        """
+        if tuple(size_hint) != self.size_hint:
+            self.size_hint = tuple(size_hint)
+            self.size_hint_updated()
+
+    def set_layout_geometry(self, x, y, width, height):
+        """ Set the geometry of the widget computed by the layout.
+
+        """
+        self.geometry = (x, y, width, height)
+
+    def geometry_updater(self):
+        """ Create a layout function for the widget.
+
+        The returned function takes the (dx, dy) offset of the parent
+        widget from the origin of the layout, updates the geometry of
+        the widget, and returns the computed (x, y) position of the
+        widget in the coordinates of the layout owner.
+
+        """
+        d = self.declaration
+        x = d.left
+        y = d.top
+        width = d.width
+        height = d.height
+        setgeo = self.set_layout_geometry
+
+        def update_geometry(dx, dy):
+            nx = x.value
+            ny = y.value
+            setgeo(
+                int(round(nx - dx)), int(round(ny - dy)),
+                int(round(width.value)), int(round(height.value)),
+            )
+            return nx, ny
+
+        # Store a reference to self on the updater, so that the layout
+        # container can know the object on which the updater operates.
+        update_geometry.item = self
+        return update_geometry
+
+    #--------------------------------------------------------------------------
+    # Private API
+    #--------------------------------------------------------------------------
+    def _on_relayout_requested(self):
+        """ Handle a collapsed relayout request.
+
+        """
+        self._relayout_pending = False
+        if self.declaration is not None:
+            self.relayout()
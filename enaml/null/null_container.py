@@ -0,0 +1,373 @@
+#------------------------------------------------------------------------------
+# Copyright (c) 2013, Nucleic Development Team.
+#
+# Distributed under the terms of the Modified BSD License.
+#
+# The full license is in the file COPYING.txt, distributed with this software.
+#------------------------------------------------------------------------------
+from atom.api import Bool, List, Typed, Value
+
+from casuarius import weak
+
+from enaml.layout.container_layout import (
+    build_layout_table, can_expand_in_height, can_expand_in_width,
+    can_shrink_in_height, can_shrink_in_width, diff_constraints,
+    run_layout_table
+)
+from enaml.layout.layout_manager import LayoutManager
+from enaml.widgets.container import ProxyContainer
+
+from .null_constraints_widget import NullConstraintsWidget
+
+
+#: The size used for a dimension with no maximum.
+MAX_SIZE = 16777215
+
+
+def hint_key(item):
+    """ Get a key which identifies the size hint constraints of an item.
+
+    The size hint constraints of an item must be regenerated whenever
+    the value of this key changes.
+
+    """
+    d = item.declaration
+    return (
+        item.size_hint, d.hug_width, d.hug_height,
+        d.resist_width, d.resist_height, d.limit_width, d.limit_height,
+    )
+
+
+class NullContainer(NullConstraintsWidget, ProxyContainer):
+    """ A null implementation of an Enaml ProxyContainer.
+
+    The container solves the same constraints system as the Qt
+    container, using the fixed size hints of the null widgets. The
+    layout is updated incrementally on a relayout, using the same
+    layout support code as the Qt container.
+
+    """
+    #: A list of the contents constraints for the widget.
+    contents_cns = List()
+
+    #: Whether or not this container owns its layout. A container which
+    #: does not own its layout is not responsible for laying out its
+    #: children on a resize, and will proxy the call to its owner.
+    _owns_layout = Bool(True)
+
+    #: The object which has taken ownership of the layout for this
+    #: container, if any.
+    _layout_owner = Value()
+
+    #: The LayoutManager instance to use for solving the layout system
+    #: for this container.
+    _layout_manager = Value()
+
+    #: The table of offsets to use during a layout pass.
+    _offset_table = List()
+
+    #: The table of (index, updater) pairs to use during a layout pass.
+    _layout_table = List()
+
+    #: The table of constraints which have been added to the layout
+    #: manager. See 'diff_constraints' for the structure of the table.
+    _cns_table = Typed(dict, ())
+
+    def _default_contents_cns(self):
+        """ Create the contents constraints for the container.
+
+        The contents contraints are generated by combining the user
+        padding with the margins returned by 'contents_margins' method.
+
+        Returns
+        -------
+        result : list
+            The list of casuarius constraints for the content.
+
+        """
+        d = self.declaration
+        margins = self.contents_margins()
+        top, right, bottom, left = map(sum, zip(d.padding, margins))
+        cns = [
+            d.contents_top == (d.top + top),
+            d.contents_left == (d.left + left),
+            d.contents_right == (d.left + d.width - right),
+            d.contents_bottom == (d.top + d.height - bottom),
+        ]
+        return cns
+
+    #--------------------------------------------------------------------------
+    # Initialization API
+    #--------------------------------------------------------------------------
+    def init_layout(self):
+        """ Initialize the layout of the widget.
+
+        """
+        super(NullContainer, self).init_layout()
+        self.init_cns_layout()
+
+    def init_cns_layout(self):
+        """ Initialize the constraints layout.
+
+        """
+        # Layout ownership can only be transferred *after* this init
+        # layout method is called, since layout occurs bottom up. So,
+        # we only initialize a layout manager if ownership is unlikely
+        # to be transferred.
+        if not self.will_transfer():
+            offset_table, layout_table = build_layout_table(
+                self, NullConstraintsWidget, NullContainer
+            )
+            cns_table = {}
+            _, new_cns = diff_constraints(
+                self, layout_table, cns_table, NullContainer, hint_key
+            )
+            manager = LayoutManager()
+            manager.initialize(new_cns)
+            self._offset_table = offset_table
+            self._layout_table = layout_table
+            self._cns_table = cns_table
+            self._layout_manager = manager
+            self.set_size_hint(self.compute_best_size())
+
+    def update_cns_layout(self):
+        """ Incrementally update the constraints layout.
+
+        Only the constraints of the added, removed, and invalidated
+        widgets are replaced. If no layout manager exists, a full
+        layout is initialized.
+
+        """
+        manager = self._layout_manager
+        if manager is None:
+            self.init_cns_layout()
+            return
+        offset_table, layout_table = build_layout_table(
+            self, NullConstraintsWidget, NullContainer
+        )
+        cns_table = self._cns_table
+        old_cns, new_cns = diff_constraints(
+            self, layout_table, cns_table, NullContainer, hint_key
+        )
+        manager.replace_constraints(old_cns, new_cns)
+        self._offset_table = offset_table
+        self._layout_table = layout_table
+        self.set_size_hint(self.compute_best_size())
+
+    def destroy(self):
+        """ An overridden destructor method.
+
+        This method breaks the internal reference cycles maintained
+        by the container.
+
+        """
+        del self._layout_table
+        del self._cns_table
+        del self._layout_manager
+        super(NullContainer, self).destroy()
+
+    #--------------------------------------------------------------------------
+    # Public Layout Handling
+    #--------------------------------------------------------------------------
+    def resize(self, width, height):
+        """ Resize the container and update the layout of its children.
+
+        Parameters
+        ----------
+        width : int
+            The new width of the container.
+
+        height : int
+            The new height of the container.
+
+        """
+        x, y, _, _ = self.geometry
+        self.geometry = (x, y, width, height)
+        self.refresh()
+
+    def refresh(self):
+        """ Update the geometry of the widgets in the layout.
+
+        This makes a layout pass over the descendents if this widget
+        owns the responsibility for their layout.
+
+        """
+        manager = self._layout_manager
+        _, _, width, height = self.geometry
+        if self._owns_layout and manager is not None and width >= 0:
+            d = self.declaration
+            manager.layout(self._layout, d.width, d.height, (width, height))
+
+    def relayout(self):
+        """ Rebuild the constraints layout for the widget.
+
+        The layout is updated incrementally. If this object does not
+        own the layout, the call is proxied to the layout owner.
+
+        """
+        if self._owns_layout:
+            self.update_cns_layout()
+            self.refresh()
+        else:
+            self._layout_owner.relayout()
+
+    def replace_constraints(self, old_cns, new_cns):
+        """ Replace constraints in the given layout.
+
+        Parameters
+        ----------
+        old_cns : list
+            The list of casuarius constraints to remove from the
+            the current layout system.
+
+        new_cns : list
+            The list of casuarius constraints to add to the
+            current layout system.
+
+        """
+        if self._owns_layout:
+            manager = self._layout_manager
+            if manager is not None:
+                manager.replace_constraints(old_cns, new_cns)
+                self.set_size_hint(self.compute_best_size())
+                self.refresh()
+        else:
+            self._layout_owner.replace_constraints(old_cns, new_cns)
+
+    def set_layout_geometry(self, x, y, width, height):
+        """ Set the geometry of the container computed by the layout.
+
+        A nested container which owns its layout refreshes the layout
+        of its children when its size changes.
+
+        """
+        old_size = self.geometry[2:]
+        self.geometry = (x, y, width, height)
+        if old_size != (width, height):
+            self.refresh()
+
+    def contents_margins(self):
+        """ Get the contents margins for the container.
+
+        Returns
+        -------
+        result : tuple
+            A tuple of 'top', 'right', 'bottom', 'left' contents
+            margins to use for computing the contents constraints.
+
+        """
+        return (0, 0, 0, 0)
+
+    #--------------------------------------------------------------------------
+    # Private Layout Handling
+    #--------------------------------------------------------------------------
+    def _layout(self):
+        """ The layout callback invoked by the layout manager.
+
+        This iterates over the layout table and calls the geometry
+        updater functions.
+
+        """
+        run_layout_table(self._offset_table, self._layout_table)
+
+    #--------------------------------------------------------------------------
+    # Auxiliary Methods
+    #--------------------------------------------------------------------------
+    def transfer_layout_ownership(self, owner):
+        """ Transfer the layout ownership of this container's children.
+
+        Parameters
+        ----------
+        owner : NullContainer
+            The container which has taken ownership responsibility
+            for laying out the children of this container.
+
+        Returns
+        -------
+        results : bool
+            True if the transfer was allowed, False otherwise.
+
+        """
+        if not self.declaration.share_layout:
+            return False
+        self._owns_layout = False
+        self._layout_owner = owner
+        del self._layout_manager
+        del self._offset_table
+        del self._layout_table
+        del self._cns_table
+        return True
+
+    def will_transfer(self):
+        """ Whether or not the container expects to transfer its layout
+        ownership to its parent.
+
+        """
+        d = self.declaration
+        return d.share_layout and isinstance(self.parent(), NullContainer)
+
+    def compute_min_size(self):
+        """ Calculates the minimum size of the container which would
+        allow all constraints to be satisfied.
+
+        Returns
+        -------
+        result : tuple
+            The (width, height) minimum size, or (-1, -1) if the
+            container does not own its layout.
+
+        """
+        d = self.declaration
+        shrink_w = can_shrink_in_width(d)
+        shrink_h = can_shrink_in_height(d)
+        if shrink_w and shrink_h:
+            return (0, 0)
+        if self._owns_layout and self._layout_manager is not None:
+            w, h = self._layout_manager.get_min_size(d.width, d.height)
+            if shrink_w:
+                w = 0
+            if shrink_h:
+                h = 0
+            return (w, h)
+        return (-1, -1)
+
+    def compute_best_size(self):
+        """ Calculates the best size of the container.
+
+        Returns
+        -------
+        result : tuple
+            The (width, height) best size, or (-1, -1) if the container
+            does not own its layout.
+
+        """
+        if self._owns_layout and self._layout_manager is not None:
+            d = self.declaration
+            w, h = self._layout_manager.get_min_size(d.width, d.height, weak)
+            return (w, h)
+        return (-1, -1)
+
+    def compute_max_size(self):
+        """ Calculates the maximum size of the container which would
+        allow all constraints to be satisfied.
+
+        Returns
+        -------
+        result : tuple
+            The (width, height) maximum size. A dimension with no
+            maximum has the value MAX_SIZE.
+
+        """
+        d = self.declaration
+        expand_w = can_expand_in_width(d)
+        expand_h = can_expand_in_height(d)
+        if expand_w and expand_h:
+            return (MAX_SIZE, MAX_SIZE)
+        if self._owns_layout and self._layout_manager is not None:
+            w, h = self._layout_manager.get_max_size(d.width, d.height)
+            if w < 0 or expand_w:
+                w = MAX_SIZE
+            if h < 0 or expand_h:
+                h = MAX_SIZE
+            return (w, h)
+        return (MAX_SIZE, MAX_SIZE)
@@ -0,0 +1,403 @@
+#------------------------------------------------------------------------------
+# Copyright (c) 2013, Nucleic Development Team.
+#
+# Distributed under the terms of the Modified BSD License.
+#
+# The full license is in the file COPYING.txt, distributed with this software.
+#------------------------------------------------------------------------------
+from .null_proxy import null_proxy
+
+
+def action_factory():
+    from enaml.widgets.action import ProxyAction
+    from .null_toolkit_object import NullToolkitObject
+    return null_proxy(ProxyAction, NullToolkitObject)
+
+
+def action_group_factory():
+    from enaml.widgets.action_group import ProxyActionGroup
+    from .null_toolkit_object import NullToolkitObject
+    return null_proxy(ProxyActionGroup, NullToolkitObject)
+
+
+def calendar_factory():
+    from enaml.widgets.calendar import ProxyCalendar
+    from .null_constraints_widget import NullConstraintsWidget
+    return null_proxy(ProxyCalendar, NullConstraintsWidget)
+
+
+def check_box_factory():
+    from enaml.widgets.check_box import ProxyCheckBox
+    from .null_constraints_widget import NullConstraintsWidget
+    return null_proxy(ProxyCheckBox, NullConstraintsWidget)
+
+
+def color_dialog_factory():
+    from enaml.widgets.color_dialog import ProxyColorDialog
+    from .null_toolkit_object import NullToolkitObject
+    return null_proxy(ProxyColorDialog, NullToolkitObject)
+
+
+def combo_box_factory():
+    from enaml.widgets.combo_box import ProxyComboBox
+    from .null_constraints_widget import NullConstraintsWidget
+    return null_proxy(ProxyComboBox, NullConstraintsWidget)
+
+
+def container_factory():
+    from enaml.widgets.container import ProxyContainer
+    from .null_container import NullContainer
+    return null_proxy(ProxyContainer, NullContainer)
+
+
+def date_selector_factory():
+    from enaml.widgets.date_selector import ProxyDateSelector
+    from .null_constraints_widget import NullConstraintsWidget
+    return null_proxy(ProxyDateSelector, NullConstraintsWidget)
+
+
+def datetime_selector_factory():
+    from enaml.widgets.datetime_selector import ProxyDatetimeSelector
+    from .null_constraints_widget import NullConstraintsWidget
+    return null_proxy(ProxyDatetimeSelector, NullConstraintsWidget)
+
+
+def dialog_factory():
+    from enaml.widgets.dialog import ProxyDialog
+    from .null_window import NullWindow
+    return null_proxy(ProxyDialog, NullWindow)
+
+
+def dock_area_factory():
+    from enaml.widgets.dock_area import ProxyDockArea
+    from .null_constraints_widget import NullConstraintsWidget
+    return null_proxy(ProxyDockArea, NullConstraintsWidget)
+
+
+def dock_item_factory():
+    from enaml.widgets.dock_item import ProxyDockItem
+    from .null_widget import NullWidget
+    return null_proxy(ProxyDockItem, NullWidget)
+
+
+def dock_pane_factory():
+    from enaml.widgets.dock_pane import ProxyDockPane
+    from .null_widget import NullWidget
+    return null_proxy(ProxyDockPane, NullWidget)
+
+
+def dual_slider_factory():
+    from enaml.widgets.dual_slider import ProxyDualSlider
+    from .null_constraints_widget import NullConstraintsWidget
+    return null_proxy(ProxyDualSlider, NullConstraintsWidget)
+
+
+def field_factory():
+    from enaml.widgets.field import ProxyField
+    from .null_constraints_widget import NullConstraintsWidget
+    return null_proxy(ProxyField, NullConstraintsWidget)
+
+
+def file_dialog_factory():
+    from enaml.widgets.file_dialog import ProxyFileDialog
+    from .null_toolkit_object import NullToolkitObject
+    return null_proxy(ProxyFileDialog, NullToolkitObject)
+
+
+def file_dialog_ex_factory():
+    from enaml.widgets.file_dialog_ex import ProxyFileDialogEx
+    from .null_toolkit_object import NullToolkitObject
+    return null_proxy(ProxyFileDialogEx, NullToolkitObject)
+
+
+def flow_area_factory():
+    from enaml.widgets.flow_area import ProxyFlowArea
+    from .null_constraints_widget import NullConstraintsWidget
+    return null_proxy(ProxyFlowArea, NullConstraintsWidget)
+
+
+def flow_item_factory():
+    from enaml.widgets.flow_item import ProxyFlowItem
+    from .null_widget import NullWidget
+    return null_proxy(ProxyFlowItem, NullWidget)
+
+
+def group_box_factory():
+    from enaml.widgets.group_box import ProxyGroupBox
+    from .null_container import NullContainer
+    return null_proxy(ProxyGroupBox, NullContainer)
+
+
+def html_factory():
+    from enaml.widgets.html import ProxyHtml
+    from .null_constraints_widget import NullConstraintsWidget
+    return null_proxy(ProxyHtml, NullConstraintsWidget)
+
+
+def image_view_factory():
+    from enaml.widgets.image_view import ProxyImageView
+    from .null_constraints_widget import NullConstraintsWidget
+    return null_proxy(ProxyImageView, NullConstraintsWidget)
+
+
+def label_factory():
+    from enaml.widgets.label import ProxyLabel
+    from .null_constraints_widget import NullConstraintsWidget
+    return null_proxy(ProxyLabel, NullConstraintsWidget)
+
+
+def list_view_factory():
+    from enaml.widgets.list_view import ProxyListView
+    from .null_constraints_widget import NullConstraintsWidget
+    return null_proxy(ProxyListView, NullConstraintsWidget)
+
+
+def main_window_factory():
+    from enaml.widgets.main_window import ProxyMainWindow
+    from .null_window import NullWindow
+    return null_proxy(ProxyMainWindow, NullWindow)
+
+
+def mdi_area_factory():
+    from enaml.widgets.mdi_area import ProxyMdiArea
+    from .null_constraints_widget import NullConstraintsWidget
+    return null_proxy(ProxyMdiArea, NullConstraintsWidget)
+
+
+def mdi_window_factory():
+    from enaml.widgets.mdi_window import ProxyMdiWindow
+    from .null_widget import NullWidget
+    return null_proxy(ProxyMdiWindow, NullWidget)
+
+
+def menu_factory():
+    from enaml.widgets.menu import ProxyMenu
+    from .null_toolkit_object import NullToolkitObject
+    return null_proxy(ProxyMenu, NullToolkitObject)
+
+
+def menu_bar_factory():
+    from enaml.widgets.menu_bar import ProxyMenuBar
+    from .null_toolkit_object import NullToolkitObject
+    return null_proxy(ProxyMenuBar, NullToolkitObject)
+
+
+def mpl_canvas_factory():
+    from enaml.widgets.mpl_canvas import ProxyMPLCanvas
+    from .null_constraints_widget import NullConstraintsWidget
+    return null_proxy(ProxyMPLCanvas, NullConstraintsWidget)
+
+
+def multiline_field_factory():
+    from enaml.widgets.multiline_field import ProxyMultilineField
+    from .null_constraints_widget import NullConstraintsWidget
+    return null_proxy(ProxyMultilineField, NullConstraintsWidget)
+
+
+def notebook_factory():
+    from enaml.widgets.notebook import ProxyNotebook
+    from .null_constraints_widget import NullConstraintsWidget
+    return null_proxy(ProxyNotebook, NullConstraintsWidget)
+
+
+def object_combo_factory():
+    from enaml.widgets.object_combo import ProxyObjectCombo
+    from .null_constraints_widget import NullConstraintsWidget
+    return null_proxy(ProxyObjectCombo, NullConstraintsWidget)
+
+
+def page_factory():
+    from enaml.widgets.page import ProxyPage
+    from .null_widget import NullWidget
+    return null_proxy(ProxyPage, NullWidget)
+
+
+def popup_view_factory():
+    from enaml.widgets.popup_view import ProxyPopupView
+    from .null_widget import NullWidget
+    return null_proxy(ProxyPopupView, NullWidget)
+
+
+def push_button_factory():
+    from enaml.widgets.push_button import ProxyPushButton
+    from .null_constraints_widget import NullConstraintsWidget
+    return null_proxy(ProxyPushButton, NullConstraintsWidget)
+
+
+def progress_bar_factory():
+    from enaml.widgets.progress_bar import ProxyProgressBar
+    from .null_constraints_widget import NullConstraintsWidget
+    return null_proxy(ProxyProgressBar, NullConstraintsWidget)
+
+
+def radio_button_factory():
+    from enaml.widgets.radio_button import ProxyRadioButton
+    from .null_constraints_widget import NullConstraintsWidget
+    return null_proxy(ProxyRadioButton, NullConstraintsWidget)
+
+
+def raw_widget_factory():
+    from enaml.widgets.raw_widget import ProxyRawWidget
+    from .null_constraints_widget import NullConstraintsWidget
+    return null_proxy(ProxyRawWidget, NullConstraintsWidget)
+
+
+def scintilla_factory():
+    from enaml.scintilla.scintilla import ProxyScintilla
+    from .null_constraints_widget import NullConstraintsWidget
+    return null_proxy(ProxyScintilla, NullConstraintsWidget)
+
+
+def scroll_area_factory():
+    from enaml.widgets.scroll_area import ProxyScrollArea
+    from .null_constraints_widget import NullConstraintsWidget
+    return null_proxy(ProxyScrollArea, NullConstraintsWidget)
+
+
+def separator_factory():
+    from enaml.widgets.separator import ProxySeparator
+    from .null_constraints_widget import NullConstraintsWidget
+    return null_proxy(ProxySeparator, NullConstraintsWidget)
+
+
+def slider_factory():
+    from enaml.widgets.slider import ProxySlider
+    from .null_constraints_widget import NullConstraintsWidget
+    return null_proxy(ProxySlider, NullConstraintsWidget)
+
+
+def spin_box_factory():
+    from enaml.widgets.spin_box import ProxySpinBox
+    from .null_constraints_widget import NullConstraintsWidget
+    return null_proxy(ProxySpinBox, NullConstraintsWidget)
+
+
+def split_item_factory():
+    from enaml.widgets.split_item import ProxySplitItem
+    from .null_widget import NullWidget
+    return null_proxy(ProxySplitItem, NullWidget)
+
+
+def splitter_factory():
+    from enaml.widgets.splitter import ProxySplitter
+    from .null_constraints_widget import NullConstraintsWidget
+    return null_proxy(ProxySplitter, NullConstraintsWidget)
+
+
+def stack_factory():
+    from enaml.widgets.stack import ProxyStack
+    from .null_constraints_widget import NullConstraintsWidget
+    return null_proxy(ProxyStack, NullConstraintsWidget)
+
+
+def stack_item_factory():
+    from enaml.widgets.stack_item import ProxyStackItem
+    from .null_widget import NullWidget
+    return null_proxy(ProxyStackItem, NullWidget)
+
+
+def status_bar_factory():
+    from enaml.widgets.status_bar import ProxyStatusBar
+    from .null_widget import NullWidget
+    return null_proxy(ProxyStatusBar, NullWidget)
+
+
+def status_item_factory():
+    from enaml.widgets.status_item import ProxyStatusItem
+    from .null_toolkit_object import NullToolkitObject
+    return null_proxy(ProxyStatusItem, NullToolkitObject)
+
+
+def table_view_factory():
+    from enaml.widgets.table_view import ProxyTableView
+    from .null_constraints_widget import NullConstraintsWidget
+    return null_proxy(ProxyTableView, NullConstraintsWidget)
+
+
+def time_selector_factory():
+    from enaml.widgets.time_selector import ProxyTimeSelector
+    from .null_constraints_widget import NullConstraintsWidget
+    return null_proxy(ProxyTimeSelector, NullConstraintsWidget)
+
+
+def timer_factory():
+    from enaml.widgets.timer import ProxyTimer
+    from .null_toolkit_object import NullToolkitObject
+    return null_proxy(ProxyTimer, NullToolkitObject)
+
+
+def tool_bar_factory():
+    from enaml.widgets.tool_bar import ProxyToolBar
+    from .null_constraints_widget import NullConstraintsWidget
+    return null_proxy(ProxyToolBar, NullConstraintsWidget)
+
+
+def web_view_factory():
+    from enaml.widgets.web_view import ProxyWebView
+    from .null_constraints_widget import NullConstraintsWidget
+    return null_proxy(ProxyWebView, NullConstraintsWidget)
+
+
+def window_factory():
+    from enaml.widgets.window import ProxyWindow
+    from .null_window import NullWindow
+    return null_proxy(ProxyWindow, NullWindow)
+
+NULL_FACTORIES = {
+    'Action': action_factory,
+    'ActionGroup': action_group_factory,
+    'Calendar': calendar_factory,
+    'CheckBox': check_box_factory,
+    'ColorDialog': color_dialog_factory,
+    'ComboBox': combo_box_factory,
+    'Container': container_factory,
+    'DateSelector': date_selector_factory,
+    'DatetimeSelector': datetime_selector_factory,
+    'Dialog': dialog_factory,
+    'DockArea': dock_area_factory,
+    'DockItem': dock_item_factory,
+    'DockPane': dock_pane_factory,
+    'DualSlider': dual_slider_factory,
+    'Field': field_factory,
+    'FileDialog': file_dialog_factory,
+    'FileDialogEx': file_dialog_ex_factory,
+    'FlowArea': flow_area_factory,
+    'FlowItem': flow_item_factory,
+    'GroupBox': group_box_factory,
+    'Html': html_factory,
+    'ImageView': image_view_factory,
+    'Label': label_factory,
+    'ListView': list_view_factory,
+    'MainWindow': main_window_factory,
+    'MdiArea': mdi_area_factory,
+    'MdiWindow': mdi_window_factory,
+    'Menu': menu_factory,
+    'MenuBar': menu_bar_factory,
+    'MPLCanvas': mpl_canvas_factory,
+    'MultilineField': multiline_field_factory,
+    'Notebook': notebook_factory,
+    'ObjectCombo': object_combo_factory,
+    'Page': page_factory,
+    'PopupView': popup_view_factory,
+    'PushButton': push_button_factory,
+    'ProgressBar': progress_bar_factory,
+    'RadioButton': radio_button_factory,
+    'RawWidget': raw_widget_factory,
+    'Scintilla': scintilla_factory,
+    'ScrollArea': scroll_area_factory,
+    'Separator': separator_factory,
+    'Slider': slider_factory,
+    'SpinBox': spin_box_factory,
+    'SplitItem': split_item_factory,
+    'Splitter': splitter_factory,
+    'Stack': stack_factory,
+    'StackItem': stack_item_factory,
+    'StatusBar': status_bar_factory,
+    'StatusItem': status_item_factory,
+    'TableView': table_view_factory,
+    'TimeSelector': time_selector_factory,
+    'Timer': timer_factory,
+    'ToolBar': tool_bar_factory,
+    'WebView': web_view_factory,
+    'Window': window_factory,
+}
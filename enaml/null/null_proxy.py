@@ -0,0 +1,139 @@
+#------------------------------------------------------------------------------
+# Copyright (c) 2013, Nucleic Development Team.
+#
+# Distributed under the terms of the Modified BSD License.
+#
+# The full license is in the file COPYING.txt, distributed with this software.
+#------------------------------------------------------------------------------
+from enaml.widgets.toolkit_object import ProxyToolkitObject
+
+from .null_toolkit_object import NullToolkitObject
+
+
+#: The query methods of the proxy interfaces which return recorded
+#: state. The values are (name, default) pairs for the state lookup.
+QUERY_METHODS = {
+    'field_text': ('text', u''),
+    'is_active': ('active', False),
+}
+
+#: The cache of generated null proxy classes.
+_NULL_PROXIES = {}
+
+
+def _make_recorder(name):
+    """ Create a 'set_<name>' method which records its value.
+
+    """
+    def recorder(self, value):
+        self.state[name] = value
+    recorder.__name__ = 'set_' + name
+    return recorder
+
+
+def _make_query(name, default):
+    """ Create a query method which returns a recorded value.
+
+    """
+    def query(self):
+        return self.state.get(name, default)
+    return query
+
+
+def _make_activator(active):
+    """ Create a method which records the 'active' state.
+
+    """
+    def activator(self):
+        self.state['active'] = active
+    return activator
+
+
+def _noop(self, *args, **kwargs):
+    """ A proxy method which has no effect in the null backend.
+
+    """
+    pass
+
+
+def _interface_methods(cls):
+    """ Get the names of the methods declared by the proxy interfaces.
+
+    Parameters
+    ----------
+    cls : type
+        The class of interest.
+
+    Returns
+    -------
+    result : set
+        The names of the methods defined by the Proxy* classes in the
+        mro of the class, excluding those of ProxyToolkitObject.
+
+    """
+    names = set()
+    for klass in cls.__mro__:
+        if (not issubclass(klass, ProxyToolkitObject) or
+                issubclass(klass, NullToolkitObject) or
+                klass is ProxyToolkitObject):
+            continue
+        for name, value in klass.__dict__.iteritems():
+            if not name.startswith('_') and callable(value):
+                names.add(name)
+    return names
+
+
+def null_proxy(proxy_class, base):
+    """ Create a null proxy class for a proxy interface.
+
+    The generated class implements every method of the interface which
+    is not already implemented by the null base class. A 'set_<name>'
+    method records its value in the proxy state, a query method such
+    as 'field_text' returns the recorded state, and any other method
+    has no effect.
+
+    Parameters
+    ----------
+    proxy_class : type
+        The ProxyToolkitObject subclass which declares the interface.
+
+    base : type
+        The NullToolkitObject subclass to use as the base class.
+
+    Returns
+    -------
+    result : type
+        The generated null proxy class. The classes are cached, so the
+        same class is returned for the same arguments.
+
+    """
+    key = (proxy_class, base)
+    cls = _NULL_PROXIES.get(key)
+    if cls is not None:
+        return cls
+
+    if issubclass(base, proxy_class):
+        bases = (base,)
+    else:
+        bases = (base, proxy_class)
+    name = 'Null' + proxy_class.__name__[len('Proxy'):]
+    dct = {'__module__': __name__}
+    probe = type(base)(name, bases, {})
+    for attr in _interface_methods(probe):
+        # Methods which are implemented by the null base classes are
+        # retained. The remaining methods are abstract on the interface.
+        owner = next(k for k in probe.__mro__ if attr in k.__dict__)
+        if issubclass(owner, NullToolkitObject):
+            continue
+        if attr in QUERY_METHODS:
+            dct[attr] = _make_query(*QUERY_METHODS[attr])
+        elif attr.startswith('set_'):
+            dct[attr] = _make_recorder(attr[4:])
+        elif attr in ('start', 'stop'):
+            dct[attr] = _make_activator(attr == 'start')
+        else:
+            dct[attr] = _noop
+
+    cls = type(base)(name, bases, dct)
+    _NULL_PROXIES[key] = cls
+    return cls
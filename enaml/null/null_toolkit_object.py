@@ -0,0 +1,120 @@
+#------------------------------------------------------------------------------
+# Copyright (c) 2013, Nucleic Development Team.
+#
+# Distributed under the terms of the Modified BSD License.
+#
+# The full license is in the file COPYING.txt, distributed with this software.
+#------------------------------------------------------------------------------
+from atom.api import Typed
+
+from enaml.widgets.toolkit_object import ProxyToolkitObject
+
+
+#: A cache of the names of the recorded attributes for a proxy class.
+_STATE_NAMES = {}
+
+
+def state_names(cls):
+    """ Get the names of the attributes recorded by a proxy class.
+
+    These are the names for which the class has a 'set_<name>' method.
+
+    Parameters
+    ----------
+    cls : type
+        The NullToolkitObject subclass of interest.
+
+    Returns
+    -------
+    result : tuple
+        The sorted tuple of recorded attribute names.
+
+    """
+    names = _STATE_NAMES.get(cls)
+    if names is None:
+        names = tuple(
+            name[4:] for name in sorted(dir(cls)) if name.startswith('set_')
+        )
+        _STATE_NAMES[cls] = names
+    return names
+
+
+class NullToolkitObject(ProxyToolkitObject):
+    """ A null implementation of an Enaml ProxyToolkitObject.
+
+    A null proxy has no toolkit widget. The values pushed to the proxy
+    by its declaration are recorded in the 'state' dict.
+
+    """
+    #: The state recorded by the proxy, keyed by attribute name.
+    state = Typed(dict, ())
+
+    #--------------------------------------------------------------------------
+    # Initialization API
+    #--------------------------------------------------------------------------
+    def init_state(self):
+        """ Initialize the recorded state of the proxy.
+
+        This method is called during the top-down pass. The default
+        implementation invokes each 'set_<name>' method of the proxy
+        with the value of the corresponding declaration member, in the
+        same way a toolkit proxy initializes its widget.
+
+        """
+        d = self.declaration
+        members = d.members()
+        for name in state_names(type(self)):
+            if name in members:
+                value = getattr(d, name)
+                if value is not None:
+                    getattr(self, 'set_' + name)(value)
+
+    def init_layout(self):
+        """ Initialize the layout of the proxy.
+
+        This method is called during the bottom-up pass. The child
+        proxies will be fully initialized when this is called.
+
+        """
+        pass
+
+    #--------------------------------------------------------------------------
+    # ProxyToolkitObject API
+    #--------------------------------------------------------------------------
+    def activate_top_down(self):
+        """ Activate the proxy for the top-down pass.
+
+        """
+        self.init_state()
+
+    def activate_bottom_up(self):
+        """ Activate the proxy tree for the bottom-up pass.
+
+        """
+        self.init_layout()
+
+    def destroy(self):
+        """ A reimplemented destructor.
+
+        This destructor clears the recorded state.
+
+        """
+        del self.state
+        super(NullToolkitObject, self).destroy()
+
+    #--------------------------------------------------------------------------
+    # Public API
+    #--------------------------------------------------------------------------
+    def record(self, name, value):
+        """ Record a value in the state of the proxy.
+
+        Parameters
+        ----------
+        name : str
+            The name of the recorded attribute.
+
+        value : object
+            The value to record.
+
+        """
+        self.state[name] = value
@@ -0,0 +1,38 @@
+#------------------------------------------------------------------------------
+# Copyright (c) 2013, Nucleic Development Team.
+#
+# Distributed under the terms of the Modified BSD License.
+#
+# The full license is in the file COPYING.txt, distributed with this software.
+#------------------------------------------------------------------------------
+from enaml.widgets.widget import ProxyWidget
+
+from .null_toolkit_object import NullToolkitObject
+
+
+class NullWidget(NullToolkitObject, ProxyWidget):
+    """ A null implementation of an Enaml ProxyWidget.
+
+    """
+    #--------------------------------------------------------------------------
+    # ProxyWidget API
+    #--------------------------------------------------------------------------
+    def ensure_visible(self):
+        """ Ensure the widget is visible.
+
+        """
+        self.record('visible', True)
+
+    def ensure_hidden(self):
+        """ Ensure the widget is hidden.
+
+        """
+        self.record('visible', False)
+
+    def restyle(self):
+        """ Restyle the widget with the current style data.
+
+        The null widget has no style to apply.
+
+        """
+        pass
@@ -0,0 +1,184 @@
+#------------------------------------------------------------------------------
+# Copyright (c) 2013, Nucleic Development Team.
+#
+# Distributed under the terms of the Modified BSD License.
+#
+# The full license is in the file COPYING.txt, distributed with this software.
+#------------------------------------------------------------------------------
+from atom.api import Typed
+
+from enaml.layout.geometry import Pos, Rect, Size
+from enaml.widgets.window import ProxyWindow
+
+from .null_container import NullContainer
+from .null_widget import NullWidget
+
+
+class NullWindow(NullWidget, ProxyWindow):
+    """ A null implementation of an Enaml ProxyWindow.
+
+    The window has no frame, so its client area and frame geometry are
+    the same. The central container is resized to fill the window.
+
+    """
+    #: The geometry of the window client area.
+    rect = Typed(Rect, (-1, -1, -1, -1))
+
+    #--------------------------------------------------------------------------
+    # Initialization API
+    #--------------------------------------------------------------------------
+    def init_layout(self):
+        """ Initialize the layout of the window.
+
+        """
+        super(NullWindow, self).init_layout()
+        d = self.declaration
+        size = d.initial_size
+        if size.width < 0 or size.height < 0:
+            container = self.central_container()
+            if container is not None:
+                size = Size(*container.compute_best_size())
+        pos = d.initial_position
+        x = max(pos.x, 0)
+        y = max(pos.y, 0)
+        self.set_geometry(Rect(x, y, size.width, size.height))
+
+    #--------------------------------------------------------------------------
+    # Public API
+    #--------------------------------------------------------------------------
+    def central_container(self):
+        """ Get the proxy of the central widget of the window.
+
+        Returns
+        -------
+        result : NullContainer or None
+            The proxy for the central widget, or None if the window
+            has no central widget.
+
+        """
+        widget = self.declaration.central_widget()
+        if widget is not None and isinstance(widget.proxy, NullContainer):
+            return widget.proxy
+
+    #--------------------------------------------------------------------------
+    # ProxyWindow API
+    #--------------------------------------------------------------------------
+    def set_title(self, title):
+        """ Set the title of the window.
+
+        """
+        self.record('title', title)
+
+    def set_modality(self, modality):
+        """ Set the modality of the window.
+
+        """
+        self.record('modality', modality)
+
+    def set_icon(self, icon):
+        """ Set the window icon.
+
+        """
+        self.record('icon', icon)
+
+    def position(self):
+        """ Get the position of the of the window.
+
+        """
+        return Pos(self.rect.x, self.rect.y)
+
+    def set_position(self, pos):
+        """ Set the position of the window.
+
+        """
+        x, y = pos
+        r = self.rect
+        self.set_geometry(Rect(x, y, r.width, r.height))
+
+    def size(self):
+        """ Get the size of the window.
+
+        """
+        return Size(self.rect.width, self.rect.height)
+
+    def set_size(self, size):
+        """ Set the size of the window.
+
+        """
+        width, height = size
+        r = self.rect
+        self.set_geometry(Rect(r.x, r.y, width, height))
+
+    def geometry(self):
+        """ Get the geometry of the window.
+
+        """
+        return self.rect
+
+    def set_geometry(self, rect):
+        """ Set the geometry of the window.
+
+        The central container is resized to fill the window.
+
+        """
+        self.rect = rect = Rect(*rect)
+        container = self.central_container()
+        if container is not None and rect.width >= 0:
+            container.resize(rect.width, rect.height)
+
+    def frame_geometry(self):
+        """ Get the geometry of the window.
+
+        """
+        return self.rect
+
+    def minimize(self):
+        """ Minimize the window.
+
+        """
+        self.record('window_state', 'minimized')
+
+    def maximize(self):
+        """ Maximize the window.
+
+        """
+        self.record('window_state', 'maximized')
+
+    def restore(self):
+        """ Restore the window after a minimize or maximize.
+
+        """
+        self.record('window_state', 'normal')
+
+    def send_to_front(self):
+        """ Move the window to the top of the Z order.
+
+        """
+        pass
+
+    def send_to_back(self):
+        """ Move the window to the bottom of the Z order.
+
+        """
+        pass
+
+    def center_on_screen(self):
+        """ Center the window on the screen.
+
+        The null backend has no screen, so this has no effect.
+
+        """
+        pass
+
+    def center_on_widget(self, other):
+        """ Center this window on another widget.
+
+        """
+        pass
+
+    def close(self):
+        """ Close the window.
+
+        """
+        self.record('visible', False)
+        self.declaration._handle_close()
@@ -13,12 +13,15 @@ from enaml.qt.QtCore import Qt, QPoint, QRect, QObject
 from enaml.qt.QtGui import QApplication
 
 from .dock_overlay import DockOverlay
-from .layout_handling import layout_hit_test, plug_frame, iter_containers
+from .layout_handling import (
+    LayoutHitIndex, layout_hit_test, plug_frame, iter_containers
+)
 from .layout_builder import LayoutBuilder
 from .layout_saver import LayoutSaver
 from .proximity_handler import ProximityHandler
 from .q_dock_area import QDockArea
 from .q_dock_container import QDockContainer
+from .q_dock_frame import QDockFrame
 from .q_dock_window import QDockWindow
 from .q_guide_rose import QGuideRose
 
@@ -79,6 +82,17 @@ class DockManager(Atom):
     #: A container monitor which tracks toplevel container changes.
     _container_monitor = Typed(DockContainerMonitor)
 
+    #: The frame being dragged for which the drag cache was built.
+    _drag_frame = Typed(QDockFrame)
+
+    #: The list of (global rect, target) for the potential dock targets
+    #: of the dragged frame, in order of precedence. This is built on
+    #: demand during a drag and is None when not built.
+    _drag_targets = Typed(list)
+
+    #: A mapping of QDockArea to LayoutHitIndex for the dragged frame.
+    _hit_indices = Typed(dict, ())
+
     def _default__container_monitor(self):
         return DockContainerMonitor(self)
 
@@ -126,6 +140,7 @@ class DockManager(Atom):
         """
         if item in self._dock_items:
             return
+        self._clear_drag_cache()
         self._dock_items.add(item)
         item._manager = self
         container = QDockContainer(self, self._dock_area)
@@ -149,6 +164,7 @@ class DockManager(Atom):
         """
         if item not in self._dock_items:
             return
+        self._clear_drag_cache()
         item._manager = None
         for container in self.dock_containers():
             if container.dockItem() is item:
@@ -180,6 +196,7 @@ class DockManager(Atom):
             The DockLayout to apply to the managed area.
 
         """
+        self._clear_drag_cache()
         LayoutBuilder(self)(layout)
 
     def update_layout(self, ops):
@@ -191,6 +208,7 @@ class DockManager(Atom):
             A list of LayoutOp objects to use for updating the layout.
 
         """
+        self._clear_drag_cache()
         builder = LayoutBuilder(self)
         for op in ops:
             builder(op)
@@ -215,6 +233,7 @@ class DockManager(Atom):
                 frame.hide()
         for item in self._dock_items:
             item._manager = None
+        self._clear_drag_cache()
         self._dock_area.setCentralWidget(None)
         self._dock_area.setMaximizedWidget(None)
         del self._dock_area
@@ -286,6 +305,7 @@ class DockManager(Atom):
             the dock manager.
 
         """
+        self._clear_drag_cache()
         self._dock_frames.append(window)
         self._proximity_handler.addFrame(window)
 
@@ -393,6 +413,22 @@ class DockManager(Atom):
             if not handler.hasLinkedFrames(frame):
                 frame.setLinked(False)
 
+    def drag_start_frame(self, frame):
+        """ Handle the start of a drag of a dock frame.
+
+        This method is called by the framework at the appropriate times
+        and should not be called directly by user code. It discards the
+        cached drag geometry. The cache is rebuilt on the first move of
+        the drag, after the frame has been unplugged from its layout.
+
+        Parameters
+        ----------
+        frame : QDockFrame
+            The dock frame which will be dragged by the user.
+
+        """
+        self._clear_drag_cache()
+
     def drag_move_frame(self, frame, target_pos, mouse_pos):
         """ Move the floating frame to the target position.
 
@@ -492,11 +528,14 @@ class DockManager(Atom):
         overlay.hide()
         guide = overlay.guide_at(pos)
         if guide == QGuideRose.Guide.NoGuide:
+            self._clear_drag_cache()
             return
         if self._proximity_handler.hasLinkedFrames(frame):
+            self._clear_drag_cache()
             return
-        builder = LayoutBuilder(self)
         target = self._dock_target(frame, pos)
+        self._clear_drag_cache()
+        builder = LayoutBuilder(self)
         if isinstance(target, QDockArea):
             if target.maximizedWidget() is not None:
                 return
@@ -514,6 +553,14 @@ class DockManager(Atom):
     #--------------------------------------------------------------------------
     # Private API
     #--------------------------------------------------------------------------
+    def _clear_drag_cache(self):
+        """ Discard the cached geometry of the current drag.
+
+        """
+        self._drag_frame = None
+        self._drag_targets = None
+        self._hit_indices.clear()
+
     def _free_container(self, container):
         """ Free the resources attached to the container.
 
@@ -525,6 +572,7 @@ class DockManager(Atom):
             method.
 
         """
+        self._clear_drag_cache()
         item = container.dockItem()
         container.setParent(None)
         container.setDockItem(None)
@@ -542,6 +590,7 @@ class DockManager(Atom):
             The Window which should be cleaned up.
 
         """
+        self._clear_drag_cache()
         window.setParent(None)
         window.setDockArea(None)
         window._manager = None
@@ -589,18 +638,53 @@ class DockManager(Atom):
             The potential dock target for the frame and position.
 
         """
-        for target in self._iter_dock_targets(frame):
-            # Hit test the central pane instead of the entire dock area
-            # so that mouse movement over the dock bars is ignored.
-            if isinstance(target, QDockArea):
-                pane = target.centralPane()
-                local = pane.mapFromGlobal(pos)
-                if pane.rect().contains(local):
-                    return target
-            else:
-                local = target.mapFromGlobal(pos)
-                if target.rect().contains(local):
-                    return target
+        # The target geometry is cached for the duration of the drag.
+        # The floating frames other than the dragged frame and the dock
+        # area do not move or change Z-order while a frame is dragged.
+        if frame is not self._drag_frame:
+            self._clear_drag_cache()
+            self._drag_frame = frame
+        targets = self._drag_targets
+        if targets is None:
+            targets = self._drag_targets = []
+            origin = QPoint(0, 0)
+            for target in self._iter_dock_targets(frame):
+                # Hit test the central pane instead of the entire dock
+                # area so that mouse movement over the dock bars is
+                # ignored.
+                if isinstance(target, QDockArea):
+                    widget = target.centralPane()
+                else:
+                    widget = target
+                rect = QRect(widget.mapToGlobal(origin), widget.size())
+                targets.append((rect, target))
+        for rect, target in targets:
+            if rect.contains(pos):
+                return target
+
+    def _layout_hit_test(self, area, pos):
+        """ Hit test a dock area using the cached layout index.
+
+        Parameters
+        ----------
+        area : QDockArea
+            The dock area of interest.
+
+        pos : QPoint
+            The point of interest expressed in local area coordinates.
+
+        Returns
+        -------
+        result : QWidget or None
+            The relevant dock target under the position, as returned
+            by `layout_hit_test`.
+
+        """
+        indices = self._hit_indices
+        index = indices.get(area)
+        if index is None or not index.is_valid(area):
+            index = indices[area] = LayoutHitIndex(area)
+        return index.hit_test(pos)
 
     def _update_drag_overlay(self, frame, pos):
         """ Update the overlay for a dragged frame.
@@ -626,7 +710,7 @@ class DockManager(Atom):
                 overlay.hide()
                 return
             local = target.mapFromGlobal(pos)
-            widget = layout_hit_test(target, local)
+            widget = self._layout_hit_test(target, local)
             overlay.mouse_over_area(target, widget, local)
         else:
             overlay.hide()
@@ -5,7 +5,9 @@
 #
 # The full license is in the file COPYING.txt, distributed with this software.
 #------------------------------------------------------------------------------
-from enaml.qt.QtCore import Qt, QEvent
+from atom.api import Atom, List, Typed
+
+from enaml.qt.QtCore import Qt, QEvent, QPoint, QRect, QSize
 from enaml.qt.QtGui import QApplication
 
 from .event_types import DockAreaContentsChanged
@@ -182,36 +184,117 @@ def layout_hit_test(area, pos):
         a QDockContainer, QDockTabWidget, or QDockSplitterHandle.
 
     """
-    # Splitter handles have priority. Their active area is smaller
-    # and overlaps that of other widgets. Giving dock containers
-    # priority would make it difficult to hit a splitter reliably.
-    # In certain configurations, there may be more than one handle
-    # in the hit box, in which case the one closest to center wins.
-    hits = []
-    for handle in iter_handles(area):
-        pt = handle.mapFrom(area, pos)
-        rect = handle.rect().adjusted(-20, -20, 20, 20)
-        if rect.contains(pt):
-            dist = (rect.center() - pt).manhattanLength()
-            hits.append((dist, handle))
-    if len(hits) > 0:
-        hits.sort()
-        return hits[0][1]
-
-    # Check for tab widgets next. A tab widget has dock containers,
-    # but should have priority over the dock containers themselves.
-    for tab_widget in iter_tabs(area):
-        pt = tab_widget.mapFrom(area, pos)
-        if tab_widget.rect().contains(pt):
-            return tab_widget
-
-    # Check for QDockContainers last. The are the most common case,
-    # but also have the least precedence compared to the others.
-    for dock_container in iter_containers(area):
-        pt = dock_container.mapFrom(area, pos)
-        if dock_container.rect().contains(pt):
-            if not dock_container.isHidden():  # hidden tab
-                return dock_container
+    return LayoutHitIndex(area).hit_test(pos)
+
+
+class LayoutHitIndex(Atom):
+    """ A snapshot of the dock target geometry of a dock area layout.
+
+    The index stores the rectangles of the splitter handles, the tab
+    widgets, and the visible dock containers of the layout, expressed
+    in area coordinates. Hit testing against the index does not walk
+    the layout tree or map any coordinates. The index does not track
+    changes to the layout; it should be discarded when the layout or
+    its geometry changes.
+
+    """
+    #: The size of the dock area when the index was built.
+    size = Typed(QSize)
+
+    #: The list of (rect, handle) for the splitter handles. The rects
+    #: include the enlarged hit box of the handles.
+    handles = List()
+
+    #: The list of (rect, tab_widget) for the tab widgets.
+    tabs = List()
+
+    #: The list of (rect, container) for the visible dock containers.
+    containers = List()
+
+    def __init__(self, area):
+        """ Initialize a LayoutHitIndex.
+
+        Parameters
+        ----------
+        area : QDockArea
+            The dock area for which to build the index.
+
+        """
+        super(LayoutHitIndex, self).__init__()
+        self.size = area.size()
+        origin = QPoint(0, 0)
+
+        def area_rect(widget):
+            return QRect(widget.mapTo(area, origin), widget.size())
+
+        self.handles = [
+            (area_rect(handle).adjusted(-20, -20, 20, 20), handle)
+            for handle in iter_handles(area)
+        ]
+        self.tabs = [
+            (area_rect(tab_widget), tab_widget)
+            for tab_widget in iter_tabs(area)
+        ]
+        self.containers = [
+            (area_rect(container), container)
+            for container in iter_containers(area)
+            if not container.isHidden()  # hidden tab
+        ]
+
+    def is_valid(self, area):
+        """ Get whether the index is still valid for a dock area.
+
+        This is a cheap check of the area size. It does not detect
+        changes to the layout within an area of the same size.
+
+        Parameters
+        ----------
+        area : QDockArea
+            The dock area for which the index was built.
+
+        """
+        return area.size() == self.size
+
+    def hit_test(self, pos):
+        """ Hit test the index for a relevant dock target.
+
+        Parameters
+        ----------
+        pos : QPoint
+            The point of interest expressed in local area coordinates.
+
+        Returns
+        -------
+        result : QWidget or None
+            The relevant dock target under the position. This will be
+            a QDockContainer, QDockTabWidget, or QDockSplitterHandle.
+
+        """
+        # Splitter handles have priority. Their active area is smaller
+        # and overlaps that of other widgets. Giving dock containers
+        # priority would make it difficult to hit a splitter reliably.
+        # In certain configurations, there may be more than one handle
+        # in the hit box, in which case the one closest to center wins.
+        hits = []
+        for rect, handle in self.handles:
+            if rect.contains(pos):
+                dist = (rect.center() - pos).manhattanLength()
+                hits.append((dist, len(hits), handle))
+        if len(hits) > 0:
+            hits.sort()
+            return hits[0][2]
+
+        # Check for tab widgets next. A tab widget has dock containers,
+        # but should have priority over the dock containers themselves.
+        for rect, tab_widget in self.tabs:
+            if rect.contains(pos):
+                return tab_widget
+
+        # Check for QDockContainers last. The are the most common case,
+        # but also have the least precedence compared to the others.
+        for rect, container in self.containers:
+            if rect.contains(pos):
+                return container
 
 
 #------------------------------------------------------------------------------
@@ -538,6 +538,7 @@ class QDockContainer(QDockFrame):
         """
         if not self.unplug():
             return
+        self.manager().drag_start_frame(self)
         self.postUndockedEvent()
         state = self.frame_state
         state.mouse_title = True
@@ -674,6 +675,7 @@ class QDockContainer(QDockFrame):
             state = self.frame_state
             if state.press_pos is None:
                 state.press_pos = event.pos()
+                self.manager().drag_start_frame(self)
                 return True
         return False
 
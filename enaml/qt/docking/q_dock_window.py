@@ -434,6 +434,7 @@ class QDockWindow(QDockFrame):
             state = self.frame_state
             if state.press_pos is None:
                 state.press_pos = event.pos()
+                self.manager().drag_start_frame(self)
                 return True
         return False
 
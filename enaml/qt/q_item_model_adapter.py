@@ -0,0 +1,251 @@
+#------------------------------------------------------------------------------
+# Copyright (c) 2013, Nucleic Development Team.
+#
+# Distributed under the terms of the Modified BSD License.
+#
+# The full license is in the file COPYING.txt, distributed with this software.
+#------------------------------------------------------------------------------
+from .QtCore import Qt, QAbstractTableModel, QModelIndex, QTimer
+
+
+#: The header orientation names for the Qt orientations.
+_ORIENTATIONS = {
+    Qt.Horizontal: 'horizontal',
+    Qt.Vertical: 'vertical',
+}
+
+
+class QItemModelAdapter(QAbstractTableModel):
+    """ A table model which presents the data of an Enaml ItemModel.
+
+    The adapter stores only the row and column counts of the model. The
+    data for a cell is requested from the ItemModel each time the view
+    asks for it, which is only done for the visible cells. The data
+    changes notified by the ItemModel are merged into a single range
+    which is emitted on the next cycle of the event loop. Row and column
+    insertions and removals are applied immediately, after any pending
+    data change has been emitted.
+
+    The ItemModel notifies a removal after the rows or columns have been
+    removed, but Qt requires the removal to begin while they are still
+    present in the adapter. Until the removal ends, the adapter maps its
+    indices onto the updated ItemModel and serves no data for the
+    removed range.
+
+    """
+    def __init__(self, parent=None):
+        """ Initialize a QItemModelAdapter.
+
+        Parameters
+        ----------
+        parent : QObject, optional
+            The parent object of the adapter.
+
+        """
+        super(QItemModelAdapter, self).__init__(parent)
+        self._model = None
+        self._rows = 0
+        self._columns = 0
+        self._pending = None
+        self._removing = None
+        self._timer = timer = QTimer(self)
+        timer.setSingleShot(True)
+        timer.timeout.connect(self._flush_data_changed)
+
+    #--------------------------------------------------------------------------
+    # QAbstractTableModel API
+    #--------------------------------------------------------------------------
+    def rowCount(self, parent=QModelIndex()):
+        """ Get the number of rows in the model.
+
+        """
+        if parent.isValid():
+            return 0
+        return self._rows
+
+    def columnCount(self, parent=QModelIndex()):
+        """ Get the number of columns in the model.
+
+        """
+        if parent.isValid():
+            return 0
+        return self._columns
+
+    def data(self, index, role=Qt.DisplayRole):
+        """ Get the data for a cell of the model.
+
+        """
+        if role == Qt.DisplayRole and index.isValid():
+            row = self._model_section('rows_removed', index.row())
+            column = self._model_section('columns_removed', index.column())
+            if row >= 0 and column >= 0:
+                return self._model.data(row, column)
+        return None
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        """ Get the data for a header section of the model.
+
+        If the ItemModel does not provide the header text, the default
+        section numbers are shown.
+
+        """
+        if role == Qt.DisplayRole and self._model is not None:
+            if orientation == Qt.Horizontal:
+                model_section = self._model_section('columns_removed', section)
+            else:
+                model_section = self._model_section('rows_removed', section)
+            if model_section < 0:
+                return None
+            value = self._model.header_data(
+                model_section, _ORIENTATIONS[orientation]
+            )
+            if value is not None:
+                return value
+        return super(QItemModelAdapter, self).headerData(
+            section, orientation, role
+        )
+
+    #--------------------------------------------------------------------------
+    # Public API
+    #--------------------------------------------------------------------------
+    def item_model(self):
+        """ Get the ItemModel presented by the adapter.
+
+        """
+        return self._model
+
+    def set_item_model(self, model):
+        """ Set the ItemModel presented by the adapter.
+
+        Parameters
+        ----------
+        model : ItemModel or None
+            The item model to present, or None to present an empty
+            model. The adapter stops observing the old model.
+
+        """
+        old = self._model
+        if old is not None:
+            old.unobserve('changed', self._on_model_changed)
+        self.beginResetModel()
+        self._model = model
+        self._reset_counts()
+        self.endResetModel()
+        if model is not None:
+            model.observe('changed', self._on_model_changed)
+
+    #--------------------------------------------------------------------------
+    # Private API
+    #--------------------------------------------------------------------------
+    def _reset_counts(self):
+        """ Reload the cached counts from the ItemModel.
+
+        Any pending data change is discarded.
+
+        """
+        model = self._model
+        if model is not None:
+            self._rows = model.row_count()
+            self._columns = model.column_count()
+        else:
+            self._rows = 0
+            self._columns = 0
+        self._pending = None
+        self._timer.stop()
+
+    def _model_section(self, kind, section):
+        """ Map a row or column of the adapter onto the ItemModel.
+
+        Parameters
+        ----------
+        kind : str
+            The kind of removal which affects the section, either
+            'rows_removed' or 'columns_removed'.
+
+        section : int
+            The row or column in the adapter.
+
+        Returns
+        -------
+        result : int
+            The row or column in the ItemModel, or -1 if the section is
+            being removed.
+
+        """
+        removing = self._removing
+        if removing is None or removing[0] != kind:
+            return section
+        first, last = removing[1:]
+        if section < first:
+            return section
+        if section <= last:
+            return -1
+        return section - (last - first + 1)
+
+    def _flush_data_changed(self):
+        """ Emit the pending data change, if any.
+
+        The range is clipped to the current counts of the adapter.
+
+        """
+        pending = self._pending
+        self._pending = None
+        self._timer.stop()
+        if pending is None:
+            return
+        r0, c0, r1, c1 = pending
+        r1 = min(r1, self._rows - 1)
+        c1 = min(c1, self._columns - 1)
+        if r0 <= r1 and c0 <= c1:
+            self.dataChanged.emit(self.index(r0, c0), self.index(r1, c1))
+
+    def _on_model_changed(self, change):
+        """ Handle a change notification from the ItemModel.
+
+        """
+        args = change['value']
+        kind = args[0]
+        if kind == 'data':
+            r0, c0, r1, c1 = args[1:]
+            pending = self._pending
+            if pending is None:
+                self._pending = (r0, c0, r1, c1)
+                self._timer.start(0)
+            else:
+                self._pending = (
+                    min(r0, pending[0]), min(c0, pending[1]),
+                    max(r1, pending[2]), max(c1, pending[3]),
+                )
+            return
+        if kind == 'reset':
+            self.beginResetModel()
+            self._reset_counts()
+            self.endResetModel()
+            return
+        self._flush_data_changed()
+        first, last = args[1:]
+        root = QModelIndex()
+        if kind == 'rows_inserted':
+            self.beginInsertRows(root, first, last)
+            self._rows += last - first + 1
+            self.endInsertRows()
+        elif kind == 'rows_removed':
+            self._removing = args
+            try:
+                self.beginRemoveRows(root, first, last)
+                self._rows -= last - first + 1
+                self.endRemoveRows()
+            finally:
+                self._removing = None
+        elif kind == 'columns_inserted':
+            self.beginInsertColumns(root, first, last)
+            self._columns += last - first + 1
+            self.endInsertColumns()
+        elif kind == 'columns_removed':
+            self._removing = args
+            try:
+                self.beginRemoveColumns(root, first, last)
+                self._columns -= last - first + 1
+                self.endRemoveColumns()
+            finally:
+                self._removing = None
@@ -0,0 +1,207 @@
+#------------------------------------------------------------------------------
+# Copyright (c) 2013, Nucleic Development Team.
+#
+# Distributed under the terms of the Modified BSD License.
+#
+# The full license is in the file COPYING.txt, distributed with this software.
+#------------------------------------------------------------------------------
+from .QtCore import Qt, QAbstractListModel, QModelIndex
+
+from .q_resource_helpers import get_cached_qicon
+
+
+#: A sentinel which marks a row value which has not been computed.
+_UNSET = object()
+
+
+class QObjectComboModel(QAbstractListModel):
+    """ A list model which presents the items of an ObjectCombo.
+
+    The text and icon for a row are computed on demand, the first time
+    the view asks for them, and are cached until the row is removed or
+    the converters are changed. Changes to the list of items are
+    applied as row removals and insertions.
+
+    """
+    def __init__(self, parent=None):
+        """ Initialize a QObjectComboModel.
+
+        Parameters
+        ----------
+        parent : QObject, optional
+            The parent object of the model.
+
+        """
+        super(QObjectComboModel, self).__init__(parent)
+        self._items = []
+        self._texts = []
+        self._icons = []
+        self._to_string = None
+        self._to_icon = None
+        self._rows = None
+        self._unhashable_rows = None
+
+    #--------------------------------------------------------------------------
+    # QAbstractListModel API
+    #--------------------------------------------------------------------------
+    def rowCount(self, parent=QModelIndex()):
+        """ Get the number of rows in the model.
+
+        """
+        if parent.isValid():
+            return 0
+        return len(self._items)
+
+    def data(self, index, role=Qt.DisplayRole):
+        """ Get the data for a row of the model.
+
+        """
+        if not index.isValid():
+            return None
+        row = index.row()
+        if role == Qt.DisplayRole or role == Qt.EditRole:
+            text = self._texts[row]
+            if text is _UNSET:
+                text = self._texts[row] = self._to_string(self._items[row])
+            return text
+        if role == Qt.DecorationRole:
+            qicon = self._icons[row]
+            if qicon is _UNSET:
+                icon = self._to_icon(self._items[row])
+                if icon is not None:
+                    qicon = get_cached_qicon(icon)
+                else:
+                    qicon = None
+                self._icons[row] = qicon
+            return qicon
+        return None
+
+    #--------------------------------------------------------------------------
+    # Public API
+    #--------------------------------------------------------------------------
+    def item(self, row):
+        """ Get the item for a row of the model.
+
+        Parameters
+        ----------
+        row : int
+            The row of interest.
+
+        Returns
+        -------
+        result : object
+            The item for the row, or None if the row is invalid.
+
+        """
+        if 0 <= row < len(self._items):
+            return self._items[row]
+
+    def item_row(self, item):
+        """ Get the row of an item in the model.
+
+        Items are compared by equality. A map from item to row is built
+        for the hashable items on the first lookup after the items
+        change, so repeated lookups do not scan those items. Unhashable
+        items are compared in order.
+
+        Parameters
+        ----------
+        item : object
+            The item of interest.
+
+        Returns
+        -------
+        result : int
+            The first row which holds an item equal to the given item,
+            or -1 if there is no such row.
+
+        """
+        if self._rows is None:
+            rows = {}
+            unhashable = []
+            for row, obj in enumerate(self._items):
+                try:
+                    rows.setdefault(obj, row)
+                except TypeError:
+                    unhashable.append(row)
+            self._rows = rows
+            self._unhashable_rows = unhashable
+        try:
+            found = self._rows.get(item, -1)
+        except TypeError:
+            found = -1
+        items = self._items
+        for row in self._unhashable_rows:
+            if found >= 0 and row > found:
+                break
+            if items[row] == item:
+                return row
+        return found
+
+    def items(self):
+        """ Get the list of items presented by the model.
+
+        The returned list should not be modified.
+
+        """
+        return self._items
+
+    def set_items(self, items, to_string, to_icon):
+        """ Update the items and converters of the model.
+
+        If the converters have changed, the model is reset. Otherwise,
+        the leading and trailing items which are identical to those of
+        the model are kept, and the differing rows between them are
+        removed and inserted.
+
+        Parameters
+        ----------
+        items : list
+            The new list of items for the model.
+
+        to_string : callable
+            The callable which converts an item to a unicode string.
+
+        to_icon : callable
+            The callable which converts an item to an Enaml Icon or
+            None.
+
+        """
+        new = list(items)
+        self._rows = None
+        if to_string is not self._to_string or to_icon is not self._to_icon:
+            self.beginResetModel()
+            self._items = new
+            self._texts = [_UNSET] * len(new)
+            self._icons = [_UNSET] * len(new)
+            self._to_string = to_string
+            self._to_icon = to_icon
+            self.endResetModel()
+            return
+
+        old = self._items
+        old_end = len(old)
+        new_end = len(new)
+        start = 0
+        limit = min(old_end, new_end)
+        while start < limit and old[start] is new[start]:
+            start += 1
+        while (old_end > start and new_end > start and
+               old[old_end - 1] is new[new_end - 1]):
+            old_end -= 1
+            new_end -= 1
+
+        if old_end > start:
+            self.beginRemoveRows(QModelIndex(), start, old_end - 1)
+            del old[start:old_end]
+            del self._texts[start:old_end]
+            del self._icons[start:old_end]
+            self.endRemoveRows()
+
+        if new_end > start:
+            count = new_end - start
+            self.beginInsertRows(QModelIndex(), start, new_end - 1)
+            old[start:start] = new[start:new_end]
+            self._texts[start:start] = [_UNSET] * count
+            self._icons[start:start] = [_UNSET] * count
+            self.endInsertRows()
@@ -5,7 +5,10 @@
 #
 # The full license is in the file COPYING.txt, distributed with this software.
 #------------------------------------------------------------------------------
+import hashlib
+
 from enaml.fontext import FontStyle, FontCaps
+from enaml.lrucache import LRUCache
 
 from .QtCore import Qt, QSize
 from .QtGui import QColor, QFont, QImage, QIcon, QPixmap
@@ -54,6 +57,71 @@ ICON_STATE = {
 }
 
 
+#: The default byte budget of the shared resource cache.
+DEFAULT_RESOURCE_CACHE_BYTES = 64 * 1024 * 1024
+
+
+#: The process-wide cache of the QImage, QPixmap, and QIcon objects
+#: converted from Enaml images and icons. The cost of an entry is its
+#: approximate size in bytes.
+_resource_cache = LRUCache(DEFAULT_RESOURCE_CACHE_BYTES)
+
+
+def set_resource_cache_bytes(nbytes):
+    """ Set the byte budget of the shared resource cache.
+
+    Parameters
+    ----------
+    nbytes : int
+        The maximum approximate size in bytes of the cached QImage,
+        QPixmap, and QIcon objects. Lowering the budget evicts the
+        least recently used objects as needed.
+
+    """
+    _resource_cache.max_cost = nbytes
+
+
+def resource_cache_info():
+    """ Get the statistics of the shared resource cache.
+
+    Returns
+    -------
+    result : dict
+        The dict returned by `LRUCache.info`. The 'cost' and 'max_cost'
+        values are in bytes.
+
+    """
+    return _resource_cache.info()
+
+
+def clear_resource_cache():
+    """ Clear the shared resource cache and reset its statistics.
+
+    Objects which are already held by an Enaml image or icon are not
+    affected.
+
+    """
+    _resource_cache.clear()
+
+
+#: A bounded cache of argb value to QColor.
+_qcolor_cache = LRUCache(1024)
+
+#: A bounded cache of font attributes to QFont.
+_qfont_cache = LRUCache(256)
+
+
+def _image_key(image):
+    """ Get the shared cache key for an Enaml Image.
+
+    """
+    return (
+        'image', hashlib.sha1(image.data).digest(), image.format,
+        tuple(image.raw_size), tuple(image.size), image.aspect_ratio_mode,
+        image.transform_mode,
+    )
+
+
 def QImage_from_Image(image):
     """ Convert an Enaml Image into a QImage.
 
@@ -97,15 +165,46 @@ def get_cached_qimage(image):
     -------
     result : QImage
         The cached QImage for the image. If no cached image exists, one
-        will be created.
+        will be created. Images with the same data and parameters share
+        the same QImage through the shared resource cache.
 
     """
     qimage = image._tkdata
     if not isinstance(qimage, QImage):
-        qimage = image._tkdata = QImage_from_Image(image)
+        key = _image_key(image)
+        qimage = _resource_cache.get(key)
+        if qimage is None:
+            qimage = QImage_from_Image(image)
+            _resource_cache.set(key, qimage, qimage.byteCount())
+        image._tkdata = qimage
     return qimage
 
 
+def get_cached_qpixmap(image):
+    """ Get the cached QPixmap for the Enaml Image.
+
+    Parameters
+    ----------
+    image : Image
+        The Enaml Image object.
+
+    Returns
+    -------
+    result : QPixmap
+        The cached QPixmap for the image. If no cached pixmap exists,
+        one will be created from the cached QImage for the image.
+
+    """
+    qimage = get_cached_qimage(image)
+    key = ('pixmap', qimage.cacheKey())
+    qpixmap = _resource_cache.get(key)
+    if qpixmap is None:
+        qpixmap = QPixmap.fromImage(qimage)
+        cost = qpixmap.width() * qpixmap.height() * qpixmap.depth() // 8
+        _resource_cache.set(key, qpixmap, cost)
+    return qpixmap
+
+
 def QIcon_from_Icon(icon):
     """ Convert the given Enaml Icon into a QIcon.
 
@@ -127,8 +226,7 @@ def QIcon_from_Icon(icon):
             continue
         mode = ICON_MODE[icon_image.mode]
         state = ICON_STATE[icon_image.state]
-        qimage = get_cached_qimage(image)
-        qpixmap = QPixmap.fromImage(qimage)
+        qpixmap = get_cached_qpixmap(image)
         qicon.addPixmap(qpixmap, mode, state)
     return qicon
 
@@ -145,12 +243,27 @@ def get_cached_qicon(icon):
     -------
     result : QIcon
         The cached QIcon for the icon. If no cached icon exists, one
-        will be created.
+        will be created. Icons with the same images share the same
+        QIcon through the shared resource cache.
 
     """
     qicon = icon._tkdata
     if not isinstance(qicon, QIcon):
-        qicon = icon._tkdata = QIcon_from_Icon(icon)
+        key = ['icon']
+        cost = 0
+        for icon_image in icon.images:
+            image = icon_image.image
+            if image:
+                qimage = get_cached_qimage(image)
+                key.append((icon_image.mode, icon_image.state,
+                            qimage.cacheKey()))
+                cost += qimage.byteCount()
+        key = tuple(key)
+        qicon = _resource_cache.get(key)
+        if qicon is None:
+            qicon = QIcon_from_Icon(icon)
+            _resource_cache.set(key, qicon, cost)
+        icon._tkdata = qicon
     return qicon
 
 
@@ -165,10 +278,16 @@ def QColor_from_Color(color):
     Returns
     -------
     result : QColor
-        The QColor instance for the given Enaml color.
+        The QColor instance for the given Enaml color. Equal colors
+        share the same QColor, which should be treated as read-only.
 
     """
-    return QColor.fromRgba(color.argb)
+    argb = color.argb
+    qcolor = _qcolor_cache.get(argb)
+    if qcolor is None:
+        qcolor = QColor.fromRgba(argb)
+        _qcolor_cache.set(argb, qcolor)
+    return qcolor
 
 
 def get_cached_qcolor(color):
@@ -203,12 +322,17 @@ def QFont_from_Font(font):
     Returns
     -------
     result : QFont
-        The QFont instance for the given Enaml font.
+        The QFont instance for the given Enaml font. Equal fonts share
+        the same QFont, which should be treated as read-only.
 
     """
-    qfont = QFont(font.family, font.pointsize, font.weight)
-    qfont.setStyle(FONT_STYLES[font.style])
-    qfont.setCapitalization(FONT_CAPS[font.caps])
+    key = (font.family, font.pointsize, font.weight, font.style, font.caps)
+    qfont = _qfont_cache.get(key)
+    if qfont is None:
+        qfont = QFont(font.family, font.pointsize, font.weight)
+        qfont.setStyle(FONT_STYLES[font.style])
+        qfont.setCapitalization(FONT_CAPS[font.caps])
+        _qfont_cache.set(key, qfont)
     return qfont
 
 
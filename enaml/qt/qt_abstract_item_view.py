@@ -0,0 +1,106 @@
+#------------------------------------------------------------------------------
+# Copyright (c) 2013, Nucleic Development Team.
+#
+# Distributed under the terms of the Modified BSD License.
+#
+# The full license is in the file COPYING.txt, distributed with this software.
+#------------------------------------------------------------------------------
+from atom.api import Typed
+
+from enaml.widgets.abstract_item_view import ProxyAbstractItemView
+
+from .QtGui import QAbstractItemView
+
+from .q_item_model_adapter import QItemModelAdapter
+from .qt_control import QtControl
+
+
+#: A mapping from Enaml selection mode to Qt selection mode.
+SELECTION_MODES = {
+    'single': QAbstractItemView.SingleSelection,
+    'contiguous': QAbstractItemView.ContiguousSelection,
+    'extended': QAbstractItemView.ExtendedSelection,
+    'multi': QAbstractItemView.MultiSelection,
+    'none': QAbstractItemView.NoSelection,
+}
+
+
+class QtAbstractItemView(QtControl, ProxyAbstractItemView):
+    """ A Qt implementation of the Enaml ProxyAbstractItemView.
+
+    This class serves as a base class for the item views. It is not
+    meant to be used directly.
+
+    """
+    #: A reference to the widget created by the proxy.
+    widget = Typed(QAbstractItemView)
+
+    #: A reference to the adapter which presents the item model.
+    adapter = Typed(QItemModelAdapter)
+
+    #--------------------------------------------------------------------------
+    # Initialization API
+    #--------------------------------------------------------------------------
+    def create_widget(self):
+        """ Implement in a subclass to create the widget.
+
+        """
+        raise NotImplementedError
+
+    def init_widget(self):
+        """ Initialize the item view widget.
+
+        """
+        super(QtAbstractItemView, self).init_widget()
+        d = self.declaration
+        widget = self.widget
+        self.adapter = QItemModelAdapter(widget)
+        widget.setModel(self.adapter)
+        self.set_model(d.model)
+        self.set_selection_mode(d.selection_mode)
+        self.set_alternating_row_colors(d.alternating_row_colors)
+        widget.activated.connect(self.on_activated)
+
+    #--------------------------------------------------------------------------
+    # Signal Handlers
+    #--------------------------------------------------------------------------
+    def on_activated(self, index):
+        """ The signal handler for the 'activated' signal.
+
+        """
+        self.declaration.activated((index.row(), index.column()))
+
+    #--------------------------------------------------------------------------
+    # ProxyToolkitObject API
+    #--------------------------------------------------------------------------
+    def destroy(self):
+        """ A reimplemented destructor.
+
+        This destructor stops the adapter from observing the model.
+
+        """
+        if self.adapter is not None:
+            self.adapter.set_item_model(None)
+            del self.adapter
+        super(QtAbstractItemView, self).destroy()
+
+    #--------------------------------------------------------------------------
+    # ProxyAbstractItemView API
+    #--------------------------------------------------------------------------
+    def set_model(self, model):
+        """ Set the item model presented by the widget.
+
+        """
+        self.adapter.set_item_model(model)
+
+    def set_selection_mode(self, mode):
+        """ Set the selection mode of the widget.
+
+        """
+        self.widget.setSelectionMode(SELECTION_MODES[mode])
+
+    def set_alternating_row_colors(self, alternate):
+        """ Set whether the widget alternates the row colors.
+
+        """
+        self.widget.setAlternatingRowColors(alternate)
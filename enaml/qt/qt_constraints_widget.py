@@ -7,7 +7,7 @@
 #------------------------------------------------------------------------------
 from contextlib import contextmanager
 
-from atom.api import List, Typed
+from atom.api import Bool, List, Typed
 
 from enaml.widgets.constraints_widget import ProxyConstraintsWidget
 
@@ -50,6 +50,12 @@ class QtConstraintsWidget(QtWidget, ProxyConstraintsWidget):
     #: on an as needed basis and destroyed when it is no longer needed.
     layout_timer = Typed(QTimer)
 
+    #: Whether the layout constraints of the widget have changed since
+    #: they were last added to a layout system. This is used by the
+    #: layout owner to perform an incremental relayout which only
+    #: regenerates the constraints of the widgets which have changed.
+    layout_dirty = Bool(True)
+
     def _default_size_hint_cns(self):
         """ Creates the list of size hint constraints for this widget.
 
@@ -99,6 +105,7 @@ class QtConstraintsWidget(QtWidget, ProxyConstraintsWidget):
         be reenabled after the actual relayout is performed.
 
         """
+        self.layout_dirty = True
         if not self.layout_timer:
             self.widget.setUpdatesEnabled(False)
             self.layout_timer = timer = QTimer()
@@ -5,13 +5,15 @@
 #
 # The full license is in the file COPYING.txt, distributed with this software.
 #------------------------------------------------------------------------------
-from collections import deque
-
 from atom.api import Bool, List, Callable, Value, Typed
 
 from casuarius import weak
 
-from enaml.layout.layout_helpers import expand_constraints
+from enaml.layout.container_layout import (
+    build_layout_table, can_expand_in_height, can_expand_in_width,
+    can_shrink_in_height, can_shrink_in_width, diff_constraints,
+    run_layout_table
+)
 from enaml.layout.layout_manager import LayoutManager
 from enaml.widgets.container import ProxyContainer
 
@@ -65,45 +67,18 @@ class QContainer(QFrame):
         return self.minimumSize()
 
 
-def hard_constraints(d):
-    """ Generate hard constraints for an item.
-
-    These constraints will always be included for an item in a layout.
-
-    """
-    return [d.left >= 0, d.top >= 0, d.width >= 0, d.height >= 0]
-
+def hint_key(item):
+    """ Get a key which identifies the size hint constraints of an item.
 
-def can_shrink_in_width(d):
-    """ Get whether a declarative container can shrink in width.
+    The size hint constraints of an item must be regenerated whenever
+    the value of this key changes.
 
     """
-    shrink = ('ignore', 'weak')
-    return d.resist_width in shrink and d.hug_width in shrink
-
-
-def can_shrink_in_height(d):
-    """ Get whether a declarative container can shrink in height.
-
-    """
-    shrink = ('ignore', 'weak')
-    return d.resist_height in shrink and d.hug_height in shrink
-
-
-def can_expand_in_width(d):
-    """ Get whether a declarative container can expand in width.
-
-    """
-    expand = ('ignore', 'weak')
-    return d.hug_width in expand and d.limit_width in expand
-
-
-def can_expand_in_height(d):
-    """ Get whether a declarative container can expand in height.
-
-    """
-    expand = ('ignore', 'weak')
-    return d.hug_height in expand and d.limit_height in expand
+    d = item.declaration
+    return (
+        item.widget_item.sizeHint(), d.hug_width, d.hug_height,
+        d.resist_width, d.resist_height, d.limit_width, d.limit_height,
+    )
 
 
 class QtContainer(QtFrame, ProxyContainer):
@@ -138,6 +113,15 @@ class QtContainer(QtFrame, ProxyContainer):
     #: The table of (index, updater) pairs to use during a layout pass.
     _layout_table = List()
 
+    #: The table of constraints which have been added to the layout
+    #: manager. The table maps the container and each of the proxies
+    #: in the layout table to a tuple of (cns, member, hint), where
+    #: 'cns' is the list of generated constraints, 'member' is the name
+    #: of the cached constraints member added with them, and 'hint' is
+    #: the hint key from which that member was generated. This table
+    #: is used to perform an incremental relayout.
+    _cns_table = Typed(dict, ())
+
     def _default_contents_cns(self):
         """ Create the contents constraints for the container.
 
@@ -193,16 +177,48 @@ class QtContainer(QtFrame, ProxyContainer):
         # we only initialize a layout manager if ownership is unlikely
         # to be transferred.
         if not self.will_transfer():
-            offset_table, layout_table = self._build_layout_table()
-            cns = self._generate_constraints(layout_table)
+            offset_table, layout_table = build_layout_table(
+                self, QtConstraintsWidget, QtContainer
+            )
+            cns_table = {}
+            _, new_cns = diff_constraints(
+                self, layout_table, cns_table, QtContainer, hint_key
+            )
             manager = LayoutManager()
-            manager.initialize(cns)
+            manager.initialize(new_cns)
             self._offset_table = offset_table
             self._layout_table = layout_table
+            self._cns_table = cns_table
             self._layout_manager = manager
             self._refresh = self._build_refresher(manager)
             self._update_sizes()
 
+    def update_cns_layout(self):
+        """ Incrementally update the constraints layout.
+
+        The constraints of the widgets which have not changed since the
+        last layout pass are left in the solver. Only the constraints
+        of the added, removed, and invalidated widgets are replaced.
+        If no layout manager exists, a full layout is initialized.
+
+        """
+        manager = self._layout_manager
+        if manager is None:
+            self.init_cns_layout()
+            return
+        offset_table, layout_table = build_layout_table(
+            self, QtConstraintsWidget, QtContainer
+        )
+        cns_table = self._cns_table
+        old_cns, new_cns = diff_constraints(
+            self, layout_table, cns_table, QtContainer, hint_key
+        )
+        manager.replace_constraints(old_cns, new_cns)
+        self._offset_table = offset_table
+        self._layout_table = layout_table
+        self._refresh = self._build_refresher(manager)
+        self._update_sizes()
+
     def destroy(self):
         """ An overridden destructor method.
 
@@ -211,6 +227,7 @@ class QtContainer(QtFrame, ProxyContainer):
 
         """
         del self._layout_table
+        del self._cns_table
         del self._refresh
         super(QtContainer, self).destroy()
 
@@ -249,13 +266,15 @@ class QtContainer(QtFrame, ProxyContainer):
     def relayout(self):
         """ Rebuild the constraints layout for the widget.
 
-        If this object does not own the layout, the call is proxied to
-        the layout owner.
+        The layout is updated incrementally, so that the cost of the
+        relayout is proportional to the number of widgets which have
+        changed. If this object does not own the layout, the call is
+        proxied to the layout owner.
 
         """
         if self._owns_layout:
             with size_hint_guard(self):
-                self.init_cns_layout()
+                self.update_cns_layout()
                 self._refresh()
         else:
             self._layout_owner.relayout()
@@ -325,18 +344,7 @@ class QtContainer(QtFrame, ProxyContainer):
         updater functions.
 
         """
-        # We explicitly don't use enumerate() to generate the running
-        # index because this method is on the code path of the resize
-        # event and hence called *often*. The entire code path for a
-        # resize event is micro optimized and justified with profiling.
-        offset_table = self._offset_table
-        layout_table = self._layout_table
-        running_index = 1
-        for offset_index, updater in layout_table:
-            dx, dy = offset_table[offset_index]
-            new_offset = updater(dx, dy)
-            offset_table[running_index] = new_offset
-            running_index += 1
+        run_layout_table(self._offset_table, self._layout_table)
 
     def _update_sizes(self):
         """ Update the min/max/best sizes for the underlying widget.
@@ -378,122 +386,6 @@ class QtContainer(QtFrame, ProxyContainer):
         height = widget.height
         return lambda: mgr_layout(layout, width_var, height_var, (width(), height()))
 
-    def _build_layout_table(self):
-        """ Build the layout table for this container.
-
-        A layout table is a pair of flat lists which hold the required
-        objects for laying out the child widgets of this container.
-        The flat table is built in advance (and rebuilt if and when
-        the tree structure changes) so that it's not necessary to
-        perform an expensive tree traversal to layout the children
-        on every resize event.
-
-        Returns
-        -------
-        result : (list, list)
-            The offset table and layout table to use during a resize
-            event.
-
-        """
-        # The offset table is a list of (dx, dy) tuples which are the
-        # x, y offsets of children expressed in the coordinates of the
-        # layout owner container. This owner container may be different
-        # from the parent of the widget, and so the delta offset must
-        # be subtracted from the computed geometry values during layout.
-        # The offset table is updated during a layout pass in breadth
-        # first order.
-        #
-        # The layout table is a flat list of (idx, updater) tuples. The
-        # idx is an index into the offset table where the given child
-        # can find the offset to use for its layout. The updater is a
-        # callable provided by the widget which accepts the dx, dy
-        # offset and will update the layout geometry of the widget.
-        zero_offset = (0, 0)
-        offset_table = [zero_offset]
-        layout_table = []
-        queue = deque((0, child) for child in self.children())
-
-        # Micro-optimization: pre-fetch bound methods and store globals
-        # as locals. This method is not on the code path of a resize
-        # event, but it is on the code path of a relayout. If there
-        # are many children, the queue could potentially grow large.
-        push_offset = offset_table.append
-        push_item = layout_table.append
-        push = queue.append
-        pop = queue.popleft
-        QtConstraintsWidget_ = QtConstraintsWidget
-        QtContainer_ = QtContainer
-        isinst = isinstance
-
-        # The queue yields the items in the tree in breadth-first order
-        # starting with the immediate children of this container. If a
-        # given child is a container that will share its layout, then
-        # the children of that container are added to the queue to be
-        # added to the layout table.
-        running_index = 0
-        while queue:
-            offset_index, item = pop()
-            if isinst(item, QtConstraintsWidget_):
-                push_item((offset_index, item.geometry_updater()))
-                push_offset(zero_offset)
-                running_index += 1
-                if isinst(item, QtContainer_):
-                    if item.transfer_layout_ownership(self):
-                        for child in item.children():
-                            push((running_index, child))
-
-        return offset_table, layout_table
-
-    def _generate_constraints(self, layout_table):
-        """ Creates the list of casuarius LinearConstraint objects for
-        the widgets for which this container owns the layout.
-
-        This method walks over the items in the given layout table and
-        aggregates their constraints into a single list of casuarius
-        LinearConstraint objects which can be given to the layout
-        manager.
-
-        Parameters
-        ----------
-        layout_table : list
-            The layout table created by a call to _build_layout_table.
-
-        Returns
-        -------
-        result : list
-            The list of casuarius LinearConstraints instances to pass to
-            the layout manager.
-
-        """
-        # The list of raw casuarius constraints which will be returned
-        # from this method to be added to the casuarius solver.
-        cns = self.contents_cns[:]
-        d = self.declaration
-        cns.extend(hard_constraints(d))
-        cns.extend(expand_constraints(d, d.layout_constraints()))
-
-        # The first element in a layout table item is its offset index
-        # which is not relevant to constraints generation. The child
-        # size hint constraints are refreshed unconditionally. This
-        # accounts for the potential changes in the size hint of a
-        # widget between relayouts.
-        for _, updater in layout_table:
-            child = updater.item
-            del child.size_hint_cns
-            d = child.declaration
-            cns.extend(hard_constraints(d))
-            if isinstance(child, QtContainer):
-                if child.transfer_layout_ownership(self):
-                    cns.extend(expand_constraints(d, d.layout_constraints()))
-                    cns.extend(child.contents_cns)
-                else:
-                    cns.extend(child.size_hint_cns)
-            else:
-                cns.extend(expand_constraints(d, d.layout_constraints()))
-                cns.extend(child.size_hint_cns)
-
-        return cns
-
     #--------------------------------------------------------------------------
     # Auxiliary Methods
     #--------------------------------------------------------------------------
@@ -527,6 +419,7 @@ class QtContainer(QtFrame, ProxyContainer):
         del self._refresh
         del self._offset_table
         del self._layout_table
+        del self._cns_table
         return True
 
     def will_transfer(self):
@@ -180,15 +180,16 @@ class QtDockArea(QtConstraintsWidget, ProxyDockArea):
         # workaround win-7 sizing bug
         parts = [u'QDockTabWidget::pane {}']
         name = self.widget.objectName()
+        translate = translate_dock_area_style
         for style in StyleCache.styles(self.declaration):
-            t = translate_dock_area_style(name, style)
+            t = StyleCache.toolkit_style(style, name, translate)
             if t:
                 parts.append(t)
         if len(parts) > 1:
             stylesheet = u'\n\n'.join(parts)
         else:
             stylesheet = u''
-        self.widget.setStyleSheet(stylesheet)
+        self.apply_style_sheet(stylesheet)
 
     #--------------------------------------------------------------------------
     # Utility Methods
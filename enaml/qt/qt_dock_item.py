@@ -112,15 +112,16 @@ class QtDockItem(QtWidget, ProxyDockItem):
         """
         parts = []
         name = self.widget.objectName()
+        translate = translate_dock_item_style
         for style in StyleCache.styles(self.declaration):
-            t = translate_dock_item_style(name, style)
+            t = StyleCache.toolkit_style(style, name, translate)
             if t:
                 parts.append(t)
         if len(parts) > 0:
             stylesheet = u'\n\n'.join(parts)
         else:
             stylesheet = u''
-        self.widget.setStyleSheet(stylesheet)
+        self.apply_style_sheet(stylesheet)
 
     #--------------------------------------------------------------------------
     # Signal Handlers
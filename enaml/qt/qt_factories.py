@@ -130,6 +130,11 @@ def label_factory():
     return QtLabel
 
 
+def list_view_factory():
+    from .qt_list_view import QtListView
+    return QtListView
+
+
 def main_window_factory():
     from .qt_main_window import QtMainWindow
     return QtMainWindow
@@ -260,6 +265,11 @@ def status_item_factory():
     return QtStatusItem
 
 
+def table_view_factory():
+    from .qt_table_view import QtTableView
+    return QtTableView
+
+
 def time_selector_factory():
     from .qt_time_selector import QtTimeSelector
     return QtTimeSelector
@@ -310,6 +320,7 @@ QT_FACTORIES = {
     'Image': image_factory,
     'ImageView': image_view_factory,
     'Label': label_factory,
+    'ListView': list_view_factory,
     'MainWindow': main_window_factory,
     'MdiArea': mdi_area_factory,
     'MdiWindow': mdi_window_factory,
@@ -336,6 +347,7 @@ QT_FACTORIES = {
     'StackItem': stack_item_factory,
     'StatusBar': status_bar_factory,
     'StatusItem': status_item_factory,
+    'TableView': table_view_factory,
     'TimeSelector': time_selector_factory,
     'Timer': timer_factory,
     'ToolBar': tool_bar_factory,
@@ -9,9 +9,9 @@ from atom.api import Typed
 
 from enaml.widgets.image_view import ProxyImageView
 
-from .QtGui import QFrame, QPainter, QPixmap
+from .QtGui import QFrame, QPainter
 
-from .q_resource_helpers import get_cached_qimage
+from .q_resource_helpers import get_cached_qpixmap
 from .qt_constraints_widget import size_hint_guard
 from .qt_control import QtControl
 
@@ -238,8 +238,7 @@ class QtImageView(QtControl, ProxyImageView):
         """
         qpixmap = None
         if image:
-            qimage = get_cached_qimage(image)
-            qpixmap = QPixmap.fromImage(qimage)
+            qpixmap = get_cached_qpixmap(image)
         if sh_guard:
             with size_hint_guard(self):
                 self.widget.setPixmap(qpixmap)
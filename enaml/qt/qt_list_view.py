@@ -0,0 +1,51 @@
+#------------------------------------------------------------------------------
+# Copyright (c) 2013, Nucleic Development Team.
+#
+# Distributed under the terms of the Modified BSD License.
+#
+# The full license is in the file COPYING.txt, distributed with this software.
+#------------------------------------------------------------------------------
+from atom.api import Typed
+
+from enaml.widgets.list_view import ProxyListView
+
+from .QtGui import QListView
+
+from .qt_abstract_item_view import QtAbstractItemView
+
+
+class QtListView(QtAbstractItemView, ProxyListView):
+    """ A Qt implementation of an Enaml ProxyListView.
+
+    """
+    #: A reference to the widget created by the proxy.
+    widget = Typed(QListView)
+
+    #--------------------------------------------------------------------------
+    # Initialization API
+    #--------------------------------------------------------------------------
+    def create_widget(self):
+        """ Create the underlying list view widget.
+
+        """
+        widget = QListView(self.parent_widget())
+        # Uniform item sizes let the view lay out the rows without
+        # requesting the data of the rows which are not shown.
+        widget.setUniformItemSizes(True)
+        self.widget = widget
+
+    def init_widget(self):
+        """ Initialize the underlying widget.
+
+        """
+        super(QtListView, self).init_widget()
+        self.set_model_column(self.declaration.model_column)
+
+    #--------------------------------------------------------------------------
+    # ProxyListView API
+    #--------------------------------------------------------------------------
+    def set_model_column(self, column):
+        """ Set the column of the model displayed by the list.
+
+        """
+        self.widget.setModelColumn(column)
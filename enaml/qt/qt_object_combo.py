@@ -12,7 +12,7 @@ from enaml.widgets.object_combo import ProxyObjectCombo
 from .QtCore import QTimer
 from .QtGui import QComboBox
 
-from .q_resource_helpers import get_cached_qicon
+from .q_object_combo_model import QObjectComboModel
 from .qt_control import QtControl
 
 
@@ -62,6 +62,9 @@ class QtObjectCombo(QtControl, ProxyObjectCombo):
     #: A reference to the widget created by the proxy.
     widget = Typed(QComboBox)
 
+    #: A reference to the model which presents the items.
+    model = Typed(QObjectComboModel)
+
     #: A single shot refresh timer for queing combo refreshes.
     refresh_timer = Typed(ComboRefreshTimer)
 
@@ -84,8 +87,12 @@ class QtObjectCombo(QtControl, ProxyObjectCombo):
         """ Create the QComboBox widget.
 
         """
-        self.widget = QComboBox(self.parent_widget())
-        self.widget.setInsertPolicy(QComboBox.NoInsert)
+        widget = QComboBox(self.parent_widget())
+        widget.setInsertPolicy(QComboBox.NoInsert)
+        self.model = QObjectComboModel(widget)
+        widget.setModel(self.model)
+        widget.view().setUniformItemSizes(True)
+        self.widget = widget
 
     def init_widget(self):
         """ Create and initialize the underlying widget.
@@ -105,8 +112,9 @@ class QtObjectCombo(QtControl, ProxyObjectCombo):
         if not self._guard & SELECTED_GUARD:
             self._guard |= SELECTED_GUARD
             try:
-                item = self.declaration.items[index]
-                self.declaration.selected = item
+                if index >= 0:
+                    item = self.model.item(index)
+                    self.declaration.selected = item
             finally:
                 self._guard &= ~SELECTED_GUARD
 
@@ -116,30 +124,22 @@ class QtObjectCombo(QtControl, ProxyObjectCombo):
     def refresh_items(self):
         """ Refresh the items in the combo box.
 
+        The model applies the difference between its items and the
+        items of the declaration as row removals and insertions. The
+        text and icon of a row are computed when it is first shown.
+
         """
         d = self.declaration
+        items = d.items
         selected = d.selected
-        to_string = d.to_string
-        to_icon = d.to_icon
         widget = self.widget
         self._guard |= SELECTED_GUARD
         try:
-            widget.clear()
-            target_index = -1
-            for index, item in enumerate(d.items):
-                text = to_string(item)
-                icon = to_icon(item)
-                if icon is None:
-                    qicon = None
-                else:
-                    qicon = get_cached_qicon(icon)
-                if qicon is None:
-                    widget.addItem(text)
-                else:
-                    widget.addItem(qicon, text)
-                if item == selected:
-                    target_index = index
-            widget.setCurrentIndex(target_index)
+            self.model.set_items(items, d.to_string, d.to_icon)
+            index = widget.currentIndex()
+            if index < 0 or not items[index] == selected:
+                index = self.model.item_row(selected)
+            widget.setCurrentIndex(index)
         finally:
             self._guard &= ~SELECTED_GUARD
 
@@ -153,11 +153,7 @@ class QtObjectCombo(QtControl, ProxyObjectCombo):
         if not self._guard & SELECTED_GUARD:
             self._guard |= SELECTED_GUARD
             try:
-                d = self.declaration
-                try:
-                    index = d.items.index(selected)
-                except ValueError:
-                    index = -1
+                index = self.model.item_row(selected)
                 self.widget.setCurrentIndex(index)
             finally:
                 self._guard &= ~SELECTED_GUARD
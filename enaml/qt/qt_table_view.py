@@ -0,0 +1,62 @@
+#------------------------------------------------------------------------------
+# Copyright (c) 2013, Nucleic Development Team.
+#
+# Distributed under the terms of the Modified BSD License.
+#
+# The full license is in the file COPYING.txt, distributed with this software.
+#------------------------------------------------------------------------------
+from atom.api import Typed
+
+from enaml.widgets.table_view import ProxyTableView
+
+from .QtGui import QTableView
+
+from .qt_abstract_item_view import QtAbstractItemView
+
+
+class QtTableView(QtAbstractItemView, ProxyTableView):
+    """ A Qt implementation of an Enaml ProxyTableView.
+
+    """
+    #: A reference to the widget created by the proxy.
+    widget = Typed(QTableView)
+
+    #--------------------------------------------------------------------------
+    # Initialization API
+    #--------------------------------------------------------------------------
+    def create_widget(self):
+        """ Create the underlying table view widget.
+
+        """
+        self.widget = QTableView(self.parent_widget())
+
+    def init_widget(self):
+        """ Initialize the underlying widget.
+
+        """
+        super(QtTableView, self).init_widget()
+        d = self.declaration
+        self.set_show_horizontal_header(d.show_horizontal_header)
+        self.set_show_vertical_header(d.show_vertical_header)
+        self.set_show_grid(d.show_grid)
+
+    #--------------------------------------------------------------------------
+    # ProxyTableView API
+    #--------------------------------------------------------------------------
+    def set_show_horizontal_header(self, show):
+        """ Set whether the column headers are shown.
+
+        """
+        self.widget.horizontalHeader().setVisible(show)
+
+    def set_show_vertical_header(self, show):
+        """ Set whether the row headers are shown.
+
+        """
+        self.widget.verticalHeader().setVisible(show)
+
+    def set_show_grid(self, show):
+        """ Set whether the grid lines are drawn.
+
+        """
+        self.widget.setShowGrid(show)
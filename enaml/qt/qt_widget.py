@@ -86,14 +86,31 @@ class QtWidget(QtToolkitObject, ProxyWidget):
         parts = []
         name = self.widget.objectName()
         for style in StyleCache.styles(self.declaration):
-            t = translate_style(name, style)
+            t = StyleCache.toolkit_style(style, name, translate_style)
             if t:
                 parts.append(t)
         if len(parts) > 0:
             stylesheet = u'\n\n'.join(parts)
         else:
             stylesheet = u''
-        self.widget.setStyleSheet(stylesheet)
+        self.apply_style_sheet(stylesheet)
+
+    def apply_style_sheet(self, stylesheet):
+        """ Apply a style sheet string to the widget.
+
+        Qt re-parses the style sheet and repolishes the widget on every
+        call to setStyleSheet, so the style sheet is only applied when
+        it differs from the current style sheet of the widget.
+
+        Parameters
+        ----------
+        stylesheet : unicode
+            The Qt style sheet string to apply to the widget.
+
+        """
+        widget = self.widget
+        if widget.styleSheet() != stylesheet:
+            widget.setStyleSheet(stylesheet)
 
     #--------------------------------------------------------------------------
     # ProxyWidget API
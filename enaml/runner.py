@@ -16,6 +16,7 @@ import types
 from enaml import imports
 from enaml.core.parser import parse
 from enaml.core.enaml_compiler import EnamlCompiler
+from enaml.core.import_hooks import EnamlImporter, compile_cached
 
 
 def main():
@@ -25,6 +26,10 @@ def main():
     parser.add_option(
         '-c', '--component', default='Main', help='The component to view'
     )
+    parser.add_option(
+        '-d', '--cache-dir', default=EnamlImporter.cache_dir,
+        help='A central directory in which to cache compiled modules'
+    )
 
     options, args = parser.parse_args()
 
@@ -38,9 +43,15 @@ def main():
     with open(enaml_file, 'rU') as f:
         enaml_code = f.read()
 
-    # Parse and compile the Enaml source into a code object
-    ast = parse(enaml_code, filename=enaml_file)
-    code = EnamlCompiler.compile(ast, enaml_file)
+    # Parse and compile the Enaml source into a code object, using
+    # the central cache directory if one is available.
+    cache_dir = options.cache_dir
+    if cache_dir is not None:
+        enaml_path = os.path.abspath(enaml_file)
+        code = compile_cached(enaml_code, enaml_path, cache_dir)
+    else:
+        ast = parse(enaml_code, filename=enaml_file)
+        code = EnamlCompiler.compile(ast, enaml_file)
 
     # Create a proper module in which to execute the compiled code so
     # that exceptions get reported with better meaning
@@ -53,7 +64,7 @@ def main():
     sys.path.insert(0, os.path.abspath(os.path.dirname(enaml_file)))
     # Bung in the command line arguments.
     sys.argv = [enaml_file] + script_argv
-    with imports():
+    with imports(cache_dir=cache_dir):
         exec code in ns
 
     requested = options.component
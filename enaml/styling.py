@@ -66,6 +66,18 @@ def _comma_split(text):
     return result
 
 
+_SPACE_SPLIT_CACHE = {}
+
+def _space_split(text):
+    cache = _SPACE_SPLIT_CACHE
+    if text in cache:
+        return cache[text]
+    if len(cache) >= _MAX_CACHE:
+        cache.clear()
+    result = cache[text] = tuple(text.split())
+    return result
+
+
 class Style(Declarative):
     """ A declarative class for defining a style sheet style.
 
@@ -149,7 +161,7 @@ class Style(Declarative):
             if item_class:
                 count = 0
                 style_classes = _comma_split(self.style_class)
-                for item_class in item_class.split():
+                for item_class in _space_split(item_class):
                     if item_class in style_classes:
                         count += 1
                 if count > 0:
@@ -188,8 +200,11 @@ class Style(Declarative):
 
         """
         super(Style, self).child_added(child)
-        if self.is_initialized and isinstance(child, Setter):
-            StyleCache._style_setters_changed(self)
+        if isinstance(child, Setter):
+            if self.is_initialized:
+                StyleCache._style_setters_changed(self)
+            else:
+                StyleCache._style_translation_invalidated(self)
 
     def child_removed(self, child):
         """ A reimplemented child removed event handler.
@@ -199,12 +214,18 @@ class Style(Declarative):
 
         """
         super(Style, self).child_removed(child)
-        if self.is_initialized and isinstance(child, Setter):
-            StyleCache._style_setters_changed(self)
+        if isinstance(child, Setter):
+            if self.is_initialized:
+                StyleCache._style_setters_changed(self)
+            else:
+                StyleCache._style_translation_invalidated(self)
 
     @observe('element', 'style_class', 'object_name')
     def _invalidate_match_cache(self, change):
         if change['type'] == 'update':
+            parent = self.parent
+            if isinstance(parent, StyleSheet):
+                parent._index = None
             StyleCache._style_match_invalidated(self)
 
     @observe('pseudo_class', 'pseudo_element')
@@ -213,6 +234,99 @@ class Style(Declarative):
             StyleCache._style_pseudo_invalidated(self)
 
 
+class _StyleIndex(Atom):
+    """ An index of the styles of a style sheet by selector.
+
+    Each style is indexed under the most selective of its selectors:
+    the object name, then the style class, then the element. Styles
+    with no selectors are universal. The candidate styles for an item
+    are the union of the buckets for its name, its style classes, and
+    the names of the types in its mro, plus the universal styles.
+
+    """
+    #: A mapping of object name to list of (position, style).
+    names = Typed(dict, ())
+
+    #: A mapping of style class to list of (position, style).
+    classes = Typed(dict, ())
+
+    #: A mapping of element name to list of (position, style).
+    elements = Typed(dict, ())
+
+    #: The list of (position, style) for the universal styles.
+    universal = Typed(list, ())
+
+    #: A cache of item type to list of (position, style) for the
+    #: element styles which may match the type.
+    types = Typed(dict, ())
+
+    def __init__(self, styles):
+        """ Initialize a _StyleIndex.
+
+        Parameters
+        ----------
+        styles : list
+            The :class:`Style` objects of the style sheet, in order.
+
+        """
+        super(_StyleIndex, self).__init__()
+        for entry in enumerate(styles):
+            style = entry[1]
+            if style.object_name:
+                buckets = self.names
+                keys = _comma_split(style.object_name)
+            elif style.style_class:
+                buckets = self.classes
+                keys = _comma_split(style.style_class)
+            elif style.element:
+                buckets = self.elements
+                keys = _comma_split(style.element)
+            else:
+                self.universal.append(entry)
+                continue
+            for key in set(keys):
+                buckets.setdefault(key, []).append(entry)
+
+    def candidates(self, item):
+        """ Get the styles which may match an item.
+
+        Parameters
+        ----------
+        item : :class:`Stylable`
+            The item of interest.
+
+        Returns
+        -------
+        result : dict
+            A mapping of position to :class:`Style` for the styles
+            which may match the item.
+
+        """
+        result = dict(self.universal)
+        if self.names:
+            name = item.name
+            if name and name in self.names:
+                result.update(self.names[name])
+        if self.classes:
+            classes = self.classes
+            for style_class in _space_split(item.style_class):
+                if style_class in classes:
+                    result.update(classes[style_class])
+        if self.elements:
+            item_type = type(item)
+            types = self.types
+            if item_type in types:
+                entries = types[item_type]
+            else:
+                elements = self.elements
+                entries = []
+                for t in item_type.__mro__:
+                    entries.extend(elements.get(t.__name__, ()))
+                types[item_type] = entries
+            result.update(entries)
+        return result
+
+
 class StyleSheet(Declarative):
     """ A declarative class for defining a widget style sheet.
 
@@ -230,6 +344,10 @@ class StyleSheet(Declarative):
     order of their match specificity within the style sheet.
 
     """
+    #: A private index of the child styles by selector. This is built
+    #: on demand and discarded when the styles or selectors change.
+    _index = Typed(_StyleIndex)
+
     def destroy(self):
         """ A reimplemented destructor.
 
@@ -251,6 +369,35 @@ class StyleSheet(Declarative):
         """
         return [c for c in self.children if isinstance(c, Style)]
 
+    def match_styles(self, item):
+        """ Get the :class:`Style` objects which match an item.
+
+        Only the styles indexed under the name, the style classes, or
+        the element types of the item are tested for a match.
+
+        Parameters
+        ----------
+        item : :class:`Stylable`
+            The stylable item of interest.
+
+        Returns
+        -------
+        result : list
+            The :class:`Style` objects of the style sheet which match
+            the item, in order of ascending precedence.
+
+        """
+        index = self._index
+        if index is None:
+            index = self._index = _StyleIndex(self.styles())
+        matches = []
+        for position, style in index.candidates(item).iteritems():
+            specificity = style.match(item)
+            if specificity >= 0:
+                matches.append((specificity, position, style))
+        matches.sort()
+        return [style for _1, _2, style in matches]
+
     def child_added(self, child):
         """ A reimplemented child added event handler.
 
@@ -260,8 +407,10 @@ class StyleSheet(Declarative):
 
         """
         super(StyleSheet, self).child_added(child)
-        if self.is_initialized and isinstance(child, Style):
-            StyleCache._style_sheet_styles_changed(self)
+        if isinstance(child, Style):
+            self._index = None
+            if self.is_initialized:
+                StyleCache._style_sheet_styles_changed(self)
 
     def child_removed(self, child):
         """ A reimplemented child removed event handler.
@@ -271,8 +420,10 @@ class StyleSheet(Declarative):
 
         """
         super(StyleSheet, self).child_removed(child)
-        if self.is_initialized and isinstance(child, Style):
-            StyleCache._style_sheet_styles_changed(self)
+        if isinstance(child, Style):
+            self._index = None
+            if self.is_initialized:
+                StyleCache._style_sheet_styles_changed(self)
 
 
 class Stylable(Declarative):
@@ -362,6 +513,12 @@ class Stylable(Declarative):
 
 
 class _RestyleTask(Atom):
+    """ A deferred task which restyles a batch of dirty items.
+
+    All restyle requests made before the task runs are collected into
+    a single pass, so an item is restyled at most once per pass.
+
+    """
     dirty = Typed(set, ())
     def __call__(self):
         StyleCache._restyle_task = None
@@ -369,6 +526,11 @@ class _RestyleTask(Atom):
             item.restyle()
 
 
+# The object name given to the style translators. The translated style
+# is split on it to form a template shared by every styled object.
+_NAME_PLACEHOLDER = u'\x00'
+
+
 def _app_style_sheet():
     app = Application.instance()
     if app is not None:
@@ -402,6 +564,11 @@ class StyleCache(object):
     #: A private mapping of Setter to toolkit data.
     _toolkit_setters = {}
 
+    #: A private mapping of Style to dict of toolkit data. The inner
+    #: dict maps a translator to the tuple of pieces of the translated
+    #: style between the occurrences of the object name, or None.
+    _toolkit_styles = {}
+
     #: A RestyleTask which collapses item restyle requests.
     _restyle_task = None
 
@@ -467,14 +634,7 @@ class StyleCache(object):
             return cache[item]
         styles = []
         for sheet in cls.style_sheets(item):
-            matches = []
-            for style in sheet.styles():
-                specificity = style.match(item)
-                if specificity >= 0:
-                    matches.append((specificity, len(matches), style))
-            if matches:
-                matches.sort()
-                styles.extend(style for _1, _2, style in matches)
+            styles.extend(sheet.match_styles(item))
         style_items = cls._style_items
         for style in styles:
             style_items[style].add(item)
@@ -511,6 +671,52 @@ class StyleCache(object):
         result = cache[setter] = translate(setter)
         return result
 
+    @classmethod
+    def toolkit_style(cls, style, name, translate):
+        """ Get the toolkit representation of a style for an object.
+
+        The translator is invoked once per style with a placeholder in
+        place of the object name, and the result is cached as a template
+        which is shared by every object styled by the style. The cached
+        template will be cleared when the style or any of its setters
+        is invalidated.
+
+        Parameters
+        ----------
+        style : :class:`Style`
+            The style of interest.
+
+        name : unicode
+            The object name of the toolkit object being styled.
+
+        translate : callable
+            A callable which accepts the object name and the
+            :class:`Style` as arguments and returns a toolkit
+            representation of the style, or None. The translator must
+            only use the name by inserting it into the result.
+
+        Returns
+        -------
+        result : object
+            The toolkit representation of the style.
+
+        """
+        cache = cls._toolkit_styles.get(style)
+        if cache is None:
+            cache = cls._toolkit_styles[style] = {}
+        if translate in cache:
+            pieces = cache[translate]
+        else:
+            template = translate(_NAME_PLACEHOLDER, style)
+            if template is not None:
+                pieces = tuple(template.split(_NAME_PLACEHOLDER))
+            else:
+                pieces = None
+            cache[translate] = pieces
+        if pieces is None:
+            return None
+        return name.join(pieces)
+
     #--------------------------------------------------------------------------
     # Protected Framework API
     #--------------------------------------------------------------------------
@@ -527,6 +733,7 @@ class StyleCache(object):
         # get a child_removed event which will trigger a restyle pass.
         # That logic does not need to be repeated here.
         cls._style_items.pop(style, None)
+        cls._toolkit_styles.pop(style, None)
 
     @classmethod
     def _style_sheet_destroyed(cls, sheet):
@@ -538,6 +745,9 @@ class StyleCache(object):
     @classmethod
     def _item_destroyed(cls, item):
         cls._queried_items.discard(item)
+        task = cls._restyle_task
+        if task is not None:
+            task.dirty.discard(item)
         sheets = cls._item_style_sheets.pop(item, None)
         if sheets is not None:
             sheet_items = cls._style_sheet_items
@@ -554,6 +764,7 @@ class StyleCache(object):
     @classmethod
     def _setter_invalidated(cls, setter):
         cls._toolkit_setters.pop(setter, None)
+        cls._toolkit_styles.pop(setter.parent, None)
         items = cls._style_items.get(setter.parent)
         if items is not None:
             cls._request_restyle(items)
@@ -570,6 +781,7 @@ class StyleCache(object):
 
     @classmethod
     def _style_pseudo_invalidated(cls, style):
+        cls._toolkit_styles.pop(style, None)
         items = cls._style_items.get(style)
         if items is not None:
             cls._request_restyle(items)
@@ -584,8 +796,13 @@ class StyleCache(object):
                     style_items[style].discard(item)
         cls._request_restyle((item,))
 
+    @classmethod
+    def _style_translation_invalidated(cls, style):
+        cls._toolkit_styles.pop(style, None)
+
     @classmethod
     def _style_setters_changed(cls, style):
+        cls._toolkit_styles.pop(style, None)
         items = cls._style_items.get(style)
         if items is not None:
             cls._request_restyle(items)
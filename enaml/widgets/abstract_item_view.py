@@ -0,0 +1,76 @@
+#------------------------------------------------------------------------------
+# Copyright (c) 2013, Nucleic Development Team.
+#
+# Distributed under the terms of the Modified BSD License.
+#
+# The full license is in the file COPYING.txt, distributed with this software.
+#------------------------------------------------------------------------------
+from atom.api import (
+    Bool, Enum, Event, Typed, ForwardTyped, observe, set_default
+)
+
+from enaml.core.declarative import d_
+
+from .control import Control, ProxyControl
+from .item_model import ItemModel
+
+
+class ProxyAbstractItemView(ProxyControl):
+    """ The abstract definition of a proxy AbstractItemView object.
+
+    """
+    #: A reference to the AbstractItemView declaration.
+    declaration = ForwardTyped(lambda: AbstractItemView)
+
+    def set_model(self, model):
+        raise NotImplementedError
+
+    def set_selection_mode(self, mode):
+        raise NotImplementedError
+
+    def set_alternating_row_colors(self, alternate):
+        raise NotImplementedError
+
+
+class AbstractItemView(Control):
+    """ A base class for controls which display the items of a model.
+
+    An item view presents the data of an ItemModel. The view only asks
+    the model for the data of the visible items, so the cost of the
+    view does not depend on the size of the model.
+
+    """
+    #: The model which provides the data for the view.
+    model = d_(Typed(ItemModel))
+
+    #: The selection mode of the view.
+    selection_mode = d_(
+        Enum('single', 'contiguous', 'extended', 'multi', 'none')
+    )
+
+    #: Whether the rows of the view are drawn with alternating colors.
+    alternating_row_colors = d_(Bool(False))
+
+    #: Fired when an item is activated by the user. The payload will be
+    #: the (row, column) tuple of the item. This event is triggered by
+    #: the proxy object when an item is double clicked or selected with
+    #: the keyboard.
+    activated = d_(Event(tuple), writable=False)
+
+    #: An item view expands freely in height and width by default.
+    hug_width = set_default('ignore')
+    hug_height = set_default('ignore')
+
+    #: A reference to the ProxyAbstractItemView object.
+    proxy = Typed(ProxyAbstractItemView)
+
+    #--------------------------------------------------------------------------
+    # Observers
+    #--------------------------------------------------------------------------
+    @observe('model', 'selection_mode', 'alternating_row_colors')
+    def _update_proxy(self, change):
+        """ An observer which sends state change to the proxy.
+
+        """
+        # The superclass handler implementation is sufficient.
+        super(AbstractItemView, self)._update_proxy(change)
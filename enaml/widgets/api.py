@@ -28,7 +28,9 @@ from .frame import Border
 from .group_box import GroupBox
 from .html import Html
 from .image_view import ImageView
+from .item_model import ItemModel, ListItemModel
 from .label import Label
+from .list_view import ListView
 from .main_window import MainWindow
 from .mdi_area import MdiArea
 from .mdi_window import MdiWindow
@@ -54,6 +56,7 @@ from .stack import Stack, Transition
 from .stack_item import StackItem
 from .status_bar import StatusBar
 from .status_item import StatusItem
+from .table_view import TableView
 from .time_selector import TimeSelector
 from .timer import Timer
 from .tool_bar import ToolBar
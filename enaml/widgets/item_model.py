@@ -0,0 +1,263 @@
+#------------------------------------------------------------------------------
+# Copyright (c) 2013, Nucleic Development Team.
+#
+# Distributed under the terms of the Modified BSD License.
+#
+# The full license is in the file COPYING.txt, distributed with this software.
+#------------------------------------------------------------------------------
+from atom.api import Atom, Callable, Event, List
+
+
+class ItemModel(Atom):
+    """ An abstract model which provides lazy data for an item view.
+
+    An item view only asks its model for the data of the cells which
+    are visible, so a model can present a very large data set without
+    creating an object per cell. Subclasses must implement the
+    `row_count` and `data` methods, and should call the `notify_*`
+    methods after the data they present has changed.
+
+    """
+    #: An event emitted when the model has changed. The payload is a
+    #: tuple whose first item is the kind of change, one of 'data',
+    #: 'rows_inserted', 'rows_removed', 'columns_inserted',
+    #: 'columns_removed', or 'reset'. The remaining items are the
+    #: arguments to the corresponding `notify_*` method. This event
+    #: is used by the toolkit adapters and should not be emitted
+    #: directly.
+    changed = Event(tuple)
+
+    #--------------------------------------------------------------------------
+    # Abstract API
+    #--------------------------------------------------------------------------
+    def row_count(self):
+        """ Get the number of rows in the model.
+
+        Returns
+        -------
+        result : int
+            The number of rows in the model.
+
+        """
+        raise NotImplementedError
+
+    def column_count(self):
+        """ Get the number of columns in the model.
+
+        The default implementation returns 1.
+
+        Returns
+        -------
+        result : int
+            The number of columns in the model.
+
+        """
+        return 1
+
+    def data(self, row, column):
+        """ Get the data to display for a cell of the model.
+
+        This method is called for the visible cells of a view, each
+        time a cell is painted. It should be cheap.
+
+        Parameters
+        ----------
+        row : int
+            The row of the cell.
+
+        column : int
+            The column of the cell.
+
+        Returns
+        -------
+        result : object
+            The unicode string or number to display in the cell, or
+            None if the cell is empty.
+
+        """
+        raise NotImplementedError
+
+    def header_data(self, section, orientation):
+        """ Get the data to display for a header section.
+
+        The default implementation returns None, which lets the
+        toolkit choose the header text.
+
+        Parameters
+        ----------
+        section : int
+            The row or column of the section.
+
+        orientation : str
+            The orientation of the header, either 'horizontal' for the
+            column headers or 'vertical' for the row headers.
+
+        Returns
+        -------
+        result : object
+            The unicode string to display in the section, or None.
+
+        """
+        return None
+
+    #--------------------------------------------------------------------------
+    # Notification API
+    #--------------------------------------------------------------------------
+    def notify_data_changed(self, first_row, first_column, last_row,
+                            last_column):
+        """ Notify the views that the data of a range of cells changed.
+
+        The views coalesce the data changes which are notified during
+        a cycle of the event loop into a single update.
+
+        Parameters
+        ----------
+        first_row, first_column : int
+            The top left cell of the inclusive range.
+
+        last_row, last_column : int
+            The bottom right cell of the inclusive range.
+
+        """
+        self.changed(('data', first_row, first_column, last_row, last_column))
+
+    def notify_rows_inserted(self, first, last):
+        """ Notify the views that rows were inserted into the model.
+
+        This should be called after the rows are inserted.
+
+        Parameters
+        ----------
+        first, last : int
+            The inclusive range of the inserted rows, as indices in
+            the updated model.
+
+        """
+        self.changed(('rows_inserted', first, last))
+
+    def notify_rows_removed(self, first, last):
+        """ Notify the views that rows were removed from the model.
+
+        This should be called after the rows are removed. The views do
+        not request the data of the removed rows from the model.
+
+        Parameters
+        ----------
+        first, last : int
+            The inclusive range of the removed rows, as indices in the
+            model before the removal.
+
+        """
+        self.changed(('rows_removed', first, last))
+
+    def notify_columns_inserted(self, first, last):
+        """ Notify the views that columns were inserted into the model.
+
+        This should be called after the columns are inserted.
+
+        Parameters
+        ----------
+        first, last : int
+            The inclusive range of the inserted columns, as indices in
+            the updated model.
+
+        """
+        self.changed(('columns_inserted', first, last))
+
+    def notify_columns_removed(self, first, last):
+        """ Notify the views that columns were removed from the model.
+
+        This should be called after the columns are removed. The views do
+        not request the data of the removed columns from the model.
+
+        Parameters
+        ----------
+        first, last : int
+            The inclusive range of the removed columns, as indices in
+            the model before the removal.
+
+        """
+        self.changed(('columns_removed', first, last))
+
+    def notify_reset(self):
+        """ Notify the views that the entire model has changed.
+
+        """
+        self.changed(('reset',))
+
+
+class ListItemModel(ItemModel):
+    """ An item model which presents a list of objects in one column.
+
+    Assigning a new list to 'items' notifies the views of the rows
+    which differ from the old list. The list should not be modified
+    in-place.
+
+    """
+    #: The list of objects presented by the model.
+    items = List()
+
+    #: The callable to use to convert the items into unicode strings
+    #: for display. The default is the builtin 'unicode'.
+    to_string = Callable(unicode)
+
+    #: The header for the column of the model.
+    header = Callable(lambda section, orientation: None)
+
+    #--------------------------------------------------------------------------
+    # ItemModel API
+    #--------------------------------------------------------------------------
+    def row_count(self):
+        """ Get the number of rows in the model.
+
+        """
+        return len(self.items)
+
+    def data(self, row, column):
+        """ Get the data to display for a cell of the model.
+
+        """
+        return self.to_string(self.items[row])
+
+    def header_data(self, section, orientation):
+        """ Get the data to display for a header section.
+
+        """
+        return self.header(section, orientation)
+
+    #--------------------------------------------------------------------------
+    # Observers
+    #--------------------------------------------------------------------------
+    def _observe_items(self, change):
+        """ Notify the views of the rows which changed.
+
+        The leading and trailing items which are identical in the old
+        and new lists are kept, and the rows between them are notified
+        as removed and inserted.
+
+        """
+        if change['type'] != 'update':
+            return
+        old = change['oldvalue']
+        new = change['value']
+        old_end = len(old)
+        new_end = len(new)
+        start = 0
+        limit = min(old_end, new_end)
+        while start < limit and old[start] is new[start]:
+            start += 1
+        while (old_end > start and new_end > start and
+               old[old_end - 1] is new[new_end - 1]):
+            old_end -= 1
+            new_end -= 1
+        if old_end > start:
+            self.notify_rows_removed(start, old_end - 1)
+        if new_end > start:
+            self.notify_rows_inserted(start, new_end - 1)
+
+    def _observe_to_string(self, change):
+        """ Notify the views that the displayed data changed.
+
+        """
+        if change['type'] == 'update' and self.items:
+            self.notify_data_changed(0, 0, len(self.items) - 1, 0)
@@ -0,0 +1,48 @@
+#------------------------------------------------------------------------------
+# Copyright (c) 2013, Nucleic Development Team.
+#
+# Distributed under the terms of the Modified BSD License.
+#
+# The full license is in the file COPYING.txt, distributed with this software.
+#------------------------------------------------------------------------------
+from atom.api import Int, Typed, ForwardTyped, observe
+
+from enaml.core.declarative import d_
+
+from .abstract_item_view import AbstractItemView, ProxyAbstractItemView
+
+
+class ProxyListView(ProxyAbstractItemView):
+    """ The abstract definition of a proxy ListView object.
+
+    """
+    #: A reference to the ListView declaration.
+    declaration = ForwardTyped(lambda: ListView)
+
+    def set_model_column(self, column):
+        raise NotImplementedError
+
+
+class ListView(AbstractItemView):
+    """ A control which displays one column of a model as a list.
+
+    The items are laid out with a uniform height, so the view does not
+    need to measure the rows of the model which are not shown.
+
+    """
+    #: The column of the model which is displayed by the list.
+    model_column = d_(Int(0))
+
+    #: A reference to the ProxyListView object.
+    proxy = Typed(ProxyListView)
+
+    #--------------------------------------------------------------------------
+    # Observers
+    #--------------------------------------------------------------------------
+    @observe('model_column')
+    def _update_proxy(self, change):
+        """ An observer which sends state change to the proxy.
+
+        """
+        # The superclass handler implementation is sufficient.
+        super(ListView, self)._update_proxy(change)
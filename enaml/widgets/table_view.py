@@ -0,0 +1,61 @@
+#------------------------------------------------------------------------------
+# Copyright (c) 2013, Nucleic Development Team.
+#
+# Distributed under the terms of the Modified BSD License.
+#
+# The full license is in the file COPYING.txt, distributed with this software.
+#------------------------------------------------------------------------------
+from atom.api import Bool, Typed, ForwardTyped, observe
+
+from enaml.core.declarative import d_
+
+from .abstract_item_view import AbstractItemView, ProxyAbstractItemView
+
+
+class ProxyTableView(ProxyAbstractItemView):
+    """ The abstract definition of a proxy TableView object.
+
+    """
+    #: A reference to the TableView declaration.
+    declaration = ForwardTyped(lambda: TableView)
+
+    def set_show_horizontal_header(self, show):
+        raise NotImplementedError
+
+    def set_show_vertical_header(self, show):
+        raise NotImplementedError
+
+    def set_show_grid(self, show):
+        raise NotImplementedError
+
+
+class TableView(AbstractItemView):
+    """ A control which displays the rows and columns of a model.
+
+    The data for a cell is requested from the model when the cell is
+    shown, which allows the view to display models with millions of
+    rows.
+
+    """
+    #: Whether or not to show the column headers.
+    show_horizontal_header = d_(Bool(True))
+
+    #: Whether or not to show the row headers.
+    show_vertical_header = d_(Bool(True))
+
+    #: Whether or not to draw the grid lines between the cells.
+    show_grid = d_(Bool(True))
+
+    #: A reference to the ProxyTableView object.
+    proxy = Typed(ProxyTableView)
+
+    #--------------------------------------------------------------------------
+    # Observers
+    #--------------------------------------------------------------------------
+    @observe('show_horizontal_header', 'show_vertical_header', 'show_grid')
+    def _update_proxy(self, change):
+        """ An observer which sends state change to the proxy.
+
+        """
+        # The superclass handler implementation is sufficient.
+        super(TableView, self)._update_proxy(change)
@@ -84,6 +84,11 @@ setup(
             'enaml_dock_resources.qrc'
         ],
     },
-    entry_points={'console_scripts': ['enaml-run = enaml.runner:main']},
+    entry_points={
+        'console_scripts': [
+            'enaml-run = enaml.runner:main',
+            'enaml-compileall = enaml.compileall:main',
+        ],
+    },
     ext_modules=ext_modules,
 )
@@ -0,0 +1,168 @@
+#------------------------------------------------------------------------------
+# Copyright (c) 2013, Nucleic Development Team.
+#
+# Distributed under the terms of the Modified BSD License.
+#
+# The full license is in the file COPYING.txt, distributed with this software.
+#------------------------------------------------------------------------------
+from atom.api import Bool, List
+
+from enaml.application import Application, ProxyResolver
+from enaml.widgets.toolkit_object import ToolkitObject, ProxyToolkitObject
+
+
+class DummyApplication(Application):
+
+    deferred = List()
+
+    main_thread = Bool(True)
+
+    def stop(self):
+        pass
+
+    def deferred_call(self, callback, *args, **kwargs):
+        self.deferred.append((callback, args, kwargs))
+
+    def is_main_thread(self):
+        return self.main_thread
+
+    def run_cycle(self):
+        """ Run the calls deferred before this cycle of the event loop.
+
+        """
+        calls = self.deferred[:]
+        del self.deferred[:]
+        for callback, args, kwargs in calls:
+            callback(*args, **kwargs)
+
+
+class ProxyObject(ProxyToolkitObject):
+    pass
+
+
+class Object(ToolkitObject):
+    pass
+
+
+class SubObject(Object):
+    pass
+
+
+def make_app(calls):
+    def factory():
+        calls.append(1)
+        return ProxyObject
+    app = DummyApplication()
+    app.resolver = ProxyResolver(factories={'Object': factory})
+    return app
+
+
+def test_proxy_cache():
+    calls = []
+    app = make_app(calls)
+    try:
+        for i in range(3):
+            assert isinstance(app.create_proxy(SubObject()), ProxyObject)
+        assert len(calls) == 1
+        info = app.proxy_cache_info()
+        assert info == {'hits': 2, 'misses': 1, 'size': 1}
+    finally:
+        app.destroy()
+
+
+def test_proxy_cache_invalidation():
+    calls = []
+    app = make_app(calls)
+    try:
+        app.create_proxy(Object())
+        app.resolver = ProxyResolver(factories=app.resolver.factories)
+        assert app.proxy_cache_info()['size'] == 0
+        app.create_proxy(Object())
+        assert len(calls) == 2
+        app.clear_proxy_cache()
+        assert app.proxy_cache_info()['size'] == 0
+    finally:
+        app.destroy()
+
+
+def test_preload_proxies():
+    calls = []
+    app = make_app(calls)
+    try:
+        app.preload_proxies()
+        assert len(calls) == 1
+    finally:
+        app.destroy()
+
+
+def test_schedule_one_task_per_cycle():
+    app = DummyApplication(main_thread=False)
+    try:
+        results = []
+        for i in range(3):
+            app.schedule(results.append, (i,))
+        app.run_cycle()
+        app.run_cycle()
+        assert results == [0]
+        app.run_cycle()
+        app.run_cycle()
+        assert results == [0, 1, 2]
+        assert not app.has_pending_tasks()
+    finally:
+        app.destroy()
+
+
+def test_schedule_time_slice():
+    app = DummyApplication()
+    try:
+        app.schedule_time_slice = 10.0
+        results = []
+        for i in range(5):
+            app.schedule(results.append, (i,))
+        app.schedule(results.append, ('low',), priority=-1)
+        app.run_cycle()
+        assert results == [0, 1, 2, 3, 4]
+        app.run_cycle()
+        assert results == [0, 1, 2, 3, 4, 'low']
+        assert not app.has_pending_tasks()
+        app.run_cycle()
+        assert app.deferred == []
+        info = app.task_queue_info()
+        assert info['depth'] == 0
+        assert info['max_depth'] == 6
+        assert info['run'] == 6
+        assert info['max_latency'] >= info['mean_latency'] > 0.0
+        app.reset_task_queue_info()
+        assert app.task_queue_info()['run'] == 0
+    finally:
+        app.destroy()
+
+
+def test_schedule_coalesced():
+    app = DummyApplication(main_thread=False)
+    try:
+        results = []
+        notified = []
+        record = lambda value: results.append(value)
+        task = app.schedule_coalesced('a', record, (1,))
+        task.notify(notified.append)
+        other = app.schedule_coalesced('b', record, ('b',))
+        assert app.schedule_coalesced('a', record, (2,)) is task
+        assert app.schedule_coalesced('a', record, (3,)) is task
+        assert other is not task
+        while app.deferred:
+            app.run_cycle()
+        assert results == [3, 'b']
+        assert notified == [None]
+        assert not task.pending()
+        assert app.task_queue_info()['coalesced'] == 2
+        again = app.schedule_coalesced('a', record, (4,))
+        assert again is not task
+        again.unschedule()
+        last = app.schedule_coalesced('a', record, (5,))
+        assert last is not again
+        while app.deferred:
+            app.run_cycle()
+        assert results == [3, 'b', 5]
+    finally:
+        app.destroy()
@@ -0,0 +1,58 @@
+#------------------------------------------------------------------------------
+# Copyright (c) 2013, Nucleic Development Team.
+#
+# Distributed under the terms of the Modified BSD License.
+#
+# The full license is in the file COPYING.txt, distributed with this software.
+#------------------------------------------------------------------------------
+import os
+import shutil
+import tempfile
+from textwrap import dedent
+
+from enaml.compileall import compile_paths
+from enaml.core.import_hooks import make_file_info
+
+
+SOURCE = dedent("""\
+from enaml.widgets.api import Window
+
+enamldef Main(Window):
+    pass
+
+""")
+
+
+def make_tree():
+    root = tempfile.mkdtemp(prefix='enaml-test-')
+    pkg = os.path.join(root, 'pkg')
+    os.mkdir(pkg)
+    paths = [os.path.join(root, 'a.enaml'), os.path.join(pkg, 'b.enaml')]
+    for path in paths:
+        with open(path, 'w') as f:
+            f.write(SOURCE)
+    return root, paths
+
+
+def test_compile_paths():
+    root, paths = make_tree()
+    try:
+        assert not compile_paths([root], check=True, quiet=True)
+        assert compile_paths([root], quiet=True)
+        for path in paths:
+            assert os.path.exists(make_file_info(path).cache_path)
+        assert compile_paths([root], check=True, quiet=True)
+    finally:
+        shutil.rmtree(root)
+
+
+def test_compile_paths_failure():
+    root, paths = make_tree()
+    try:
+        with open(paths[0], 'w') as f:
+            f.write('enamldef (:\n')
+        assert not compile_paths([root], quiet=True)
+        assert not os.path.exists(make_file_info(paths[0]).cache_path)
+        assert os.path.exists(make_file_info(paths[1]).cache_path)
+    finally:
+        shutil.rmtree(root)
@@ -0,0 +1,87 @@
+#------------------------------------------------------------------------------
+# Copyright (c) 2013, Nucleic Development Team.
+#
+# Distributed under the terms of the Modified BSD License.
+#
+# The full license is in the file COPYING.txt, distributed with this software.
+#------------------------------------------------------------------------------
+import os
+import shutil
+import sys
+import tempfile
+from textwrap import dedent
+
+from enaml.core.import_hooks import (
+    CACHEDIR, EnamlImporter, MAGIC_TAG, compile_cached, imports,
+    make_cache_path, read_cache, write_cache
+)
+
+
+SOURCE = dedent("""\
+from enaml.widgets.api import Window
+
+enamldef Main(Window):
+    title = 'cached'
+
+""")
+
+
+def make_temp_dir():
+    return tempfile.mkdtemp(prefix='enaml-test-')
+
+
+def test_write_cache_atomic():
+    temp_dir = make_temp_dir()
+    try:
+        cache_path = os.path.join(temp_dir, 'cache', 'test.enamlc')
+        code = compile('x = 1', '<test>', 'exec')
+        write_cache(code, 42, cache_path)
+        assert os.listdir(os.path.dirname(cache_path)) == ['test.enamlc']
+        assert read_cache(cache_path) == code
+        write_cache(code, 42, cache_path)
+        assert os.listdir(os.path.dirname(cache_path)) == ['test.enamlc']
+    finally:
+        shutil.rmtree(temp_dir)
+
+
+def test_make_cache_path():
+    path = make_cache_path('cache', 'a.enaml', SOURCE)
+    assert os.path.dirname(path) == 'cache'
+    assert MAGIC_TAG in path
+    assert path == make_cache_path('cache', 'a.enaml', SOURCE)
+    assert path != make_cache_path('cache', 'b.enaml', SOURCE)
+    assert path != make_cache_path('cache', 'a.enaml', SOURCE + '\n')
+
+
+def test_compile_cached():
+    temp_dir = make_temp_dir()
+    try:
+        code = compile_cached(SOURCE, 'main.enaml', temp_dir)
+        cache_path = make_cache_path(temp_dir, 'main.enaml', SOURCE)
+        assert os.path.exists(cache_path)
+        assert compile_cached(SOURCE, 'main.enaml', temp_dir) == code
+    finally:
+        shutil.rmtree(temp_dir)
+
+
+def test_import_central_cache():
+    src_dir = make_temp_dir()
+    cache_dir = make_temp_dir()
+    modname = 'enaml_cache_test_module'
+    try:
+        src_path = os.path.join(src_dir, modname + '.enaml')
+        with open(src_path, 'w') as f:
+            f.write(SOURCE)
+        sys.path.insert(0, src_dir)
+        with imports(cache_dir=cache_dir):
+            assert EnamlImporter.cache_dir == cache_dir
+            __import__(modname)
+        assert EnamlImporter.cache_dir != cache_dir
+        assert not os.path.exists(os.path.join(src_dir, CACHEDIR))
+        cache_path = make_cache_path(cache_dir, src_path, SOURCE)
+        assert os.path.exists(cache_path)
+    finally:
+        sys.path.remove(src_dir)
+        sys.modules.pop(modname, None)
+        shutil.rmtree(src_dir)
+        shutil.rmtree(cache_dir)
@@ -0,0 +1,83 @@
+#------------------------------------------------------------------------------
+# Copyright (c) 2013, Nucleic Development Team.
+#
+# Distributed under the terms of the Modified BSD License.
+#
+# The full license is in the file COPYING.txt, distributed with this software.
+#------------------------------------------------------------------------------
+import os
+import shutil
+import sys
+import tempfile
+from textwrap import dedent
+
+from enaml.core import import_profile
+from enaml.core.import_hooks import imports
+
+
+OUTER = dedent("""\
+from enaml_profile_test_inner import Inner
+
+enamldef Outer(Inner):
+    pass
+
+""")
+
+
+INNER = dedent("""\
+from enaml.core.api import Declarative
+
+enamldef Inner(Declarative):
+    attr value = 1
+
+""")
+
+
+def import_tree(src_dir):
+    sources = {
+        'enaml_profile_test_outer': OUTER,
+        'enaml_profile_test_inner': INNER,
+    }
+    for modname, source in sources.iteritems():
+        with open(os.path.join(src_dir, modname + '.enaml'), 'w') as f:
+            f.write(source)
+    sys.path.insert(0, src_dir)
+    try:
+        with imports():
+            __import__('enaml_profile_test_outer')
+    finally:
+        sys.path.remove(src_dir)
+        for modname in sources:
+            sys.modules.pop(modname, None)
+
+
+def test_import_profile_tree():
+    src_dir = tempfile.mkdtemp(prefix='enaml-test-')
+    was_enabled = import_profile.is_enabled()
+    import_profile.disable()
+    import_profile.enable()
+    try:
+        import_tree(src_dir)
+        records = import_profile.records()
+        assert len(records) == 1
+        outer = records[0]
+        assert outer.name == 'enaml_profile_test_outer'
+        assert [c.name for c in outer.children] == ['enaml_profile_test_inner']
+        inner = outer.children[0]
+        assert inner.phases['parse'] > 0.0
+        assert inner.phases['compile'] > 0.0
+        assert outer.phases['exec'] >= inner.total
+        assert 0.0 <= outer.self_time() <= outer.total
+
+        import_profile.reset()
+        import_tree(src_dir)
+        inner = import_profile.records()[0].children[0]
+        assert inner.phases['unmarshal'] > 0.0
+        assert inner.phases['parse'] == 0.0
+        report = import_profile.format_report()
+        assert '  enaml_profile_test_inner' in report
+    finally:
+        import_profile.disable()
+        if was_enabled:
+            import_profile.enable(sys.stderr)
+        shutil.rmtree(src_dir)
@@ -0,0 +1,126 @@
+#------------------------------------------------------------------------------
+# Copyright (c) 2013, Nucleic Development Team.
+#
+# Distributed under the terms of the Modified BSD License.
+#
+# The full license is in the file COPYING.txt, distributed with this software.
+#------------------------------------------------------------------------------
+from nose.tools import raises
+
+from enaml.null.null_application import NullApplication
+from enaml.widgets.item_model import ItemModel, ListItemModel
+
+from utils import compile_source
+
+
+class RangeModel(ItemModel):
+    """ A model which computes its cells from their indices.
+
+    """
+    def row_count(self):
+        return 1000000
+
+    def column_count(self):
+        return 3
+
+    def data(self, row, column):
+        return row * 3 + column
+
+
+def record_changes(model):
+    changes = []
+    model.observe('changed', lambda change: changes.append(change['value']))
+    return changes
+
+
+def test_item_model_notifications():
+    model = RangeModel()
+    changes = record_changes(model)
+    model.notify_data_changed(0, 0, 9, 2)
+    model.notify_rows_inserted(5, 7)
+    model.notify_rows_removed(0, 0)
+    model.notify_columns_inserted(1, 1)
+    model.notify_columns_removed(2, 2)
+    model.notify_reset()
+    assert changes == [
+        ('data', 0, 0, 9, 2),
+        ('rows_inserted', 5, 7),
+        ('rows_removed', 0, 0),
+        ('columns_inserted', 1, 1),
+        ('columns_removed', 2, 2),
+        ('reset',),
+    ]
+    assert model.data(999999, 2) == 2999999
+    assert model.header_data(0, 'horizontal') is None
+
+
+@raises(NotImplementedError)
+def test_item_model_abstract():
+    ItemModel().row_count()
+
+
+def test_list_item_model_diff():
+    a, b, c, d = object(), object(), object(), object()
+    model = ListItemModel(items=[a, b, c])
+    changes = record_changes(model)
+    model.items = [a, d, c]
+    model.items = [a, d, c, b]
+    model.items = [d, c, b]
+    model.items = [d, c, b]
+    assert changes == [
+        ('rows_removed', 1, 1),
+        ('rows_inserted', 1, 1),
+        ('rows_inserted', 3, 3),
+        ('rows_removed', 0, 0),
+    ]
+    assert model.row_count() == 3
+
+
+def test_list_item_model_data():
+    model = ListItemModel(items=[1, 2, 3])
+    changes = record_changes(model)
+    assert model.data(1, 0) == u'2'
+    model.to_string = lambda item: u'#%d' % item
+    assert model.data(1, 0) == u'#2'
+    assert changes == [('data', 0, 0, 2, 0)]
+
+
+SOURCE = """
+from enaml.widgets.api import Window, Container, TableView, ListView
+
+enamldef Main(Window):
+    attr model
+    alias table
+    alias lst
+    Container:
+        TableView: table:
+            model = parent.parent.model
+            show_grid = False
+        ListView: lst:
+            model = parent.parent.model
+            model_column = 2
+"""
+
+
+def test_item_views_null():
+    app = NullApplication()
+    try:
+        Main = compile_source(SOURCE, 'Main')
+        model = RangeModel()
+        view = Main(model=model)
+        view.show()
+        app.process_events()
+
+        table = view.table.proxy
+        assert table.state['model'] is model
+        assert table.state['show_grid'] is False
+        assert table.state['selection_mode'] == 'single'
+        assert view.lst.proxy.state['model_column'] == 2
+        other = ListItemModel()
+        view.table.model = other
+        assert table.state['model'] is other
+        assert view.table.hug_width == 'ignore'
+        view.close()
+        app.process_events()
+    finally:
+        app.destroy()
@@ -0,0 +1,69 @@
+#------------------------------------------------------------------------------
+# Copyright (c) 2013, Nucleic Development Team.
+#
+# Distributed under the terms of the Modified BSD License.
+#
+# The full license is in the file COPYING.txt, distributed with this software.
+#------------------------------------------------------------------------------
+from textwrap import dedent
+
+from enaml.core.enaml_compiler import EnamlCompiler
+from enaml.core.lazy_enamldef import (
+    LazyEnamlDef, lazy_enamldefs_enabled, set_lazy_enamldefs
+)
+from enaml.core.parser import parse
+
+
+SOURCE = dedent("""\
+from enaml.core.api import Declarative
+
+enamldef Base(Declarative):
+    attr value = 1
+
+enamldef Child(Base):
+    value = 2
+
+enamldef Holder(Declarative):
+    attr child: Child
+    Child:
+        value = 3
+
+""")
+
+
+def compile_lazy(source):
+    code = EnamlCompiler.compile(parse(source), '<test>')
+    namespace = {}
+    old = lazy_enamldefs_enabled()
+    set_lazy_enamldefs(True)
+    try:
+        exec code in namespace
+    finally:
+        set_lazy_enamldefs(old)
+    return namespace
+
+
+def test_lazy_placeholders():
+    namespace = compile_lazy(SOURCE)
+    for name in ('Base', 'Child', 'Holder'):
+        assert type(namespace[name]) is LazyEnamlDef
+
+
+def test_lazy_instantiation():
+    namespace = compile_lazy(SOURCE)
+    holder = namespace['Holder']()
+    assert type(namespace['Holder']) is not LazyEnamlDef
+    child = holder.children[0]
+    assert child.value == 3
+    assert isinstance(child, namespace['Child'])
+    assert isinstance(child, namespace['Base'])
+    assert type(namespace['Child']) is not LazyEnamlDef
+    assert namespace['Child']().value == 2
+
+
+def test_lazy_attribute_access():
+    namespace = compile_lazy(SOURCE)
+    lazy = namespace['Base']
+    assert lazy.__name__ == 'Base'
+    assert namespace['Base'] is lazy.resolve()
+    assert issubclass(namespace['Child'], lazy)
@@ -0,0 +1,147 @@
+#------------------------------------------------------------------------------
+# Copyright (c) 2013, Nucleic Development Team.
+#
+# Distributed under the terms of the Modified BSD License.
+#
+# The full license is in the file COPYING.txt, distributed with this software.
+#------------------------------------------------------------------------------
+from textwrap import dedent
+
+from utils import compile_source
+
+
+SOURCE = dedent("""\
+from enaml.core.api import Declarative, Looper
+
+enamldef Item(Declarative):
+    attr value
+    attr label
+    attr index
+
+enamldef Main(Declarative):
+    attr values
+    attr item_key
+    Looper: looper:
+        iterable << values
+        key << item_key
+        Item:
+            value = loop_item
+            label = '{0}:{1}'.format(loop_index, loop_item)
+            index << loop_index
+
+""")
+
+
+def make_main(values, key=None):
+    main = compile_source(SOURCE, 'Main')(values=values, item_key=key)
+    main.initialize()
+    return main
+
+
+def child_values(main):
+    return [child.value for child in main.children[:-1]]
+
+
+def test_looper_refresh():
+    main = make_main([1, 2, 3])
+    assert child_values(main) == [1, 2, 3]
+    main.values = [3, 4, 1]
+    assert child_values(main) == [3, 4, 1]
+    main.values = []
+    assert child_values(main) == []
+
+
+def test_looper_reuse():
+    main = make_main([1, 2, 3])
+    old = dict((child.value, child) for child in main.children[:-1])
+    main.values = [3, 2, 5]
+    children = main.children[:-1]
+    assert children[0] is old[3]
+    assert children[1] is old[2]
+    assert old[1].is_destroyed
+    assert not children[2].is_destroyed
+
+
+def test_looper_duplicates():
+    main = make_main([1, 1, 2])
+    assert child_values(main) == [1, 1, 2]
+    first, second = main.children[0:2]
+    main.values = [2, 1, 1, 1]
+    assert child_values(main) == [2, 1, 1, 1]
+    assert main.children[1] is first
+    assert main.children[2] is second
+
+
+def test_looper_key():
+    values = [{'id': 1}, {'id': 2}]
+    main = make_main(values, key=lambda item: item['id'])
+    old = main.children[:-1]
+    main.values = [{'id': 2}, {'id': 1}]
+    assert main.children[:-1] == old[::-1]
+
+
+def test_looper_unhashable():
+    a = [1]
+    b = [2]
+    main = make_main([a, b])
+    old = main.children[:-1]
+    main.values = [b, a, [1]]
+    children = main.children[:-1]
+    assert children[:2] == old[::-1]
+    assert children[2] not in old
+
+
+def child_labels(main):
+    return [child.label for child in main.children[:-1]]
+
+
+def test_looper_reuse_updates_scope():
+    main = make_main(['a', 'b'], key=lambda item: item)
+    old = main.children[:-1]
+    main.values = ['z', 'a', 'b']
+    assert main.children[1:3] == old
+    assert child_labels(main) == ['0:z', '1:a', '2:b']
+    assert [child.index for child in main.children[:-1]] == [0, 1, 2]
+
+
+def test_looper_key_updates_item():
+    main = make_main([{'id': 1, 'v': 'a'}], key=lambda item: item['id'])
+    old = main.children[0]
+    new_item = {'id': 1, 'v': 'A'}
+    main.values = [new_item]
+    assert main.children[0] is old
+    assert old.value is new_item
+    assert old.label == '0:%s' % (new_item,)
+
+
+NESTED_SOURCE = dedent("""\
+from enaml.core.api import Declarative, Looper, Conditional
+
+enamldef Item(Declarative):
+    attr value
+    attr index
+
+enamldef Main(Declarative):
+    attr values
+    Looper: looper:
+        iterable << values
+        Conditional:
+            condition = True
+            Conditional:
+                condition = True
+                Item:
+                    value << loop_item
+                    index << loop_index
+
+""")
+
+
+def test_looper_reuse_updates_nested_patterns():
+    main = compile_source(NESTED_SOURCE, 'Main')(values=[1, 2, 3])
+    main.initialize()
+    items = [child for child in main.children if hasattr(child, 'index')]
+    main.values = [0, 1, 2, 3]
+    children = [child for child in main.children if hasattr(child, 'index')]
+    assert children[1:] == items
+    assert [child.index for child in children] == [0, 1, 2, 3]
+    assert [child.value for child in children] == [0, 1, 2, 3]
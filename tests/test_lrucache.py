@@ -0,0 +1,83 @@
+#------------------------------------------------------------------------------
+# Copyright (c) 2013, Nucleic Development Team.
+#
+# Distributed under the terms of the Modified BSD License.
+#
+# The full license is in the file COPYING.txt, distributed with this software.
+#------------------------------------------------------------------------------
+import sys
+from threading import Thread
+
+from enaml.lrucache import LRUCache
+
+
+def test_lru_eviction():
+    cache = LRUCache(3)
+    for key in 'abc':
+        cache.set(key, key.upper())
+    assert cache.get('a') == 'A'
+    cache.set('d', 'D')
+    assert 'b' not in cache
+    assert len(cache) == 3
+    assert cache.get('b') is None
+    assert cache.get('c') == 'C'
+
+
+def test_lru_cost():
+    cache = LRUCache(10)
+    cache.set('a', 1, 4)
+    cache.set('b', 2, 4)
+    cache.set('c', 3, 4)
+    assert 'a' not in cache
+    assert cache.info()['cost'] == 8
+    cache.set('d', 4, 20)
+    assert 'd' not in cache
+    cache.max_cost = 4
+    assert len(cache) == 1
+    assert 'c' in cache
+
+
+def test_lru_stats():
+    cache = LRUCache(10)
+    cache.set('a', 1)
+    cache.get('a')
+    cache.get('a')
+    cache.get('b')
+    info = cache.info()
+    assert info['hits'] == 2
+    assert info['misses'] == 1
+    assert info['size'] == 1
+    assert cache.pop('a') == 1
+    assert cache.info()['cost'] == 0
+    cache.clear()
+    assert cache.info()['hits'] == 0
+
+
+def test_lru_threads():
+    cache = LRUCache(16)
+
+    def work(offset):
+        for i in xrange(2000):
+            key = (i + offset) % 40
+            if cache.get(key) is None:
+                cache.set(key, i)
+
+    interval = sys.getcheckinterval()
+    sys.setcheckinterval(1)
+    try:
+        threads = [Thread(target=work, args=(i,)) for i in xrange(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    finally:
+        sys.setcheckinterval(interval)
+    assert len(cache) == 16
+    assert cache.info()['cost'] == 16
+    keys = []
+    root = cache._root
+    link = root[1]
+    while link is not root:
+        keys.append(link[2])
+        link = link[1]
+    assert sorted(keys) == sorted(cache._map)
@@ -0,0 +1,70 @@
+#------------------------------------------------------------------------------
+# Copyright (c) 2013, Nucleic Development Team.
+#
+# Distributed under the terms of the Modified BSD License.
+#
+# The full license is in the file COPYING.txt, distributed with this software.
+#------------------------------------------------------------------------------
+from enaml.core.object import Object
+
+
+def make_tree():
+    root = Object(name=u'root')
+    a = Object(root, name=u'item')
+    b = Object(root, name=u'other')
+    c = Object(a, name=u'item')
+    d = Object(b, name=u'item_2')
+    return root, a, b, c, d
+
+
+def check_matches_traversal(root, obj):
+    for name in (u'item', u'other', u'item_2', u'root', u'missing'):
+        indexed = obj.find_all(name)
+        root.disable_name_index()
+        expected = obj.find_all(name)
+        assert obj.find(name) is (expected[0] if expected else None)
+        root.enable_name_index()
+        assert indexed == expected
+        assert obj.find(name) is (expected[0] if expected else None)
+    for pattern in (u'item.*', u'o', u'.*'):
+        indexed = obj.find_all(pattern, regex=True)
+        root.disable_name_index()
+        expected = obj.find_all(pattern, regex=True)
+        root.enable_name_index()
+        assert indexed == expected
+
+
+def test_name_index_find():
+    root, a, b, c, d = make_tree()
+    root.enable_name_index()
+    try:
+        assert root.find_all(u'item') == [a, c]
+        assert b.find(u'item') is None
+        assert root.find(u'item_\d', regex=True) is d
+        check_matches_traversal(root, root)
+        check_matches_traversal(root, a)
+    finally:
+        root.disable_name_index()
+
+
+def test_name_index_updates():
+    root, a, b, c, d = make_tree()
+    root.enable_name_index()
+    try:
+        c.name = u'renamed'
+        assert root.find_all(u'item') == [a]
+        assert root.find(u'renamed') is c
+        c.set_parent(b)
+        assert a.find(u'renamed') is None
+        assert b.find(u'renamed') is c
+        e = Object(name=u'item')
+        Object(e, name=u'nested')
+        root.insert_children(a, [e])
+        assert root.find_all(u'item') == [e, a]
+        assert root.find(u'nested').parent is e
+        b.destroy()
+        assert root.find(u'renamed') is None
+        assert root.find(u'item_2') is None
+        check_matches_traversal(root, root)
+    finally:
+        root.disable_name_index()
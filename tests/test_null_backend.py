@@ -0,0 +1,127 @@
+#------------------------------------------------------------------------------
+# Copyright (c) 2013, Nucleic Development Team.
+#
+# Distributed under the terms of the Modified BSD License.
+#
+# The full license is in the file COPYING.txt, distributed with this software.
+#------------------------------------------------------------------------------
+from enaml.null.null_application import NullApplication
+from enaml.null.null_constraints_widget import DEFAULT_SIZE_HINT
+
+from utils import compile_source
+
+
+SOURCE = """
+from enaml.layout.api import vbox
+from enaml.widgets.api import Window, Container, Field, PushButton
+
+enamldef Main(Window):
+    alias field
+    alias button
+    alias body
+    title = 'Null'
+    Container: body:
+        constraints = [vbox(field, button)]
+        Field: field:
+            text = 'hello'
+        PushButton: button:
+            text = 'Go'
+"""
+
+
+def test_null_window():
+    app = NullApplication()
+    try:
+        Main = compile_source(SOURCE, 'Main')
+        view = Main()
+        view.show()
+        app.process_events()
+
+        proxy = view.field.proxy
+        assert proxy.state['text'] == u'hello'
+        assert proxy.field_text() == u'hello'
+        view.field.text = u'world'
+        assert proxy.state['text'] == u'world'
+        assert view.button.proxy.state['text'] == u'Go'
+        assert view.proxy.state['title'] == u'Null'
+        assert view.proxy.state['visible']
+
+        width, height = view.size()
+        assert width >= DEFAULT_SIZE_HINT[0]
+        assert height >= 2 * DEFAULT_SIZE_HINT[1]
+        assert view.body.proxy.geometry == (0, 0, width, height)
+        fx, fy, fw, fh = view.field.proxy.geometry
+        bx, by, bw, bh = view.button.proxy.geometry
+        assert fh == bh == DEFAULT_SIZE_HINT[1]
+        assert by >= fy + fh
+
+        view.set_size((400, 300))
+        assert view.body.proxy.geometry == (0, 0, 400, 300)
+        assert view.field.proxy.geometry[2] > fw
+
+        view.close()
+        assert not view.visible
+        app.process_events()
+        assert not view.proxy_is_active
+    finally:
+        app.destroy()
+
+
+def test_null_event_loop():
+    app = NullApplication()
+    try:
+        calls = []
+        app.timed_call(20, calls.append, 'timed')
+        app.deferred_call(calls.append, 'deferred')
+        app.timed_call(5, calls.append, 'stop')
+        app.timed_call(10, app.stop)
+        assert app.has_pending_events()
+        app.start()
+        assert calls == ['deferred', 'stop']
+        assert app.has_pending_events()
+        app.start()
+        assert calls == ['deferred', 'stop', 'timed']
+        assert not app.has_pending_events()
+        assert app.is_main_thread()
+    finally:
+        app.destroy()
+
+
+def test_null_schedule():
+    app = NullApplication()
+    try:
+        calls = []
+        task = app.schedule(calls.append, ('scheduled',))
+        assert calls == []
+        app.process_events()
+        assert calls == ['scheduled']
+        assert not task.pending()
+    finally:
+        app.destroy()
+
+
+def test_null_incremental_relayout():
+    from enaml.widgets.api import Field
+    app = NullApplication()
+    try:
+        Main = compile_source(SOURCE, 'Main')
+        view = Main()
+        view.show()
+        app.process_events()
+
+        proxy = view.body.proxy
+        manager = proxy._layout_manager
+        field_cns = proxy._cns_table[view.field.proxy][0]
+        extra = Field(text=u'extra')
+        view.body.constraints = []
+        extra.set_parent(view.body)
+        app.process_events()
+
+        assert proxy._layout_manager is manager
+        assert proxy._cns_table[view.field.proxy][0] is field_cns
+        assert extra.proxy in proxy._cns_table
+        assert extra.proxy.geometry[2:] != (-1, -1)
+        view.close()
+        app.process_events()
+    finally:
+        app.destroy()
@@ -0,0 +1,28 @@
+#------------------------------------------------------------------------------
+# Copyright (c) 2013, Nucleic Development Team.
+#
+# Distributed under the terms of the Modified BSD License.
+#
+# The full license is in the file COPYING.txt, distributed with this software.
+#------------------------------------------------------------------------------
+from enaml.colors import parse_color
+from enaml.fonts import parse_font
+
+
+def test_parse_color_memo():
+    color = parse_color('rgba(10, 20, 30, 0.5)')
+    assert color is parse_color('rgba(10, 20, 30, 0.5)')
+    assert (color.red, color.green, color.blue, color.alpha) == \
+        (10, 20, 30, 127)
+    assert parse_color('#abc') is parse_color('#abc')
+    assert parse_color('rgb(1, 2)') is None
+    assert parse_color('rgb(1, 2)') is None
+
+
+def test_parse_font_memo():
+    font = parse_font('bold 12pt Arial')
+    assert font is parse_font('bold 12pt Arial')
+    assert font.family == 'Arial'
+    assert font.pointsize == 12
+    assert parse_font('12pt') is None
+    assert parse_font('12pt') is None
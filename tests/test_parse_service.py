@@ -0,0 +1,82 @@
+#------------------------------------------------------------------------------
+# Copyright (c) 2013, Nucleic Development Team.
+#
+# Distributed under the terms of the Modified BSD License.
+#
+# The full license is in the file COPYING.txt, distributed with this software.
+#------------------------------------------------------------------------------
+import os
+import shutil
+import tempfile
+from textwrap import dedent
+
+from nose.tools import raises
+
+from enaml.core.enaml_ast import EnamlDef, Module
+from enaml.core.parse_service import ParseService
+
+
+SOURCE = dedent("""\
+from enaml.widgets.api import Window
+
+enamldef Main(Window):
+    title = 'Main'
+
+""")
+
+
+def make_files(root, count):
+    paths = []
+    for i in xrange(count):
+        path = os.path.join(root, 'view_%d.enaml' % i)
+        with open(path, 'w') as f:
+            f.write(SOURCE.replace('Main', 'Main%d' % i))
+        paths.append(path)
+    return paths
+
+
+def test_parse_memory_cache():
+    service = ParseService()
+    first = service.parse(SOURCE)
+    second = service.parse(SOURCE)
+    assert isinstance(second, Module)
+    assert first is not second
+    assert isinstance(second.body[1], EnamlDef)
+    assert second.body[1].typename == 'Main'
+    info = service.info()
+    assert info['parsed'] == 1
+    assert info['memory']['hits'] == 1
+
+
+def test_parse_disk_cache():
+    root = tempfile.mkdtemp(prefix='enaml-test-')
+    try:
+        cache_dir = os.path.join(root, 'cache')
+        ParseService(cache_dir).parse(SOURCE)
+        assert len(os.listdir(cache_dir)) == 1
+        service = ParseService(cache_dir)
+        ast = service.parse(SOURCE)
+        assert ast.body[1].typename == 'Main'
+        assert service.info()['parsed'] == 0
+        assert service.info()['disk_hits'] == 1
+    finally:
+        shutil.rmtree(root)
+
+
+def test_parse_files_parallel():
+    root = tempfile.mkdtemp(prefix='enaml-test-')
+    try:
+        paths = make_files(root, 4)
+        service = ParseService()
+        service.parse_file(paths[0])
+        asts = service.parse_files(paths, jobs=2)
+        names = [ast.body[1].typename for ast in asts]
+        assert names == ['Main0', 'Main1', 'Main2', 'Main3']
+        assert service.info()['parsed'] == 4
+    finally:
+        shutil.rmtree(root)
+
+
+@raises(SyntaxError)
+def test_parse_error():
+    ParseService().parse('enamldef (:\n')
@@ -0,0 +1,99 @@
+#------------------------------------------------------------------------------
+# Copyright (c) 2013, Nucleic Development Team.
+#
+# Distributed under the terms of the Modified BSD License.
+#
+# The full license is in the file COPYING.txt, distributed with this software.
+#------------------------------------------------------------------------------
+import marshal
+from textwrap import dedent
+
+from atom.api import Atom, Int
+
+from enaml.core import operators
+from enaml.core.enaml_compiler import EnamlCompiler
+from enaml.core.operators import operator_context, op_subscribe
+from enaml.core.parser import parse
+
+
+SOURCE = dedent("""\
+from enaml.core.api import Declarative
+
+enamldef Main(Declarative):
+    attr model
+    attr simple = 1 + 1
+    attr changed = 0
+    attr subscribed << model.a * 2
+    attr updated = 0
+    updated >> model.b
+    attr delegated := model.c
+    simple ::
+        self.changed += 1
+""")
+
+
+class Model(Atom):
+    a = Int()
+    b = Int()
+    c = Int()
+
+
+def compile_module():
+    """ Compile the source and round trip the code through marshal.
+
+    """
+    code = EnamlCompiler.compile(parse(SOURCE), '<test>')
+    return marshal.loads(marshal.dumps(code))
+
+
+def load_main(code):
+    namespace = {}
+    exec code in namespace
+    return namespace['Main']
+
+
+class NoByteplay(object):
+
+    @classmethod
+    def from_code(cls, code):
+        raise AssertionError('bytecode was rewritten at import')
+
+
+def test_precompiled_operators():
+    code = compile_module()
+    old = operators.Code
+    operators.Code = NoByteplay
+    try:
+        Main = load_main(code)
+        model = Model(a=1, c=3)
+        main = Main(model=model)
+        assert main.simple == 2
+        assert main.subscribed == 2
+        model.a = 5
+        assert main.subscribed == 10
+        assert main.updated == 0
+        main.updated = 7
+        assert model.b == 7
+        assert main.delegated == 3
+        main.delegated = 4
+        assert model.c == 4
+        main.simple = 3
+        assert main.changed == 1
+    finally:
+        operators.Code = old
+
+
+def test_custom_operator_context():
+    code = compile_module()
+    calls = []
+
+    def op_custom(code, scope_key, f_globals):
+        calls.append(code)
+        return op_subscribe(code, scope_key, f_globals)
+
+    with operator_context({'<<': op_custom}, union=True):
+        Main = load_main(code)
+    assert len(calls) == 1
+    model = Model(a=2)
+    main = Main(model=model)
+    assert main.subscribed == 4
@@ -0,0 +1,49 @@
+#------------------------------------------------------------------------------
+# Copyright (c) 2013, Nucleic Development Team.
+#
+# Distributed under the terms of the Modified BSD License.
+#
+# The full license is in the file COPYING.txt, distributed with this software.
+#------------------------------------------------------------------------------
+import json
+from StringIO import StringIO
+from textwrap import dedent
+
+from enaml.core import profiling
+
+from utils import compile_source
+
+
+SOURCE = dedent("""\
+from enaml.core.api import Declarative
+
+enamldef Main(Declarative):
+    attr a = 1
+    attr b = 2
+    attr total << a + b
+
+""")
+
+
+def test_profiling():
+    Main = compile_source(SOURCE, 'Main')
+    profiling.enable()
+    try:
+        main = Main()
+        main.total
+        main.a = 5
+        items = profiling.report()
+        traced = [item for item in items if item['attribute'] == 'total']
+        assert len(traced) == 1
+        item = traced[0]
+        assert item['kind'] == 'traced read'
+        assert item['count'] == 2
+        assert item['trace_size_max'] == 2
+        assert item['lineno'] == 6
+        buf = StringIO()
+        profiling.dump_json(buf)
+        assert json.loads(buf.getvalue()) == json.loads(json.dumps(items))
+    finally:
+        profiling.disable()
+    assert not profiling.is_enabled()
+    assert profiling.report() == []
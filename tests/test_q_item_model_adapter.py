@@ -0,0 +1,52 @@
+#------------------------------------------------------------------------------
+# Copyright (c) 2013, Nucleic Development Team.
+#
+# Distributed under the terms of the Modified BSD License.
+#
+# The full license is in the file COPYING.txt, distributed with this software.
+#------------------------------------------------------------------------------
+from nose import SkipTest
+
+try:
+    from enaml.qt.QtCore import Qt
+    from enaml.qt.q_item_model_adapter import QItemModelAdapter
+except ImportError:
+    raise SkipTest('a Qt binding is required')
+
+from enaml.widgets.item_model import ListItemModel
+
+
+def make_adapter(items):
+    model = ListItemModel(items=items)
+    adapter = QItemModelAdapter()
+    adapter.set_item_model(model)
+    return model, adapter
+
+
+def test_rows_removed_data():
+    model, adapter = make_adapter(['a', 'b', 'c', 'd'])
+    seen = []
+
+    def about_to_remove(parent, first, last):
+        for row in xrange(adapter.rowCount()):
+            seen.append(adapter.data(adapter.index(row, 0)))
+
+    adapter.rowsAboutToBeRemoved.connect(about_to_remove)
+    model.items = ['a', 'd']
+    assert seen == [u'a', None, None, u'd']
+    assert adapter.rowCount() == 2
+    assert adapter.data(adapter.index(1, 0)) == u'd'
+
+
+def test_rows_removed_header():
+    model, adapter = make_adapter(['a', 'b', 'c'])
+    model.header = lambda section, orientation: unicode(section)
+    seen = []
+
+    def about_to_remove(parent, first, last):
+        for row in xrange(adapter.rowCount()):
+            seen.append(adapter.headerData(row, Qt.Vertical))
+
+    adapter.rowsAboutToBeRemoved.connect(about_to_remove)
+    model.items = ['a', 'c']
+    assert seen == [u'0', None, u'1']
@@ -0,0 +1,86 @@
+#------------------------------------------------------------------------------
+# Copyright (c) 2013, Nucleic Development Team.
+#
+# Distributed under the terms of the Modified BSD License.
+#
+# The full license is in the file COPYING.txt, distributed with this software.
+#------------------------------------------------------------------------------
+from nose import SkipTest
+
+try:
+    from enaml.qt.q_object_combo_model import QObjectComboModel
+except ImportError:
+    raise SkipTest('a Qt binding is required')
+
+
+def to_string(item):
+    return unicode(item)
+
+
+def to_icon(item):
+    return None
+
+
+def make_model(items):
+    model = QObjectComboModel()
+    model.set_items(items, to_string, to_icon)
+    changes = []
+    model.rowsRemoved.connect(
+        lambda parent, first, last: changes.append(('removed', first, last))
+    )
+    model.rowsInserted.connect(
+        lambda parent, first, last: changes.append(('inserted', first, last))
+    )
+    model.modelReset.connect(lambda: changes.append(('reset',)))
+    return model, changes
+
+
+def test_set_items_diff():
+    a, b, c, d, e = [object() for i in range(5)]
+    model, changes = make_model([a, b, c, d])
+    model.set_items([a, e, d], to_string, to_icon)
+    assert changes == [('removed', 1, 2), ('inserted', 1, 1)]
+    assert model.items() == [a, e, d]
+    del changes[:]
+    model.set_items([b, a, e, d], to_string, to_icon)
+    assert changes == [('inserted', 0, 0)]
+    del changes[:]
+    model.set_items([b, a, e, d, c], to_string, to_icon)
+    assert changes == [('inserted', 4, 4)]
+    assert model.items() == [b, a, e, d, c]
+    del changes[:]
+    model.set_items([c], to_string, to_icon)
+    assert changes == [('removed', 0, 3)]
+    del changes[:]
+    model.set_items([c], to_string, to_icon)
+    assert changes == []
+
+
+def test_set_items_reset():
+    a, b = object(), object()
+    model, changes = make_model([a, b])
+    model.set_items([a, b], lambda item: u'x', to_icon)
+    assert changes == [('reset',)]
+    assert model.rowCount() == 2
+
+
+def test_item_row_equality():
+    a, b = [1000], [1000]
+    model, changes = make_model([a, b, a])
+    assert model.item_row(a) == 0
+    assert model.item_row(b) == 0
+    assert model.item_row([1000]) == 0
+    assert model.item_row([1]) == -1
+    model.set_items([u'x', 1000, (1, 2)], to_string, to_icon)
+    assert model.item_row(int('1000')) == 1
+    assert model.item_row(u''.join([u'x'])) == 0
+    assert model.item_row(tuple([1, 2])) == 2
+    assert model.item_row([1000]) == -1
+
+
+def test_item_row_mixed():
+    model, changes = make_model([[1], 1, [2], 2, [1]])
+    assert model.item_row([1]) == 0
+    assert model.item_row(1) == 1
+    assert model.item_row([2]) == 2
+    assert model.item_row(2) == 3
@@ -15,3 +15,24 @@ def test_QFont_from_Font():
     # does not raise an exception.
     f = Font(family="bold")
     qf = QFont_from_Font(f)
+
+
+def test_shared_resource_cache():
+    from enaml.image import Image
+    from enaml.qt.q_resource_helpers import (
+        clear_resource_cache, get_cached_qimage, resource_cache_info
+    )
+    clear_resource_cache()
+    data = '\xff\x00\x00\xff' * 4
+    one = Image(format='argb32', raw_size=(2, 2), data=data)
+    two = Image(format='argb32', raw_size=(2, 2), data=data)
+    three = Image(format='argb32', raw_size=(2, 2), data=data, size=(4, 4))
+    qone = get_cached_qimage(one)
+    qtwo = get_cached_qimage(two)
+    qthree = get_cached_qimage(three)
+    assert qone.cacheKey() == qtwo.cacheKey()
+    assert qone.cacheKey() != qthree.cacheKey()
+    info = resource_cache_info()
+    assert info['hits'] == 1
+    assert info['misses'] == 2
+    assert info['size'] == 2
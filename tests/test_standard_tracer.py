@@ -0,0 +1,104 @@
+#------------------------------------------------------------------------------
+# Copyright (c) 2013, Nucleic Development Team.
+#
+# Distributed under the terms of the Modified BSD License.
+#
+# The full license is in the file COPYING.txt, distributed with this software.
+#------------------------------------------------------------------------------
+from textwrap import dedent
+
+from atom.api import Atom, Int
+
+from enaml.core.operators import tracer_code
+
+from utils import compile_source
+
+
+SOURCE = dedent("""\
+from enaml.core.api import Declarative
+
+enamldef Main(Declarative):
+    attr flag = True
+    attr a = 1
+    attr b = 2
+    attr out << a if flag else b
+
+""")
+
+
+def get_observer(main):
+    return main._d_storage.get('_[out|trace]')
+
+
+def test_observer_reused():
+    main = compile_source(SOURCE, 'Main')()
+    assert main.out == 1
+    observer = get_observer(main)
+    main.a = 3
+    assert main.out == 3
+    assert get_observer(main) is observer
+    assert observer.items == set([(main, 'flag'), (main, 'a')])
+
+
+def test_observer_dependencies_changed():
+    main = compile_source(SOURCE, 'Main')()
+    assert main.out == 1
+    observer = get_observer(main)
+    main.flag = False
+    assert main.out == 2
+    assert get_observer(main) is observer
+    assert observer.items == set([(main, 'flag'), (main, 'b')])
+    main.a = 5
+    assert main.out == 2
+    main.b = 6
+    assert main.out == 6
+
+
+SELECTIVE_SOURCE = dedent("""\
+from enaml.core.api import Declarative
+
+enamldef Main(Declarative):
+    attr model
+    attr text << '{} {}'.format(model.a, getattr(model, 'b'))
+    attr size << len([model.c, 1]) + sorted((2, 1))[0]
+
+""")
+
+
+class Model(Atom):
+    a = Int(1)
+    b = Int(2)
+    c = Int(3)
+
+
+def test_selective_tracing_dependencies():
+    model = Model()
+    main = compile_source(SELECTIVE_SOURCE, 'Main')(model=model)
+    assert main.text == u'1 2'
+    assert main.size == 3
+    observer = main._d_storage.get('_[text|trace]')
+    assert observer.items == set([(main, 'model'), (model, 'a'), (model, 'b')])
+    model.b = 5
+    assert main.text == u'1 5'
+    observer = main._d_storage.get('_[size|trace]')
+    assert observer.items == set([(main, 'model'), (model, 'c')])
+
+
+def test_selective_tracing_instrumentation():
+    def traced_names(source, selective):
+        code = compile(source, '<test>', 'eval')
+        return set(tracer_code(code, selective).co_names)
+
+    names = traced_names("'{}'.format(len(x))", True)
+    assert 'load_attr' not in names
+    assert 'call_function' not in names
+    assert 'return_value' in names
+    names = traced_names("'{}'.format(len(x))", False)
+    assert 'load_attr' in names
+    assert 'call_function' in names
+    names = traced_names("f(x, 'a') + x.y", True)
+    assert 'load_attr' in names
+    assert 'call_function' in names
+    names = traced_names("x[0] + sum(i for i in x)", True)
+    assert 'binary_subscr' not in names
+    assert 'get_iter' not in names
@@ -479,6 +479,7 @@ def _clear_cache():
     StyleCache._style_items.clear()
     StyleCache._queried_items.clear()
     StyleCache._toolkit_setters.clear()
+    StyleCache._toolkit_styles.clear()
 
 
 def _cache_items_empty():
@@ -505,6 +506,8 @@ def _cache_tk_empty():
     from enaml.styling import StyleCache
     if StyleCache._toolkit_setters:
         return False
+    if StyleCache._toolkit_styles:
+        return False
     return True
 
 
@@ -585,3 +588,99 @@ def test_cache_2():
     sheet.destroy()
     assert _cache_styles_empty()
     assert app.style_sheet is None
+
+
+def test_index_invalidation():
+    from enaml.application import Application
+    from enaml.styling import StyleCache, Style
+    source = dedent("""\
+    from enaml.widgets.api import Window, Container, PushButton
+    from enaml.styling import StyleSheet, Style, Setter
+
+    enamldef Sheet(StyleSheet):
+        Style:
+            object_name = 'other'
+            Setter:
+                field = 'background'
+                value = 'blue'
+
+    enamldef Main(Window):
+        alias sheet
+        alias button
+        Sheet: sheet:
+            pass
+        Container:
+            PushButton: button:
+                name = 'button'
+                style_class = 'big'
+
+    """)
+    _clear_cache()
+    app = Application.instance()
+    if app is not None:
+        app.style_sheet = None
+    main = compile_source(source, 'Main')()
+    sheet = main.sheet
+    assert len(sheet.match_styles(main.button)) == 0
+    sheet.styles()[0].object_name = u'other, button'
+    assert len(sheet.match_styles(main.button)) == 1
+    style = Style(style_class=u'big')
+    style.set_parent(sheet)
+    assert sheet.match_styles(main.button) == [style, sheet.styles()[0]]
+    style.set_parent(None)
+    assert len(sheet.match_styles(main.button)) == 1
+
+
+def test_toolkit_style_cache():
+    from enaml.styling import StyleCache, Setter
+    source = dedent("""\
+    from enaml.styling import Style, Setter
+
+    enamldef MyStyle(Style):
+        element = 'PushButton'
+        Setter:
+            field = 'background'
+            value = 'blue'
+
+    """)
+    _clear_cache()
+    calls = []
+    def translate(name, style):
+        calls.append(name)
+        values = [s.value for s in style.setters()]
+        return u'%s %s %s' % (name, style.pseudo_class, u' '.join(values))
+    style = compile_source(source, 'MyStyle')()
+    assert StyleCache.toolkit_style(style, u'a', translate) == u'a  blue'
+    assert StyleCache.toolkit_style(style, u'a', translate) == u'a  blue'
+    assert StyleCache.toolkit_style(style, u'b', translate) == u'b  blue'
+    assert len(calls) == 1
+    assert len(StyleCache._toolkit_styles[style]) == 1
+    style.setters()[0].value = u'red'
+    assert StyleCache.toolkit_style(style, u'a', translate) == u'a  red'
+    style.pseudo_class = u'hover'
+    assert StyleCache.toolkit_style(style, u'a', translate) == u'a hover red'
+    Setter(value=u'green').set_parent(style)
+    assert StyleCache.toolkit_style(style, u'a', translate) == \
+        u'a hover red green'
+    assert len(calls) == 4
+    style.destroy()
+    assert _cache_tk_empty()
+
+
+def test_toolkit_style_template():
+    from enaml.styling import StyleCache, Style
+    _clear_cache()
+    calls = []
+    def translate(name, style):
+        calls.append(name)
+        return u'#%s, #%s:hover { color: 50%%; }' % (name, name)
+    def translate_none(name, style):
+        calls.append(name)
+    style = Style()
+    for name in (u'obj-1', u'obj-2', u'obj-3'):
+        expected = u'#%s, #%s:hover { color: 50%%; }' % (name, name)
+        assert StyleCache.toolkit_style(style, name, translate) == expected
+        assert StyleCache.toolkit_style(style, name, translate_none) is None
+    assert len(calls) == 2
+    style.destroy()
+    assert _cache_tk_empty()
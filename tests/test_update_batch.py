@@ -0,0 +1,84 @@
+#------------------------------------------------------------------------------
+# Copyright (c) 2013, Nucleic Development Team.
+#
+# Distributed under the terms of the Modified BSD License.
+#
+# The full license is in the file COPYING.txt, distributed with this software.
+#------------------------------------------------------------------------------
+from textwrap import dedent
+from threading import Thread
+
+from enaml.core.update_batch import batch_updates
+
+from utils import compile_source
+
+
+SOURCE = dedent("""\
+from enaml.core.api import Declarative
+
+enamldef Main(Declarative):
+    attr a = 1
+    attr b = 2
+    attr total << a + b
+    attr scaled << a + total
+
+""")
+
+
+def make_main():
+    main = compile_source(SOURCE, 'Main')()
+    changes = []
+    def observer(change):
+        changes.append((change['name'], change['value']))
+    main.observe('total', observer)
+    main.observe('scaled', observer)
+    assert main.scaled == 4
+    del changes[:]
+    return main, changes
+
+
+def test_unbatched_updates():
+    main, changes = make_main()
+    main.a = 10
+    main.b = 20
+    assert main.total == 30
+    assert main.scaled == 40
+    assert len(changes) > 3
+
+
+def test_batched_updates():
+    main, changes = make_main()
+    with batch_updates():
+        main.a = 10
+        main.b = 20
+        assert main.total == 3
+    assert changes == [('total', 30), ('scaled', 40)]
+
+
+def test_nested_batches():
+    main, changes = make_main()
+    with batch_updates():
+        with batch_updates():
+            main.a = 10
+        assert changes == []
+        main.b = 20
+    assert changes == [('total', 30), ('scaled', 40)]
+
+
+def test_batches_per_thread():
+    main, changes = make_main()
+    other, other_changes = make_main()
+
+    def work():
+        other.a = 10
+        other.b = 20
+
+    with batch_updates():
+        main.a = 10
+        thread = Thread(target=work)
+        thread.start()
+        thread.join()
+        assert changes == []
+        assert other.scaled == 40
+        main.b = 20
+    assert changes == [('total', 30), ('scaled', 40)]